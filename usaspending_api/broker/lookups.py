@@ -17,8 +17,20 @@ EXTERNAL_DATA_TYPE = [
     LookupType(100, "es_transactions", "Load elasticsearch with transactions from USAspending"),
     LookupType(101, "es_awards", "Load elasticsearch with awards from USAspending"),
     LookupType(102, "es_deletes", "Award and Transaction deletions from elasticsearch"),
+    LookupType(103, "es_full_load", "Full (not incremental) load or deletes-only run of an elasticsearch index"),
     # Additional times to keep track of
     LookupType(120, "touch_last_period_awards", "Touch awards from last period, so they will be updated in ES"),
+    LookupType(130, "gtas", "GTAS SF133 balances from Broker"),
+    LookupType(131, "disaster_spending_rollup", "Disaster spending rollup of GTAS, File B, and File C totals"),
+    LookupType(132, "matviews", "Materialized views built by matview_runner"),
+    # Where the next incremental update of each award search table starts from (see matview_runner --incremental)
+    LookupType(140, "mv_contract_award_search", "Incremental update of mv_contract_award_search"),
+    LookupType(141, "mv_directpayment_award_search", "Incremental update of mv_directpayment_award_search"),
+    LookupType(142, "mv_grant_award_search", "Incremental update of mv_grant_award_search"),
+    LookupType(143, "mv_idv_award_search", "Incremental update of mv_idv_award_search"),
+    LookupType(144, "mv_loan_award_search", "Incremental update of mv_loan_award_search"),
+    LookupType(145, "mv_other_award_search", "Incremental update of mv_other_award_search"),
+    LookupType(146, "mv_pre2008_award_search", "Incremental update of mv_pre2008_award_search"),
 ]
 EXTERNAL_DATA_TYPE_DICT = {item.name: item.id for item in EXTERNAL_DATA_TYPE}
 EXTERNAL_DATA_TYPE_DICT_ID = {item.id: item.name for item in EXTERNAL_DATA_TYPE}
@@ -3,7 +3,7 @@ import psycopg2
 import re
 
 from datetime import datetime, timezone
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from typing import IO, List, AnyStr, Optional
 
 from usaspending_api.broker.helpers.last_load_date import get_last_load_date, update_last_load_date
@@ -13,6 +13,7 @@ from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
 from usaspending_api.common.retrieve_file_from_uri import RetrieveFileFromUri
 from usaspending_api.etl.award_helpers import update_awards, update_procurement_awards, prune_empty_awards
 from usaspending_api.etl.transaction_loaders.fpds_loader import load_fpds_transactions, failed_ids, delete_stale_fpds
+from usaspending_api.etl.transaction_loaders.parallel_fpds_loader import ParallelFPDSLoader
 from usaspending_api.transactions.transaction_delete_journal_helpers import retrieve_deleted_fpds_transactions
 
 logger = logging.getLogger("script")
@@ -26,6 +27,14 @@ class Command(BaseCommand):
     help = "Sync USAspending DB FPDS data using source transaction for new or modified records and S3 for deleted IDs"
 
     modified_award_ids = []
+    batched = False
+    parallel_loader = None
+
+    def load_ids(self, id_list: List[int]) -> None:
+        if self.parallel_loader:
+            self.parallel_loader.add(id_list)
+        else:
+            self.modified_award_ids.extend(load_fpds_transactions(id_list, self.batched))
 
     @staticmethod
     def get_cursor_for_date_query(connection, date, count=False):
@@ -65,7 +74,7 @@ class Command(BaseCommand):
                 if len(id_list) == 0:
                     break
                 logger.info("Loading batch (size: {}) from date query...".format(len(id_list)))
-                self.modified_award_ids.extend(load_fpds_transactions([row[0] for row in id_list]))
+                self.load_ids([row[0] for row in id_list])
                 records_processed = records_processed + len(id_list)
                 logger.info("{} out of {} processed".format(records_processed, total_records))
 
@@ -88,7 +97,7 @@ class Command(BaseCommand):
                 id_list = [int(re.search(r"\d+", x).group()) for x in next_batch]
                 total_count += len(id_list)
                 logger.info(f"Loading next batch (size: {len(id_list)}, ids {id_list[0]}-{id_list[-1]})...")
-                self.modified_award_ids.extend(load_fpds_transactions(id_list))
+                self.load_ids(id_list)
 
         logger.info(f"Total transaction IDs in file: {total_count}")
 
@@ -139,8 +148,26 @@ class Command(BaseCommand):
             action="store_true",
             help="Script will load or reload all FPDS records in source tables, from all time. This does NOT clear the USAspending database first",
         )
+        parser.add_argument(
+            "--batched",
+            action="store_true",
+            help="Write each chunk of transactions with set-based statements over temporary tables loaded with COPY"
+            " instead of one transaction at a time. Chunks that fail are retried one transaction at a time.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of processes loading transactions at the same time. Transactions are partitioned by award"
+            " between processes, so the transactions of an award are always loaded by the same process.",
+        )
 
     def handle(self, *args, **options):
+        self.batched = options["batched"]
+        if options["processes"] < 1:
+            raise CommandError("--processes must be a positive integer")
+        if options["processes"] > 1:
+            self.parallel_loader = ParallelFPDSLoader(options["processes"], CHUNK_SIZE, self.batched)
 
         # Record script execution start time to update the FPDS last updated date in DB as appropriate
         update_time = datetime.now(timezone.utc)
@@ -152,7 +179,7 @@ class Command(BaseCommand):
             self.load_fpds_incrementally(options["date"])
 
         elif options["ids"]:
-            self.modified_award_ids.extend(load_fpds_transactions(options["ids"]))
+            self.load_ids(options["ids"])
 
         elif options["file"]:
             self.load_fpds_from_file(options["file"])
@@ -163,6 +190,9 @@ class Command(BaseCommand):
                 raise ValueError("No last load date for FPDS stored in the database")
             self.load_fpds_incrementally(last_load)
 
+        if self.parallel_loader:
+            self.modified_award_ids.extend(self.parallel_loader.finish())
+
         self.update_award_records(awards=self.modified_award_ids, skip_cd_linkage=False)
 
         logger.info(f"Script took {datetime.now(timezone.utc) - update_time}")
@@ -1,10 +1,25 @@
 import hashlib
 import json
+import logging
 
+from collections import OrderedDict
+from django.conf import settings
+from django.db.models import Max
+from django.utils.timezone import now
 from rest_framework_extensions.key_constructor import bits
 from rest_framework_extensions.key_constructor.constructors import DefaultKeyConstructor
+from threading import Lock
+from time import monotonic
+from typing import Any, Optional
 
+from usaspending_api.broker.models import ExternalDataLoadDate
 from usaspending_api.common.helpers.dict_helpers import order_nested_object
+from usaspending_api.submissions.models import DABSSubmissionWindowSchedule, SubmissionAttributes
+
+logger = logging.getLogger("console")
+
+# (monotonic time of last check, data version); see get_api_data_version
+_api_data_version = (None, None)
 
 
 class PathKeyBit(bits.QueryParamsKeyBit):
@@ -41,6 +56,52 @@ class GetPostQueryParamsKeyBit(bits.QueryParamsKeyBit):
         return {"request": json.dumps(order_nested_object(params))}
 
 
+def get_api_data_version() -> str:
+    """
+    Returns a marker of the freshness of the data served by the API, which changes whenever any loader records a new
+    `last_load_date`, a submission is loaded or updated, or a submission period is revealed. To avoid querying for
+    it on every request, it is only re-checked every API_DATA_VERSION_CHECK_INTERVAL seconds by each process.
+    """
+    global _api_data_version
+    checked_at, version = _api_data_version
+    if checked_at is not None and monotonic() - checked_at < settings.API_DATA_VERSION_CHECK_INTERVAL:
+        return version
+
+    try:
+        # Every load date rather than the latest, since a load can record a date older than another load's
+        load_dates = ExternalDataLoadDate.objects.order_by("external_data_type_id").values_list(
+            "external_data_type_id", "last_load_date"
+        )
+        load_dates_marker = hashlib.md5(
+            ",".join(f"{data_type_id}:{load_date.isoformat()}" for data_type_id, load_date in load_dates).encode()
+        ).hexdigest()
+        markers = [
+            SubmissionAttributes.objects.aggregate(marker=Max("update_date"))["marker"],
+            DABSSubmissionWindowSchedule.objects.filter(submission_reveal_date__lte=now()).aggregate(
+                marker=Max("submission_reveal_date")
+            )["marker"],
+        ]
+    except Exception:
+        if version is None:
+            raise
+        logger.exception("Unable to check the API data version; continuing to use the previous version")
+        return version
+
+    version = "|".join([load_dates_marker] + [marker.isoformat() if marker else "" for marker in markers])
+    _api_data_version = (monotonic(), version)
+    return version
+
+
+class DataVersionKeyBit(bits.KeyBitBase):
+    """
+    Adds the API data version as a key bit, so cached responses are replaced when the data they were built from
+    changes, rather than needing to expire on a timeout
+    """
+
+    def get_data(self, params, view_instance, view_method, request, args, kwargs):
+        return get_api_data_version()
+
+
 class USAspendingKeyConstructor(DefaultKeyConstructor):
     """
     Handle cache key construction for API requests. If we never need to create more nuanced keys, see the
@@ -49,6 +110,7 @@ class USAspendingKeyConstructor(DefaultKeyConstructor):
 
     path_bit = PathKeyBit()
     request_params = GetPostQueryParamsKeyBit()
+    data_version = DataVersionKeyBit()
 
     def prepare_key(self, key_dict):
         # Order the key_dict using the order_nested_object function to make sure cache keys are always exactly the same
@@ -58,3 +120,54 @@ class USAspendingKeyConstructor(DefaultKeyConstructor):
 
 
 usaspending_key_func = USAspendingKeyConstructor()
+
+
+class LocalResponseCache:
+    """
+    Size-bounded, in-process LRU cache with a time-to-live per entry. Used as a tier in front of the shared cache
+    backend so that hot API responses are served without a network hop or unpickling. The caller provides the size
+    (in bytes) of each value, and least-recently-used entries are evicted once the total exceeds max_bytes
+    """
+
+    def __init__(self, max_bytes: int, timeout: int):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._entries = OrderedDict()  # key -> (expires_at, size, value), least recently used first
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, value = entry
+            if expires_at <= monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (monotonic() + self.timeout, size, value)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._total_bytes -= size
@@ -3,9 +3,14 @@ import logging
 
 from collections.abc import Iterable
 from django.conf import settings
+from django.core.cache.backends.dummy import DummyCache
 from django.db.models import QuerySet
+from django.http import HttpResponse
 from rest_framework_extensions.cache.decorators import CacheResponse
-from typing import Any
+from time import monotonic, sleep
+from typing import Any, List, Optional, Tuple
+from uuid import uuid4
+from usaspending_api.common.cache import LocalResponseCache
 from usaspending_api.common.experimental_api_flags import is_experimental_elasticsearch_api
 
 logger = logging.getLogger("console")
@@ -26,7 +31,52 @@ def contains_queryset(data: Any) -> bool:
         return False
 
 
+# Rendered response content, status code, and a list of (header, value) pairs
+CachedResponse = Tuple[bytes, int, List[Tuple[str, str]]]
+
+_local_response_cache = None
+
+
+def get_local_response_cache() -> LocalResponseCache:
+    """Return the process-wide, in-process tier of the response cache"""
+    global _local_response_cache
+    if _local_response_cache is None:
+        _local_response_cache = LocalResponseCache(
+            settings.LOCAL_RESPONSE_CACHE_MAX_BYTES, settings.LOCAL_RESPONSE_CACHE_TIMEOUT
+        )
+    return _local_response_cache
+
+
+def to_cached_response(response: HttpResponse) -> CachedResponse:
+    headers = [(header, value) for header, value in response.items() if header.lower() not in ("cache-trace", "key")]
+    return response.content, response.status_code, headers
+
+
+def from_cached_response(cached_response: CachedResponse) -> HttpResponse:
+    content, status, headers = cached_response
+    response = HttpResponse(content=content, status=status)
+    for header, value in headers:
+        response[header] = value
+    return response
+
+
+def cached_response_size(cached_response: CachedResponse) -> int:
+    content, _, headers = cached_response
+    return len(content) + sum(len(header) + len(value) for header, value in headers)
+
+
 class CustomCacheResponse(CacheResponse):
+    """
+    Caches the rendered content and headers of responses (not the pickled Response object) in two tiers: a
+    size-bounded LRU in the memory of each process, in front of the shared usaspending-cache backend
+    """
+
+    @property
+    def local_cache(self) -> Optional[LocalResponseCache]:
+        if isinstance(self.cache, DummyCache) or settings.LOCAL_RESPONSE_CACHE_MAX_BYTES <= 0:
+            return None
+        return get_local_response_cache()
+
     def process_cache_response(self, view_instance, view_method, request, args, kwargs):
         if is_experimental_elasticsearch_api(request):
             # bypass cache altogether
@@ -37,44 +87,43 @@ class CustomCacheResponse(CacheResponse):
         key = self.calculate_key(
             view_instance=view_instance, view_method=view_method, request=request, args=args, kwargs=kwargs
         )
-        response = None
-        try:
-            response = self.cache.get(key)
-        except Exception:
-            msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
-            logger.exception(msg.format(k=key, p=str(request.path)))
+        local_cache = self.local_cache
+        cached_response = local_cache.get(key) if local_cache else None
+        cache_trace = "hit-local-cache"
 
-        if not response:
-            response = view_method(view_instance, request, *args, **kwargs)
-            response = view_instance.finalize_response(request, response, *args, **kwargs)
+        if cached_response is None:
+            cache_trace = "hit-cache"
+            try:
+                cached_response = self.cache.get(key)
+            except Exception:
+                msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
+                logger.exception(msg.format(k=key, p=str(request.path)))
+            if not isinstance(cached_response, tuple):
+                cached_response = None  # Also ignores entries in the format of older releases (a pickled Response)
+            elif local_cache:
+                local_cache.set(key, cached_response, cached_response_size(cached_response))
 
-            # While returning a Queryset is functional most of the time, it isn't
-            # fully supported by Django Rest Framework. This check was inserted
-            # in local mode to catch if a Queryset is being returned by the view
-            # which could cause an exception when setting the cache
-            if settings.IS_LOCAL and response and not response.is_rendered:
-                if contains_queryset(response.data):
-                    raise RuntimeError(
-                        "Your view is returning a QuerySet. QuerySets are not"
-                        " really designed to be pickled and can cause caching"
-                        " issues. Please materialize the QuerySet using a List"
-                        " or some other more primitive data structure."
-                    )
+        lock_key, lock_token = None, None
+        if cached_response is None and not isinstance(self.cache, DummyCache):
+            # Single-flight: only the worker holding the lock computes the response, the others wait for it
+            lock_key, lock_token = self.acquire_single_flight_lock(key)
+            if lock_token is None:
+                cache_trace = "hit-coalesced-cache"
+                cached_response = self.wait_for_single_flight(key, lock_key)
+                if cached_response is not None and local_cache:
+                    local_cache.set(key, cached_response, cached_response_size(cached_response))
 
-            response["Cache-Trace"] = "no-cache"
-            response.render()  # should be rendered, before pickling while storing to cache
-
-            if not response.status_code >= 400 or self.cache_errors:
-                if self.cache_errors:
-                    logger.error(self.cache_errors)
-                try:
-                    self.cache.set(key, response, self.timeout)
-                    response["Cache-Trace"] = "set-cache"
-                except Exception:
-                    msg = "Problem while writing to cache: path:'{p}' data:'{d}'"
-                    logger.exception(msg.format(p=str(request.path), d=str(request.data)))
+        if cached_response is None:
+            try:
+                response = self.generate_and_cache_response(
+                    view_instance, view_method, request, args, kwargs, key, local_cache
+                )
+            finally:
+                if lock_token is not None:
+                    self.release_single_flight_lock(lock_key, lock_token)
         else:
-            response["Cache-Trace"] = "hit-cache"
+            response = from_cached_response(cached_response)
+            response["Cache-Trace"] = cache_trace
 
         if not hasattr(response, "_closable_objects"):
             response._closable_objects = []
@@ -82,5 +131,81 @@ class CustomCacheResponse(CacheResponse):
         response["key"] = key
         return response
 
+    def acquire_single_flight_lock(self, key: str) -> Tuple[str, Optional[str]]:
+        """Returns the lock key and, if the lock was acquired, the token identifying this worker as its holder"""
+        lock_key = f"{key}:single-flight"
+        lock_token = uuid4().hex
+        try:
+            if self.cache.add(lock_key, lock_token, settings.RESPONSE_CACHE_LOCK_TIMEOUT):
+                return lock_key, lock_token
+        except Exception:
+            logger.exception(f"Problem while acquiring cache lock [{lock_key}]")
+            return lock_key, lock_token  # Compute the response without coalescing rather than fail the request
+        return lock_key, None
+
+    def release_single_flight_lock(self, lock_key: str, lock_token: str) -> None:
+        try:
+            # Don't delete a lock that expired and was acquired by another worker
+            if self.cache.get(lock_key) == lock_token:
+                self.cache.delete(lock_key)
+        except Exception:
+            logger.exception(f"Problem while releasing cache lock [{lock_key}]")
+
+    def wait_for_single_flight(self, key: str, lock_key: str) -> Optional[CachedResponse]:
+        """
+        Polls the cache for the response computed by the lock holder. Gives up (returning None so this worker
+        computes the response itself) when the wait exceeds RESPONSE_CACHE_LOCK_WAIT or when the lock is released
+        without a response being cached, e.g. because the lock holder failed or its response was an error.
+        """
+        deadline = monotonic() + settings.RESPONSE_CACHE_LOCK_WAIT
+        while monotonic() < deadline:
+            sleep(settings.RESPONSE_CACHE_LOCK_POLL_INTERVAL)
+            try:
+                cached_response = self.cache.get(key)
+                if isinstance(cached_response, tuple):
+                    return cached_response
+                if self.cache.get(lock_key) is None:
+                    return None
+            except Exception:
+                logger.exception(f"Problem while waiting on cache lock [{lock_key}]")
+                return None
+        logger.warning(f"Timed out waiting on cache lock [{lock_key}]")
+        return None
+
+    def generate_and_cache_response(self, view_instance, view_method, request, args, kwargs, key, local_cache):
+        response = view_method(view_instance, request, *args, **kwargs)
+        response = view_instance.finalize_response(request, response, *args, **kwargs)
+
+        # While returning a Queryset is functional most of the time, it isn't
+        # fully supported by Django Rest Framework. This check was inserted
+        # in local mode to catch if a Queryset is being returned by the view
+        # which could cause an exception when setting the cache
+        if settings.IS_LOCAL and response and not response.is_rendered:
+            if contains_queryset(response.data):
+                raise RuntimeError(
+                    "Your view is returning a QuerySet. QuerySets are not"
+                    " really designed to be pickled and can cause caching"
+                    " issues. Please materialize the QuerySet using a List"
+                    " or some other more primitive data structure."
+                )
+
+        response["Cache-Trace"] = "no-cache"
+        response.render()  # should be rendered, before storing its content to cache
+
+        if not response.status_code >= 400 or self.cache_errors:
+            if self.cache_errors:
+                logger.error(self.cache_errors)
+            cached_response = to_cached_response(response)
+            if local_cache:
+                local_cache.set(key, cached_response, cached_response_size(cached_response))
+            try:
+                self.cache.set(key, cached_response, self.timeout)
+                response["Cache-Trace"] = "set-cache"
+            except Exception:
+                msg = "Problem while writing to cache: path:'{p}' data:'{d}'"
+                logger.exception(msg.format(p=str(request.path), d=str(request.data)))
+
+        return response
+
 
 cache_response = CustomCacheResponse
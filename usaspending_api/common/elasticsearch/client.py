@@ -2,11 +2,13 @@ from typing import Union, Optional
 
 import certifi
 import logging
+import os
 
 from django.conf import settings
 from elasticsearch import Elasticsearch
 from elasticsearch.connection import create_ssl_context
 from ssl import CERT_NONE
+from threading import Lock
 
 from elasticsearch_dsl.response import Response
 
@@ -14,21 +16,55 @@ logger = logging.getLogger("console")
 CLIENT = None
 ElasticsearchResponse = Optional[Union[dict, Response]]
 
+# Process-wide clients keyed by (process ID, default timeout); see get_shared_elasticsearch_client
+_SHARED_CLIENTS = {}
+_SHARED_CLIENTS_LOCK = Lock()
+
 
 def instantiate_elasticsearch_client() -> Elasticsearch:
-    es_kwargs = {"timeout": 300}
+    """Client for long-running operations (ETL, index management), which get a longer default timeout"""
+    return get_shared_elasticsearch_client(timeout=300)
 
-    if "https" in settings.ES_HOSTNAME:
-        es_kwargs.update({"use_ssl": True, "verify_certs": True, "ca_certs": certifi.where()})
 
-    return Elasticsearch(settings.ES_HOSTNAME, **es_kwargs)
+def create_es_client() -> Elasticsearch:
+    global CLIENT
+    CLIENT = get_shared_elasticsearch_client()
+    return CLIENT
 
 
-def create_es_client() -> Elasticsearch:
+def get_shared_elasticsearch_client(timeout: Optional[int] = None) -> Elasticsearch:
+    """
+    Return the process-wide Elasticsearch client using the given default request timeout, creating it on first use.
+
+    The client's connection pool keeps connections (and their TLS sessions) open between requests, so it should be
+    reused rather than re-created per search. Clients are tracked per process ID so that a forked process (gunicorn
+    workers, multiprocessing pools) never shares the sockets opened by its parent.
+    """
+    key = (os.getpid(), timeout or settings.ES_TIMEOUT)
+    client = _SHARED_CLIENTS.get(key)
+    if client is None:
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(key)
+            if client is None:
+                for stale_key in [k for k in _SHARED_CLIENTS if k[0] != key[0]]:
+                    del _SHARED_CLIENTS[stale_key]  # Inherited from a parent process; must not be used here
+                client = _create_elasticsearch_client(key[1])
+                _SHARED_CLIENTS[key] = client
+    return client
+
+
+def _create_elasticsearch_client(timeout: int) -> Elasticsearch:
     if settings.ES_HOSTNAME is None or settings.ES_HOSTNAME == "":
         logger.error("env var 'ES_HOSTNAME' needs to be set for Elasticsearch connection")
-    global CLIENT
-    es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT}
+    es_config = {
+        "hosts": [settings.ES_HOSTNAME],
+        "timeout": timeout,
+        "maxsize": settings.ES_CONNECTIONS_PER_NODE,
+    }
+    if settings.ES_SNIFF:
+        es_config.update(
+            {"sniff_on_start": True, "sniff_on_connection_fail": True, "sniffer_timeout": settings.ES_SNIFFER_TIMEOUT}
+        )
     try:
         # If the connection string is using SSL with localhost, disable verifying
         # the certificates to allow testing in a development environment
@@ -42,7 +78,10 @@ def create_es_client() -> Elasticsearch:
             ssl_context.check_hostname = False
             ssl_context.verify_mode = CERT_NONE
             es_config["ssl_context"] = ssl_context
+        elif "https" in settings.ES_HOSTNAME:
+            es_config.update({"use_ssl": True, "verify_certs": True, "ca_certs": certifi.where()})
 
-        CLIENT = Elasticsearch(**es_config)
+        return Elasticsearch(**es_config)
     except Exception as e:
         logger.error("Error creating the elasticsearch client: {}".format(e))
+        raise
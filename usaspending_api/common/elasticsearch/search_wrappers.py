@@ -1,57 +1,23 @@
 import logging
 
-from ssl import CERT_NONE
-from typing import Optional, Union, Callable
+from typing import Callable, List, Optional, Union
 
 from django.conf import settings
-from elasticsearch.connection import create_ssl_context
-from elasticsearch_dsl import Search
+from elasticsearch_dsl import MultiSearch, Search
 from elasticsearch_dsl.response import Response
-from elasticsearch import ConnectionError, Elasticsearch
+from elasticsearch import ConnectionError
 from elasticsearch import ConnectionTimeout
 from elasticsearch import NotFoundError
 from elasticsearch import TransportError
 
+from usaspending_api.common.elasticsearch.client import get_shared_elasticsearch_client
+
 logger = logging.getLogger("console")
 
 
-class _Search(Search):
+class _ErrorHandlingMixin:
     _index_name = None
 
-    def __init__(self, **kwargs) -> None:
-        client = self._create_es_client()
-        kwargs.update({"index": self._index_name, "using": client})
-        super().__init__(**kwargs)
-
-    @staticmethod
-    def _create_es_client() -> Elasticsearch:
-        if settings.ES_HOSTNAME is None or settings.ES_HOSTNAME == "":
-            logger.error("env var 'ES_HOSTNAME' needs to be set for Elasticsearch connection")
-        es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT}
-        try:
-            # If the connection string is using SSL with localhost, disable verifying
-            # the certificates to allow testing in a development environment
-            # Also allow host.docker.internal, when SSH-tunneling on localhost to a remote nonprod instance over HTTPS
-            if settings.ES_HOSTNAME.startswith(("https://localhost", "https://host.docker.internal")):
-                logger.warning("SSL cert verification is disabled. Safe only for local development")
-                import urllib3
-
-                urllib3.disable_warnings()
-                ssl_context = create_ssl_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = CERT_NONE
-                es_config["ssl_context"] = ssl_context
-
-            return Elasticsearch(**es_config)
-        except Exception as e:
-            logger.error("Error creating the elasticsearch client: {}".format(e))
-
-    def _execute(self, timeout: str):
-        return self.params(timeout=timeout).execute()
-
-    def _count(self, timeout: str):
-        return self.count()
-
     def _handle_retry(self, func: Callable, retries: int, timeout: str) -> Optional[Union[Response, int]]:
         if retries > 20:
             retries = 20
@@ -87,6 +53,18 @@ class _Search(Search):
             raise
         return result
 
+
+class _Search(_ErrorHandlingMixin, Search):
+    def __init__(self, **kwargs) -> None:
+        kwargs.update({"index": self._index_name, "using": get_shared_elasticsearch_client()})
+        super().__init__(**kwargs)
+
+    def _execute(self, timeout: str):
+        return self.params(timeout=timeout).execute()
+
+    def _count(self, timeout: str):
+        return self.count()
+
     def handle_execute(self, retries: int = 5, timeout: str = "90s") -> Response:
         return self._handle_errors(self._execute, retries, timeout)
 
@@ -94,6 +72,31 @@ class _Search(Search):
         return self._handle_errors(self._count, retries, None)
 
 
+class BatchedSearches(_ErrorHandlingMixin, MultiSearch):
+    """
+    Packs independent searches (e.g. the unique-term counts of two fields over the same filters) into a single
+    `_msearch` request, so they cost one round-trip to the cluster and are executed concurrently by it. A search that
+    depends on the result of another, e.g. an aggregation sized (or skipped) by a count, must be sent after it instead.
+
+        count_response, sub_count_response = BatchedSearches().add(count_search).add(sub_count_search).handle_execute()
+
+    Each search keeps its own index. Responses are returned in the order the searches were added.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        kwargs.update({"using": get_shared_elasticsearch_client()})
+        super().__init__(**kwargs)
+
+    def _execute(self, timeout: str):
+        # `_msearch` has no request-level timeout, so it is applied to the body of each search instead
+        batch = self._clone()
+        batch._searches = [search.extra(timeout=timeout) for search in self._searches]
+        return batch.execute()
+
+    def handle_execute(self, retries: int = 5, timeout: str = "90s") -> List[Response]:
+        return self._handle_errors(self._execute, retries, timeout)
+
+
 class TransactionSearch(_Search):
     _index_name = f"{settings.ES_TRANSACTIONS_QUERY_ALIAS_PREFIX}*"
 
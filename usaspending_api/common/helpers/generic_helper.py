@@ -95,7 +95,9 @@ def within_one_year(d1, d2):
     return days_diff <= 365
 
 
-EXTRACT_MATVIEW_SQL = re.compile(r"^.*?CREATE MATERIALIZED VIEW (.*?)_temp\b(.*?) (?:NO )?WITH DATA;.*?$", re.DOTALL)
+EXTRACT_MATVIEW_SQL = re.compile(
+    r"^.*?CREATE (?:MATERIALIZED VIEW|TABLE) (.*?)_temp\b(.*?) (?:NO )?WITH DATA;.*?$", re.DOTALL
+)
 REPLACE_VIEW_SQL = r"CREATE OR REPLACE VIEW \1\2;"
 
 
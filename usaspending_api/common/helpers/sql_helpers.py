@@ -1,12 +1,16 @@
+import io
 import os
 
 from collections import namedtuple, OrderedDict
 from django.conf import settings
 from django.db import connection, connections, router, DEFAULT_DB_ALIAS
 from psycopg2.sql import Composable, Identifier, SQL
+from typing import Any, Iterable, Sequence
 from usaspending_api.awards.models import Award
 from usaspending_api.common.exceptions import InvalidParameterException
 
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 def build_dsn_string(db_settings):
     """
@@ -320,3 +324,90 @@ def close_all_django_db_conns() -> None:
     """
 
     connections.close_all()
+
+
+class IterableTextIO(io.TextIOBase):
+    """
+    Read-only text file over an iterable of strings, to stream data into something that reads files (like COPY FROM
+    STDIN) without holding all of it in memory
+    """
+
+    def __init__(self, strings: Iterable[str]):
+        self._strings = iter(strings)
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size is None or size < 0 or length < size:
+            string = next(self._strings, None)
+            if string is None:
+                break
+            chunks.append(string)
+            length += len(string)
+        data = "".join(chunks)
+        if size is None or size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+    def readline(self, size: int = -1) -> str:
+        while "\n" not in self._buffer:
+            string = next(self._strings, None)
+            if string is None:
+                break
+            self._buffer += string
+        end = self._buffer.find("\n") + 1 or len(self._buffer)
+        if size is not None and 0 <= size < end:
+            end = size
+        line, self._buffer = self._buffer[:end], self._buffer[end:]
+        return line
+
+
+def format_copy_array_value(values: Sequence[Any]) -> str:
+    """Formats a list as a Postgres array literal, like '{"A","B",NULL}'"""
+    elements = (
+        "NULL" if value is None else '"{}"'.format(str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for value in values
+    )
+    return "{{{}}}".format(",".join(elements))
+
+
+def format_copy_text_value(value: Any) -> str:
+    """Formats a value for the text format of COPY, where NULL is \\N and lists are arrays"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (list, tuple)):
+        value = format_copy_array_value(value)
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def format_copy_text_row(values: Sequence[Any]) -> str:
+    """Formats values as a line of the text format of COPY"""
+    return "\t".join(format_copy_text_value(value) for value in values) + "\n"
+
+
+def copy_rows_from_iterable(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Streams rows (sequences of values in the order of columns) into table with COPY FROM STDIN, which is much faster
+    than INSERTs and doesn't need them in memory. Returns the number of rows copied.
+    """
+    row_count = 0
+
+    def counted_lines():
+        nonlocal row_count
+        for row in rows:
+            row_count += 1
+            yield format_copy_text_row(row)
+
+    copy_sql = SQL("COPY {} ({}) FROM STDIN").format(
+        Identifier(*table.split(".")), SQL(", ").join(Identifier(column) for column in columns)
+    )
+    cursor.copy_expert(
+        convert_composable_query_to_string(copy_sql, cursor=cursor), IterableTextIO(counted_lines()), COPY_BUFFER_SIZE
+    )
+    return row_count
@@ -1,14 +1,21 @@
-import asyncio
+import json
 import logging
 import psycopg2
 import subprocess
 
+from datetime import datetime, timezone
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from pathlib import Path
 
-from usaspending_api.common.data_connectors.async_sql_query import async_run_creates
+from usaspending_api.broker.helpers.last_load_date import get_last_load_date, update_last_load_date
 from usaspending_api.common.helpers.timing_helpers import ConsoleTimer as Timer
+from usaspending_api.common.matview_scheduler import (
+    find_dependencies,
+    MatviewBuild,
+    MatviewScheduler,
+    read_json_dependency_sql,
+)
 from usaspending_api.common.matview_manager import (
     CHUNKED_MATERIALIZED_VIEWS,
     DEFAULT_MATIVEW_DIR,
@@ -45,6 +52,8 @@ class Command(BaseCommand):
         self.chunk_count = args["chunk_count"]
         self.include_chunked_matviews = args["include_chunked_matviews"]
         self.index_concurrency = args["index_concurrency"]
+        self.concurrency = args["concurrency"]
+        self.incremental = args["incremental"]
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -86,6 +95,18 @@ class Command(BaseCommand):
             help="Chunked Transaction Search matviews will be refreshed and inserted into table",
         )
         parser.add_argument("--index-concurrency", default=20, help="Number of indexes to be created at once", type=int)
+        parser.add_argument(
+            "--concurrency",
+            default=4,
+            help="Maximum number of materialized views (or chunks of chunked materialized views) built at once",
+            type=int,
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Update the tables of matviews with an 'incremental' JSON definition with the rows of changed awards"
+            " instead of rebuilding them. Matviews that aren't tables yet are still rebuilt",
+        )
 
     def handle(self, *args, **options):
         """Overloaded Command Entrypoint"""
@@ -131,31 +152,64 @@ class Command(BaseCommand):
         recursive_delete(self.matview_dir)
         recursive_delete(self.matview_chunked_dir)
 
-    def create_views(self):
-        loop = asyncio.new_event_loop()
-        tasks = []
-
-        # Create Matviews
+    def get_builds(self):
+        """
+        Matviews, chunks of chunked matviews, and the overlay views on top of them, each depending on the other builds
+        it selects from per its JSON definition (or SQL for the overlay views)
+        """
+        builds_and_dependency_sql = []
         for matview, config in self.matviews.items():
-            logger.info(f"Creating Future for matview {matview}")
-            sql = (self.matview_dir / config["sql_filename"]).read_text()
-            tasks.append(asyncio.ensure_future(async_run_creates(sql, wrapper=Timer(matview)), loop=loop))
+            sql = (self.matview_dir / self.get_sql_filename(matview, config)).read_text()
+            builds_and_dependency_sql.append(
+                (MatviewBuild(matview, sql), read_json_dependency_sql(config["json_filepath"]))
+            )
 
-        # Create Chunked Matviews
         if self.include_chunked_matviews:
             for matview, config in self.chunked_matviews.items():
+                dependency_sql = read_json_dependency_sql(config["json_filepath"])
                 for current_chunk in range(self.chunk_count):
                     chunked_matview = f"{matview}_{current_chunk}"
-                    logger.info(f"Creating Future for chunked matview {chunked_matview}")
                     sql = (self.matview_chunked_dir / f"{chunked_matview}.sql").read_text()
-                    tasks.append(
-                        asyncio.ensure_future(async_run_creates(sql, wrapper=Timer(chunked_matview)), loop=loop)
-                    )
+                    builds_and_dependency_sql.append((MatviewBuild(chunked_matview, sql), dependency_sql))
+
+        for view in OVERLAY_VIEWS:
+            sql = view.read_text()
+            builds_and_dependency_sql.append((MatviewBuild(view.stem, sql), sql))
+
+        build_names = [build.name for build, _ in builds_and_dependency_sql]
+        for build, dependency_sql in builds_and_dependency_sql:
+            build.dependencies = find_dependencies(dependency_sql, build_names) - {build.name}
+        return [build for build, _ in builds_and_dependency_sql]
 
-        if len(tasks) > 0:
-            loop.run_until_complete(asyncio.gather(*tasks))
+    def get_sql_filename(self, matview, config):
+        """The incremental update SQL of the matview when requested and possible, else its full build SQL"""
+        if not self.incremental:
+            return config["sql_filename"]
+        sql_json = read_sql_json(config)
+        if "incremental" not in sql_json:
+            return config["sql_filename"]
+
+        table_name = f"{sql_json.get('schema_name', 'public')}.{sql_json['final_name']}"
+        if get_relation_kind(table_name) != "r":
+            logger.info(f"{table_name} isn't a table yet, it will be rebuilt instead of updated incrementally")
+            return config["sql_filename"]
+        if get_last_load_date(matview) is None:
+            logger.info(f"{table_name} has no recorded load date, it will be rebuilt instead of updated incrementally")
+            return config["sql_filename"]
+        return Path("componentized") / f"{matview}__incremental.sql"
+
+    def create_views(self):
+        incremental_matviews = [
+            matview for matview, config in self.matviews.items() if "incremental" in read_sql_json(config)
+        ]
+        # Taken before any build starts, so it's a safe lower bound for the next incremental update of every table
+        incremental_load_start = get_incremental_load_start()
 
-        loop.close()
+        MatviewScheduler(self.get_builds(), self.concurrency).run()
+
+        for matview in incremental_matviews:
+            logger.info(f"Storing datetime {incremental_load_start} for the next incremental update of {matview}")
+            update_last_load_date(matview, incremental_load_start)
 
         if "transaction_search" in self.chunked_matviews and self.include_chunked_matviews:
             logger.info("Inserting data from transaction_search chunks into transaction_search table.")
@@ -166,17 +220,44 @@ class Command(BaseCommand):
                 matview_dir=self.matview_chunked_dir,
             )
 
-        for view in OVERLAY_VIEWS:
-            run_sql(view.read_text(), "Creating Views")
-
         if self.remove_matviews:
             run_sql(DROP_OLD_MATVIEWS.read_text(), "Drop Old Materialized Views")
 
+        # Changes the API data version, so responses cached from the previous matviews aren't served anymore
+        update_last_load_date("matviews", datetime.now(timezone.utc))
+
 
 def create_dependencies():
     run_sql(DEPENDENCY_FILEPATH.read_text(), "dependencies")
 
 
+def read_sql_json(config):
+    with open(config["json_filepath"]) as f:
+        return json.load(f)
+
+
+def get_incremental_load_start():
+    """
+    The start of the oldest transaction still running. Loaders set update_date to now(), the start of their
+    transaction, so awards they commit after this point have an update_date at or after it, even if their transaction
+    started before the builds. Transactions of other database users are only seen by superusers or pg_read_all_stats.
+    """
+    with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
+        with connection.cursor() as cursor:
+            # Never NULL, since this query runs in a transaction too
+            cursor.execute("SELECT MIN(xact_start) FROM pg_stat_activity")
+            return cursor.fetchone()[0]
+
+
+def get_relation_kind(name):
+    """Returns the pg_class.relkind of the relation ('r' for tables, 'm' for matviews) or None if it doesn't exist"""
+    with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [name])
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+
 def run_sql(sql, name):
     with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
         with connection.cursor() as cursor:
@@ -0,0 +1,97 @@
+import json
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger("script")
+
+
+class Command(BaseCommand):
+    help = """
+    Replays a set of API requests to pre-populate the usaspending-cache after a data load, and reports the time
+    taken by each request. Since response cache keys include the API data version, requests replayed after a load
+    are cache misses that compute and cache fresh responses.
+
+    The payload file is a JSON list of requests in the format of data/testing_data/endpoint_testing_data.json:
+        [{"url": "/api/v2/search/spending_over_time/", "method": "POST", "request_object": {...}}, ...]
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("payload_file", help="Path of the JSON file listing the requests to replay")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Maximum number of requests computed at the same time. Keep this low enough to not overload"
+            " Elasticsearch or the database while they are serving live traffic",
+        )
+        parser.add_argument(
+            "--fail-on-error",
+            action="store_true",
+            help="Exit with an error when any request doesn't return a 2xx status code",
+        )
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be a positive integer")
+        payloads = self.read_payloads(options["payload_file"])
+
+        logger.info(f"Replaying {len(payloads):,} requests with a concurrency of {options['concurrency']}")
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            results = list(executor.map(replay_request, payloads))
+        elapsed = perf_counter() - start
+
+        failures = 0
+        for payload, (status_code, cache_trace, duration) in zip(payloads, results):
+            if status_code is None or not 200 <= status_code < 300:
+                failures += 1
+            logger.info(
+                f"{duration:8.3f}s  {status_code or 'ERROR'}  {cache_trace or '-':<19}  {payload.get('method', 'POST')}"
+                f" {payload['url']}  {json.dumps(payload.get('request_object'), sort_keys=True)}"
+            )
+        durations = sorted(duration for _, _, duration in results)
+        logger.info(
+            f"Replayed {len(results):,} requests in {elapsed:.3f}s (median {durations[len(durations) // 2]:.3f}s,"
+            f" max {durations[-1]:.3f}s) with {failures:,} failures"
+        )
+
+        if failures and options["fail_on_error"]:
+            raise CommandError(f"{failures:,} requests failed")
+
+    @staticmethod
+    def read_payloads(payload_file: str) -> List[dict]:
+        with open(payload_file) as f:
+            payloads = json.load(f)
+        if not isinstance(payloads, list) or not payloads:
+            raise CommandError(f"{payload_file} must contain a non-empty JSON list of requests")
+        for payload in payloads:
+            if not payload.get("url"):
+                raise CommandError(f"Request without a url in {payload_file}: {payload}")
+            if payload.get("method", "POST") not in ("GET", "POST"):
+                raise CommandError(f"Unsupported method in {payload_file}: {payload}")
+        return payloads
+
+
+def replay_request(payload: dict) -> Tuple[Optional[int], Optional[str], float]:
+    """Returns the status code, Cache-Trace header, and duration in seconds of the request described by payload"""
+    start = perf_counter()
+    try:
+        client = Client()
+        if payload.get("method", "POST") == "GET":
+            response = client.get(payload["url"], data=payload.get("request_object"))
+        else:
+            response = client.post(
+                payload["url"], data=json.dumps(payload.get("request_object") or {}), content_type="application/json"
+            )
+        return response.status_code, response.get("Cache-Trace"), perf_counter() - start
+    except Exception:
+        logger.exception(f"Problem while replaying {payload['url']}")
+        return None, None, perf_counter() - start
+    finally:
+        connections.close_all()  # Database connections are per thread; don't leave them open
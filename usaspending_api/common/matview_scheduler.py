@@ -0,0 +1,138 @@
+import asyncio
+import asyncpg
+import json
+import logging
+import psycopg2
+import re
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from usaspending_api.common.data_connectors.async_sql_query import async_run_creates
+from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
+from usaspending_api.common.helpers.timing_helpers import ConsoleTimer as Timer
+
+logger = logging.getLogger("script")
+
+
+@dataclass
+class MatviewBuild:
+    """A materialized view (or view) to build, with the names of the builds it must wait for"""
+
+    name: str
+    sql: str
+    dependencies: Set[str] = field(default_factory=set)
+    size: int = 0  # Size in bytes of the relation from the previous build, used to start the largest builds first
+    duration: Optional[float] = None
+    row_count: Optional[int] = None
+
+
+def read_json_dependency_sql(json_filepath: str) -> str:
+    """Returns the SELECT of a matview JSON definition (from database_scripts/matview_generator)"""
+    with open(json_filepath) as f:
+        return "\n".join(json.load(f)["matview_sql"])
+
+
+def find_dependencies(sql: str, names: Iterable[str]) -> Set[str]:
+    """Returns which of the names are referenced by the SQL"""
+    return {name for name in names if re.search(rf"\b{re.escape(name)}\b", sql)}
+
+
+def check_dependencies(builds: List[MatviewBuild]) -> None:
+    """Raises a ValueError if a build depends on an unknown build or if dependencies are circular"""
+    names = {build.name for build in builds}
+    for build in builds:
+        unknown = build.dependencies - names
+        if unknown:
+            raise ValueError(f"{build.name} depends on unknown builds: {', '.join(sorted(unknown))}")
+
+    remaining = {build.name: build.dependencies for build in builds}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if not dependencies & remaining.keys()]
+        if not ready:
+            raise ValueError(f"Circular dependencies between {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+
+
+def get_relation_sizes(names: Iterable[str]) -> Dict[str, int]:
+    """Returns the total size in bytes of each existing relation"""
+    with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, pg_total_relation_size(oid) FROM pg_class WHERE relname = ANY(%s)", [list(names)]
+            )
+            return dict(cursor.fetchall())
+
+
+class MatviewScheduler:
+    """
+    Runs the SQL of each build once all of its dependencies are built, with at most `concurrency` builds running at
+    the same time. Among the builds ready to run, the largest (by the size of their previous build) start first so
+    the longest builds don't end up running alone at the end. If any build fails, the running builds are cancelled
+    and the error is raised.
+    """
+
+    def __init__(self, builds: List[MatviewBuild], concurrency: int):
+        check_dependencies(builds)
+        self.builds = builds
+        self.concurrency = concurrency
+
+    def run(self) -> None:
+        sizes = get_relation_sizes(build.name for build in self.builds)
+        for build in self.builds:
+            build.size = sizes.get(build.name, 0)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.run_builds())
+        finally:
+            loop.close()
+        self.log_metrics()
+
+    async def run_builds(self) -> None:
+        pending = {build.name: build for build in self.builds}
+        built = set()
+        running = {}  # future -> build
+
+        while pending or running:
+            ready = [build for build in pending.values() if build.dependencies <= built]
+            ready.sort(key=lambda build: build.size, reverse=True)
+            for build in ready[: self.concurrency - len(running)]:
+                logger.info(f"Starting build of {build.name} ({len(running) + 1} running)")
+                del pending[build.name]
+                running[asyncio.ensure_future(self.run_build(build))] = build
+
+            finished, _ = await asyncio.wait(set(running), return_when=asyncio.FIRST_COMPLETED)
+            for future in finished:
+                build = running.pop(future)
+                if future.exception() is not None:
+                    for other_future in running:
+                        other_future.cancel()
+                    await asyncio.gather(*running, return_exceptions=True)
+                    raise future.exception()
+                built.add(build.name)
+
+    @staticmethod
+    async def run_build(build: MatviewBuild) -> None:
+        start = perf_counter()
+        await async_run_creates(build.sql, wrapper=Timer(build.name))
+        build.duration = perf_counter() - start
+
+        connection = await asyncpg.connect(dsn=get_database_dsn_string())
+        try:
+            # Matview builds end with an ANALYZE, so the estimate is accurate without counting the rows
+            build.row_count = await connection.fetchval(
+                "SELECT reltuples::BIGINT FROM pg_class WHERE relname = $1 AND relkind IN ('m', 'r')", build.name
+            )
+        finally:
+            await connection.close()
+
+    def log_metrics(self) -> None:
+        for build in sorted(self.builds, key=lambda build: build.duration or 0, reverse=True):
+            row_count = "-" if build.row_count is None else f"{build.row_count:,}"
+            logger.info(
+                f"{build.name:<40} {build.duration or 0:10.2f}s {row_count:>15} rows"
+                f" (previous size {build.size / 1024 ** 3:.2f} GiB)"
+            )
@@ -0,0 +1,37 @@
+import json
+
+from django.http import HttpRequest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from typing import Union
+
+# Attribute of the Django HttpRequest holding its parsed JSON body; see get_request_payload
+PAYLOAD_ATTRIBUTE = "_usaspending_payload"
+
+
+def get_request_payload(request: Union[HttpRequest, Request]) -> dict:
+    """
+    Returns the JSON body of the request (an empty dict when there is none), parsing it only once per request. Both
+    Django requests, e.g. in views routing to other views, and DRF requests, through SharedPayloadJSONParser and so
+    `request.data`, share the parsed payload.
+    """
+    http_request = request._request if isinstance(request, Request) else request
+    payload = getattr(http_request, PAYLOAD_ATTRIBUTE, None)
+    if payload is None:
+        try:
+            payload = json.loads(http_request.body) if http_request.body else {}
+        except ValueError as e:
+            raise ParseError(f"JSON parse error - {e}")
+        setattr(http_request, PAYLOAD_ATTRIBUTE, payload)
+    return payload
+
+
+class SharedPayloadJSONParser(JSONParser):
+    """JSONParser returning the payload already parsed for this request by get_request_payload, if any"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = (parser_context or {}).get("request")
+        if request is None:
+            return super().parse(stream, media_type, parser_context)
+        return get_request_payload(request)
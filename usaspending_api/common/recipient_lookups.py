@@ -4,6 +4,10 @@ from psycopg2.sql import Identifier, Literal, SQL
 from usaspending_api.common.helpers.sql_helpers import convert_composable_query_to_string
 from usaspending_api.recipient.models import RecipientLookup, RecipientProfile
 from usaspending_api.recipient.v2.lookups import SPECIAL_CASES
+from typing import Dict, Iterable, Optional
+
+# When a hash or DUNS has profiles at several levels, prefer the child level, then the recipient level
+RECIPIENT_LEVEL_PREFERENCE = {"C": 0, "R": 1}
 
 
 def obtain_recipient_uri(
@@ -98,6 +102,38 @@ def combine_recipient_hash_and_level(recipient_hash, recipient_level):
     return f"{recipient_hash}-{recipient_level.upper()}"
 
 
+def bulk_obtain_recipient_ids(field_name: str, values: Iterable) -> Dict[str, Optional[str]]:
+    """
+    Resolve many recipient hashes or DUNS (recipient_unique_id) to recipient ids (recipient hash + recipient level)
+    with a single recipient_profile query.  In the recipient_profile table there is a 1 to 1 relationship between
+    hashes and DUNS, so when several levels exist for one the child level is preferred, then the recipient level.
+
+    Returns a dictionary keyed by the string of each of the values; values without a profile map to None.
+    """
+    if field_name not in ("recipient_hash", "recipient_unique_id"):
+        raise ValueError(f"Unable to resolve recipient ids by '{field_name}'")
+
+    keys = {str(value) for value in values if value is not None}
+    recipient_ids = dict.fromkeys(keys)
+    if not keys:
+        return recipient_ids
+
+    profiles = (
+        RecipientProfile.objects.filter(**{f"{field_name}__in": keys})
+        .exclude(recipient_name__in=SPECIAL_CASES)
+        .values(field_name, "recipient_hash", "recipient_level")
+    )
+    preferences = {}
+    for profile in profiles:
+        key = str(profile[field_name])
+        preference = RECIPIENT_LEVEL_PREFERENCE.get(profile["recipient_level"], len(RECIPIENT_LEVEL_PREFERENCE))
+        if preference < preferences.get(key, len(RECIPIENT_LEVEL_PREFERENCE) + 1):
+            preferences[key] = preference
+            recipient_ids[key] = combine_recipient_hash_and_level(profile["recipient_hash"], profile["recipient_level"])
+
+    return recipient_ids
+
+
 def _annotate_recipient_id(field_name, queryset, annotation_sql):
     """
     Add recipient id (recipient hash + recipient level) to a queryset.  The assumption here is that
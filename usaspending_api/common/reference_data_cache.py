@@ -0,0 +1,60 @@
+import functools
+
+from django.conf import settings
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, List, Optional
+
+from usaspending_api.common.cache import get_api_data_version
+
+# Every reference data cache created, so they can all be cleared at once; see clear_reference_data_caches
+_reference_data_caches: List["ReferenceDataCache"] = []
+
+
+class ReferenceDataCache:
+    """
+    Process-wide cache of the results of a reference data lookup (e.g. the closed submission periods or the DEF
+    Codes) for each set of arguments it's called with. Results are recomputed after `timeout` seconds or as soon as
+    the API data version changes (a load finished or a submission period was revealed), whichever comes first.
+
+    Use the reference_data_cache decorator rather than creating these directly. Cached results are shared by every
+    caller, so lookups should return immutable values (tuples rather than lists or querysets).
+    """
+
+    def __init__(self, function: Callable, timeout: Optional[int] = None):
+        self.function = function
+        self.timeout = timeout
+        self._entries = {}  # args -> (expires_at, data version, value)
+        self._lock = Lock()
+        functools.update_wrapper(self, function)
+        _reference_data_caches.append(self)
+
+    def __call__(self, *args) -> Any:
+        version = get_api_data_version()
+        with self._lock:
+            entry = self._entries.get(args)
+        if entry is not None:
+            expires_at, entry_version, value = entry
+            if expires_at > monotonic() and entry_version == version:
+                return value
+
+        value = self.function(*args)
+        timeout = settings.REFERENCE_DATA_CACHE_TIMEOUT if self.timeout is None else self.timeout
+        with self._lock:
+            self._entries[args] = (monotonic() + timeout, version, value)
+        return value
+
+    def cache_clear(self) -> None:
+        """Invalidate all cached results, e.g. after reference data was changed by this process"""
+        with self._lock:
+            self._entries.clear()
+
+
+def reference_data_cache(timeout: Optional[int] = None) -> Callable[[Callable], ReferenceDataCache]:
+    """Decorator caching a reference data lookup; timeout defaults to settings.REFERENCE_DATA_CACHE_TIMEOUT"""
+    return lambda function: ReferenceDataCache(function, timeout)
+
+
+def clear_reference_data_caches() -> None:
+    for cache in _reference_data_caches:
+        cache.cache_clear()
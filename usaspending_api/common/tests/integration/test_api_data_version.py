@@ -0,0 +1,55 @@
+import pytest
+
+from datetime import datetime, timezone
+from model_mommy import mommy
+
+from usaspending_api.broker.helpers.last_load_date import update_last_load_date
+from usaspending_api.common import cache as cache_module
+from usaspending_api.common.cache import get_api_data_version
+
+
+@pytest.fixture
+def fresh_data_version(monkeypatch):
+    monkeypatch.setattr(cache_module, "_api_data_version", (None, None))
+
+
+@pytest.mark.django_db
+def test_api_data_version_changes_with_loads(fresh_data_version, settings):
+    settings.API_DATA_VERSION_CHECK_INTERVAL = 0
+    initial_version = get_api_data_version()
+    assert get_api_data_version() == initial_version
+
+    update_last_load_date("fabs", datetime(2021, 1, 2, tzinfo=timezone.utc))
+    fabs_version = get_api_data_version()
+    assert fabs_version != initial_version
+
+    mommy.make("submissions.DABSSubmissionWindowSchedule", submission_reveal_date="2020-01-01T00:00:00Z")
+    assert get_api_data_version() != fabs_version
+
+    # Periods that aren't revealed yet don't change the version until they are
+    revealed_version = get_api_data_version()
+    mommy.make("submissions.DABSSubmissionWindowSchedule", submission_reveal_date="2999-01-01T00:00:00Z")
+    assert get_api_data_version() == revealed_version
+
+
+@pytest.mark.django_db
+def test_api_data_version_is_only_rechecked_after_interval(fresh_data_version, settings):
+    settings.API_DATA_VERSION_CHECK_INTERVAL = 3600
+    initial_version = get_api_data_version()
+
+    update_last_load_date("fabs", datetime(2021, 1, 2, tzinfo=timezone.utc))
+    assert get_api_data_version() == initial_version
+
+    settings.API_DATA_VERSION_CHECK_INTERVAL = 0
+    assert get_api_data_version() != initial_version
+
+
+@pytest.mark.django_db
+def test_api_data_version_changes_with_older_load_dates(fresh_data_version, settings):
+    settings.API_DATA_VERSION_CHECK_INTERVAL = 0
+    update_last_load_date("fabs", datetime(2021, 1, 2, tzinfo=timezone.utc))
+    fabs_version = get_api_data_version()
+
+    # A long load can finish after another one and record its (earlier) start time
+    update_last_load_date("es_awards", datetime(2021, 1, 1, tzinfo=timezone.utc))
+    assert get_api_data_version() != fabs_version
@@ -0,0 +1,43 @@
+import json
+import pytest
+
+from django.core.management import call_command, CommandError
+
+
+def write_payloads(tmp_path, payloads):
+    payload_file = tmp_path / "payloads.json"
+    payload_file.write_text(json.dumps(payloads))
+    return str(payload_file)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_warm_api_cache_replays_payloads(tmp_path):
+    payload_file = write_payloads(
+        tmp_path,
+        [
+            {"url": "/api/v2/references/award_types/", "method": "GET"},
+            {"url": "/api/v2/references/def_codes/", "method": "GET"},
+        ],
+    )
+    call_command("warm_api_cache", payload_file, "--concurrency=2", "--fail-on-error")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_warm_api_cache_reports_failures(tmp_path):
+    payload_file = write_payloads(
+        tmp_path,
+        [
+            {"url": "/api/v2/references/award_types/", "method": "GET"},
+            {"url": "/api/v2/not_an_endpoint/", "method": "POST", "request_object": {"filters": {}}},
+        ],
+    )
+    call_command("warm_api_cache", payload_file)
+    with pytest.raises(CommandError, match="1 requests failed"):
+        call_command("warm_api_cache", payload_file, "--fail-on-error")
+
+
+def test_warm_api_cache_validates_payloads(tmp_path):
+    with pytest.raises(CommandError, match="Unsupported method"):
+        call_command("warm_api_cache", write_payloads(tmp_path, [{"url": "/api/v2/", "method": "DELETE"}]))
+    with pytest.raises(CommandError, match="--concurrency"):
+        call_command("warm_api_cache", write_payloads(tmp_path, [{"url": "/api/v2/"}]), "--concurrency=0")
@@ -9,9 +9,12 @@ from model_mommy import mommy
 from psycopg2.sql import SQL
 
 from usaspending_api.common.helpers.sql_helpers import (
+    IterableTextIO,
     build_composable_order_by,
+    copy_rows_from_iterable,
     execute_sql_to_ordered_dictionary,
     ordered_dictionary_fetcher,
+    format_copy_text_row,
     get_connection,
 )
 
@@ -169,3 +172,31 @@ class CursorExecuteTestCase(TestCase):
             cursor.execute(RAW_SQL)
             result = ordered_dictionary_fetcher(cursor)
         assert result == EXPECTED_RESPONSE_ORDERED_DICTIONARY
+
+
+def test_iterable_text_io():
+    assert IterableTextIO(["ab", "cd\n", "ef"]).read() == "abcd\nef"
+
+    text = IterableTextIO(["ab", "cd\n", "ef"])
+    assert text.read(3) == "abc"
+    assert text.readline() == "d\n"
+    assert text.read(10) == "ef"
+    assert text.read(10) == ""
+
+
+def test_format_copy_text_row():
+    assert format_copy_text_row([1, None, "a\tb\\c\nd"]) == "1\t\\N\ta\\tb\\\\c\\nd\n"
+    assert format_copy_text_row([["A", None, 'say "hi"'], []]) == '{"A",NULL,"say \\\\"hi\\\\""}\t{}\n'
+
+
+@pytest.mark.django_db
+def test_copy_rows_from_iterable():
+    rows = ((i, None if i % 2 else "", "tab\there") for i in range(1, 4))
+    with get_connection(read_only=False).cursor() as cursor:
+        cursor.execute("CREATE TEMPORARY TABLE temp_copy_test (id INTEGER, name TEXT, description TEXT)")
+        row_count = copy_rows_from_iterable(cursor, "temp_copy_test", ["id", "name", "description"], rows)
+        cursor.execute("SELECT id, name, description FROM temp_copy_test ORDER BY id")
+        result = cursor.fetchall()
+
+    assert row_count == 3
+    assert result == [(1, None, "tab\there"), (2, "", "tab\there"), (3, None, "tab\there")]
@@ -69,6 +69,92 @@ def test_threaded_data_loader():
     assert gwa_tas.account_title == file_1_account_title
 
 
+@pytest.mark.django_db(transaction=True)
+def test_threaded_data_loader_chunks_across_processes():
+    field_map = {"treasury_account_identifier": "ACCT_NUM", "account_title": "GWA_TAS_NAME"}
+    file_path = str(settings.APP_DIR / "data" / "testing_data" / "tas_list_1.csv")
+
+    loader = ThreadedDataLoader(
+        model_class=TreasuryAppropriationAccount,
+        processes=3,
+        chunk_size=10,
+        field_map=field_map,
+        collision_field="treasury_account_identifier",
+        collision_behavior="update",
+    )
+    loader.load_from_file(file_path)
+    assert TreasuryAppropriationAccount.objects.count() == 89
+
+    # Reloading collides with every row
+    loader.load_from_file(file_path)
+    assert TreasuryAppropriationAccount.objects.count() == 89
+
+    loader.collision_behavior = "die"
+    with pytest.raises(Exception, match="exited with code 1"):
+        loader.load_from_file(file_path)
+
+
+class ListQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, item, timeout=None):
+        self.items.append(item)
+
+
+def write_tas_csv(path, rows):
+    path.write_text("ACCT_NUM,GWA_TAS_NAME\n" + "".join(f"{acct_num},{title}\n" for acct_num, title in rows))
+    return str(path)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_threaded_data_loader_routes_equivalent_collision_values_together(tmp_path):
+    # "0101" and "101" are the same integer key, so they must be handled in order by the same process
+    rows = [(f"{acct_num:04}", "First") for acct_num in range(100, 130)] + [
+        (str(acct_num), "Second") for acct_num in range(100, 130)
+    ]
+    loader = ThreadedDataLoader(
+        model_class=TreasuryAppropriationAccount,
+        processes=3,
+        chunk_size=1,
+        field_map={"treasury_account_identifier": "ACCT_NUM", "account_title": "GWA_TAS_NAME"},
+        collision_field="treasury_account_identifier",
+        collision_behavior="update",
+    )
+    file_path = write_tas_csv(tmp_path / "tas.csv", rows)
+
+    row_queues = [ListQueue() for _ in range(3)]
+    with open(file_path) as csv_file:
+        loader.csv_file_to_queues(csv_file, row_queues, [])
+    for row_queue in row_queues:
+        acct_nums = [int(row["ACCT_NUM"]) for chunk in row_queue.items for row in chunk]
+        assert all(acct_nums.count(acct_num) == 2 for acct_num in acct_nums)
+
+    loader.load_from_file(file_path)
+    assert TreasuryAppropriationAccount.objects.count() == 30
+    assert set(TreasuryAppropriationAccount.objects.values_list("account_title", flat=True)) == {"Second"}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_threaded_data_loader_die_saves_rows_before_collision(tmp_path):
+    rows = [("1", "One"), ("2", "Two"), ("3", "Three"), ("2", "Two again"), ("4", "Four")]
+    loader = ThreadedDataLoader(
+        model_class=TreasuryAppropriationAccount,
+        processes=1,
+        field_map={"treasury_account_identifier": "ACCT_NUM", "account_title": "GWA_TAS_NAME"},
+        collision_field="treasury_account_identifier",
+        collision_behavior="die",
+    )
+    with pytest.raises(Exception, match="exited with code 1"):
+        loader.load_from_file(write_tas_csv(tmp_path / "tas.csv", rows))
+
+    assert dict(TreasuryAppropriationAccount.objects.values_list("treasury_account_identifier", "account_title")) == {
+        1: "One",
+        2: "Two",
+        3: "Three",
+    }
+
+
 def test_cleanse_values():
     """Test that sloppy values in CSV are cleaned before use"""
 
@@ -0,0 +1,80 @@
+import pytest
+
+from django.core.cache import caches
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from threading import Timer
+
+from usaspending_api.common.cache_decorator import cache_response, to_cached_response
+
+CACHE_KEY = "single-flight-test-key"
+LOCK_KEY = f"{CACHE_KEY}:single-flight"
+
+view_calls = []
+
+
+class CoalescedView(APIView):
+    @cache_response(cache="default", key_func=lambda **kwargs: CACHE_KEY)
+    def post(self, request):
+        view_calls.append(request)
+        return Response({"computed_by": "this worker"})
+
+
+@pytest.fixture
+def single_flight_cache(settings):
+    settings.LOCAL_RESPONSE_CACHE_MAX_BYTES = 0
+    settings.RESPONSE_CACHE_LOCK_WAIT = 5
+    settings.RESPONSE_CACHE_LOCK_POLL_INTERVAL = 0.01
+    caches["default"].clear()
+    view_calls.clear()
+    yield caches["default"]
+    caches["default"].clear()
+
+
+def post():
+    return CoalescedView.as_view()(APIRequestFactory().post("/", {"filters": {}}, format="json"))
+
+
+def test_miss_computes_and_releases_lock(single_flight_cache):
+    response = post()
+    assert response["Cache-Trace"] == "set-cache"
+    assert len(view_calls) == 1
+    assert single_flight_cache.get(LOCK_KEY) is None
+
+    assert post()["Cache-Trace"] == "hit-cache"
+    assert len(view_calls) == 1
+
+
+def test_concurrent_miss_waits_for_lock_holder(single_flight_cache):
+    single_flight_cache.add(LOCK_KEY, "another worker")
+    other_worker_response = Response({"computed_by": "another worker"})
+    other_worker_response.accepted_renderer = CoalescedView.renderer_classes[0]()
+    other_worker_response.accepted_media_type = "application/json"
+    other_worker_response.renderer_context = {}
+    other_worker_response.render()
+    Timer(0.05, single_flight_cache.set, (CACHE_KEY, to_cached_response(other_worker_response))).start()
+
+    response = post()
+    assert response["Cache-Trace"] == "hit-coalesced-cache"
+    assert b"another worker" in response.content
+    assert len(view_calls) == 0
+
+
+def test_concurrent_miss_computes_when_lock_is_released_without_result(single_flight_cache):
+    single_flight_cache.add(LOCK_KEY, "another worker")
+    Timer(0.05, single_flight_cache.delete, (LOCK_KEY,)).start()
+
+    response = post()
+    assert response["Cache-Trace"] == "set-cache"
+    assert len(view_calls) == 1
+
+
+def test_concurrent_miss_computes_after_waiting_too_long(single_flight_cache, settings):
+    settings.RESPONSE_CACHE_LOCK_WAIT = 0.05
+    single_flight_cache.add(LOCK_KEY, "another worker")
+
+    response = post()
+    assert response["Cache-Trace"] == "set-cache"
+    assert len(view_calls) == 1
+    assert single_flight_cache.get(LOCK_KEY) == "another worker"  # A lock held by another worker isn't released
@@ -0,0 +1,37 @@
+from usaspending_api.common.elasticsearch import client as es_client_module
+from usaspending_api.common.elasticsearch.client import (
+    get_shared_elasticsearch_client,
+    instantiate_elasticsearch_client,
+)
+from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch, TransactionSearch
+
+
+def test_search_wrappers_share_one_client(monkeypatch, settings):
+    settings.ES_HOSTNAME = "http://localhost:9200"
+    monkeypatch.setattr(es_client_module, "_SHARED_CLIENTS", {})
+
+    first_search = TransactionSearch()
+    second_search = AwardSearch()
+    assert first_search._using is second_search._using
+    assert first_search._using is get_shared_elasticsearch_client()
+
+
+def test_shared_client_is_per_timeout(monkeypatch, settings):
+    settings.ES_HOSTNAME = "http://localhost:9200"
+    monkeypatch.setattr(es_client_module, "_SHARED_CLIENTS", {})
+
+    etl_client = instantiate_elasticsearch_client()
+    assert etl_client is instantiate_elasticsearch_client()
+    assert etl_client is not get_shared_elasticsearch_client()
+    assert etl_client.transport.kwargs["timeout"] == 300
+
+
+def test_shared_client_is_not_reused_after_fork(monkeypatch, settings):
+    settings.ES_HOSTNAME = "http://localhost:9200"
+    monkeypatch.setattr(es_client_module, "_SHARED_CLIENTS", {})
+
+    parent_client = get_shared_elasticsearch_client()
+    monkeypatch.setattr(es_client_module.os, "getpid", lambda: -1)  # Simulate running in a forked child process
+    child_client = get_shared_elasticsearch_client()
+    assert child_client is not parent_client
+    assert list(es_client_module._SHARED_CLIENTS) == [(-1, settings.ES_TIMEOUT)]
@@ -0,0 +1,56 @@
+from usaspending_api.common import cache as cache_module
+from usaspending_api.common.cache import LocalResponseCache
+from usaspending_api.common.cache_decorator import cached_response_size, from_cached_response, to_cached_response
+from django.http import HttpResponse
+
+
+def test_local_response_cache_evicts_least_recently_used_by_size():
+    cache = LocalResponseCache(max_bytes=10, timeout=60)
+    cache.set("a", "value a", 4)
+    cache.set("b", "value b", 4)
+    assert cache.get("a") == "value a"  # "a" is now more recently used than "b"
+
+    cache.set("c", "value c", 4)
+    assert cache.get("b") is None
+    assert cache.get("a") == "value a"
+    assert cache.get("c") == "value c"
+    assert cache.total_bytes == 8
+
+    # Values larger than the whole cache are not stored and don't evict anything
+    cache.set("d", "value d", 11)
+    assert cache.get("d") is None
+    assert cache.total_bytes == 8
+
+
+def test_local_response_cache_expires_entries(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache_module, "monotonic", lambda: now)
+    cache = LocalResponseCache(max_bytes=10, timeout=60)
+    cache.set("a", "value a", 4)
+
+    now = 1059.0
+    assert cache.get("a") == "value a"
+    now = 1060.0
+    assert cache.get("a") is None
+    assert cache.total_bytes == 0
+
+
+def test_cached_response_round_trip():
+    response = HttpResponse(content=b'{"results": []}', status=200, content_type="application/json")
+    response["Cache-Trace"] = "no-cache"
+    response["Allow"] = "POST, OPTIONS"
+
+    cached_response = to_cached_response(response)
+    assert cached_response == (
+        b'{"results": []}',
+        200,
+        [("Content-Type", "application/json"), ("Allow", "POST, OPTIONS")],
+    )
+    assert cached_response_size(cached_response) == len(b'{"results": []}') + 28 + 18
+
+    restored = from_cached_response(cached_response)
+    assert restored.content == response.content
+    assert restored.status_code == 200
+    assert restored["Content-Type"] == "application/json"
+    assert restored["Allow"] == "POST, OPTIONS"
+    assert not restored.has_header("Cache-Trace")
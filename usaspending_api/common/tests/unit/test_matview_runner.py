@@ -0,0 +1,73 @@
+import pytest
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from usaspending_api.common.management.commands import matview_runner
+from usaspending_api.common.matview_manager import MATERIALIZED_VIEWS
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    monkeypatch.setattr(matview_runner, "get_relation_kind", lambda name: "r")
+    monkeypatch.setattr(matview_runner, "get_last_load_date", lambda key: datetime(2021, 1, 1, tzinfo=timezone.utc))
+    command = matview_runner.Command()
+    command.incremental = True
+    return command
+
+
+def test_get_sql_filename_incremental(runner):
+    config = MATERIALIZED_VIEWS["mv_contract_award_search"]
+    assert runner.get_sql_filename("mv_contract_award_search", config) == Path(
+        "componentized/mv_contract_award_search__incremental.sql"
+    )
+
+    # Matviews without an "incremental" definition are always rebuilt
+    config = MATERIALIZED_VIEWS["mv_agency_autocomplete"]
+    assert runner.get_sql_filename("mv_agency_autocomplete", config) == "mv_agency_autocomplete.sql"
+
+
+def test_get_sql_filename_rebuilds_when_incremental_update_is_not_possible(runner, monkeypatch):
+    config = MATERIALIZED_VIEWS["mv_contract_award_search"]
+
+    runner.incremental = False
+    assert runner.get_sql_filename("mv_contract_award_search", config) == "mv_contract_award_search.sql"
+
+    runner.incremental = True
+    monkeypatch.setattr(matview_runner, "get_relation_kind", lambda name: "m")
+    assert runner.get_sql_filename("mv_contract_award_search", config) == "mv_contract_award_search.sql"
+
+    monkeypatch.setattr(matview_runner, "get_relation_kind", lambda name: "r")
+    monkeypatch.setattr(matview_runner, "get_last_load_date", lambda key: None)
+    assert runner.get_sql_filename("mv_contract_award_search", config) == "mv_contract_award_search.sql"
+
+
+def test_create_views_records_incremental_load_start(runner, monkeypatch):
+    load_start = datetime(2021, 2, 3, tzinfo=timezone.utc)
+    recorded = {}
+    monkeypatch.setattr(matview_runner, "get_incremental_load_start", lambda: load_start)
+    monkeypatch.setattr(matview_runner, "update_last_load_date", lambda key, date: recorded.update({key: date}))
+    monkeypatch.setattr(matview_runner, "run_sql", lambda sql, name: None)
+    monkeypatch.setattr(matview_runner.Command, "get_builds", lambda self: [])
+    monkeypatch.setattr(matview_runner.MatviewScheduler, "run", lambda self: None)
+    runner.matviews = MATERIALIZED_VIEWS
+    runner.chunked_matviews = {}
+    runner.include_chunked_matviews = False
+    runner.remove_matviews = True
+    runner.concurrency = 4
+
+    runner.create_views()
+
+    assert recorded.pop("matviews") > load_start
+    assert recorded == {
+        matview: load_start
+        for matview in (
+            "mv_contract_award_search",
+            "mv_directpayment_award_search",
+            "mv_grant_award_search",
+            "mv_idv_award_search",
+            "mv_loan_award_search",
+            "mv_other_award_search",
+            "mv_pre2008_award_search",
+        )
+    }
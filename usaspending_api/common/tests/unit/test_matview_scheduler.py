@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+
+from usaspending_api.common.matview_scheduler import (
+    check_dependencies,
+    find_dependencies,
+    MatviewBuild,
+    MatviewScheduler,
+)
+
+
+def test_find_dependencies():
+    sql = "SELECT * FROM temp.mv_contract_award_search UNION ALL SELECT * FROM mv_idv_award_search_old"
+    names = ["mv_contract_award_search", "mv_idv_award_search", "mv_agency_autocomplete"]
+    assert find_dependencies(sql, names) == {"mv_contract_award_search"}
+
+
+def test_check_dependencies():
+    check_dependencies([MatviewBuild("a", ""), MatviewBuild("b", "", {"a"})])
+    with pytest.raises(ValueError, match="unknown"):
+        check_dependencies([MatviewBuild("a", "", {"c"})])
+    with pytest.raises(ValueError, match="Circular"):
+        check_dependencies([MatviewBuild("a", "", {"b"}), MatviewBuild("b", "", {"a"}), MatviewBuild("c", "")])
+
+
+def test_scheduler_respects_dependencies_concurrency_and_size(monkeypatch):
+    events = []
+    running = []
+
+    async def mock_run_build(build):
+        running.append(build.name)
+        events.append(("start", build.name, len(running)))
+        await asyncio.sleep(0.01)
+        running.remove(build.name)
+        events.append(("end", build.name))
+
+    monkeypatch.setattr(MatviewScheduler, "run_build", staticmethod(mock_run_build))
+    builds = [
+        MatviewBuild("small", "", size=1),
+        MatviewBuild("large", "", size=100),
+        MatviewBuild("medium", "", size=10),
+        MatviewBuild("view", "", {"small", "large"}),
+    ]
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(MatviewScheduler(builds, concurrency=2).run_builds())
+    loop.close()
+
+    starts = [event for event in events if event[0] == "start"]
+    assert [name for _, name, _ in starts][:2] == ["large", "medium"]
+    assert max(concurrent for _, _, concurrent in starts) == 2
+    assert events.index(("start", "view", 1)) > max(events.index(("end", "small")), events.index(("end", "large")))
+
+
+def test_scheduler_raises_build_errors(monkeypatch):
+    async def mock_run_build(build):
+        if build.name == "broken":
+            raise RuntimeError("build failed")
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(MatviewScheduler, "run_build", staticmethod(mock_run_build))
+    builds = [MatviewBuild("broken", ""), MatviewBuild("slow", ""), MatviewBuild("dependent", "", {"broken"})]
+    loop = asyncio.new_event_loop()
+    with pytest.raises(RuntimeError, match="build failed"):
+        loop.run_until_complete(MatviewScheduler(builds, concurrency=2).run_builds())
+    loop.close()
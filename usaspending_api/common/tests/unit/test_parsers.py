@@ -0,0 +1,34 @@
+import json
+import pytest
+
+from django.test import RequestFactory
+from rest_framework.exceptions import ParseError
+from rest_framework.request import Request
+
+from usaspending_api.common import parsers
+from usaspending_api.common.parsers import get_request_payload, SharedPayloadJSONParser
+
+
+def test_request_payload_is_parsed_once(monkeypatch):
+    loads = []
+    json_loads = json.loads
+    monkeypatch.setattr(parsers.json, "loads", lambda body: loads.append(body) or json_loads(body))
+    http_request = RequestFactory().post(
+        "/api/v2/disaster/agency/spending/", data={"filter": {"def_codes": ["L", "M"]}}, content_type="application/json"
+    )
+
+    payload = get_request_payload(http_request)
+    assert payload == {"filter": {"def_codes": ["L", "M"]}}
+
+    request = Request(http_request, parsers=[SharedPayloadJSONParser()])
+    assert request.data is payload
+    assert get_request_payload(request) is payload
+    assert len(loads) == 1
+
+
+def test_request_payload_of_empty_and_invalid_bodies():
+    assert get_request_payload(RequestFactory().get("/api/v2/disaster/overview/")) == {}
+
+    http_request = RequestFactory().post("/api/v2/disaster/overview/", data="{", content_type="application/json")
+    with pytest.raises(ParseError):
+        get_request_payload(http_request)
@@ -2,7 +2,7 @@ import pytest
 
 from model_mommy import mommy
 
-from usaspending_api.common.recipient_lookups import obtain_recipient_uri
+from usaspending_api.common.recipient_lookups import bulk_obtain_recipient_ids, obtain_recipient_uri
 
 
 @pytest.fixture
@@ -186,3 +186,50 @@ def test_parent_recipient_preference_to_uei(recipient_lookup):
     }
     expected_result = "f5ba3b35-167d-8f32-57b0-406c3479de90-P"
     assert obtain_recipient_uri(**recipient_parameters) == expected_result
+
+
+@pytest.mark.django_db
+def test_bulk_obtain_recipient_ids(django_assert_num_queries):
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="01c03484-d1bd-41cc-2aca-4b427a2d0611",
+        recipient_unique_id="123",
+        recipient_level="P",
+        recipient_name="PARENT AND CHILD",
+    )
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="01c03484-d1bd-41cc-2aca-4b427a2d0611",
+        recipient_unique_id="123",
+        recipient_level="C",
+        recipient_name="PARENT AND CHILD",
+    )
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="1c4e7c2a-efe3-1b7e-2190-6f4487f808ac",
+        recipient_unique_id="456",
+        recipient_level="R",
+        recipient_name="RECIPIENT",
+    )
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="b2c8fe8e-b520-c47f-31e3-3620a358ce48",
+        recipient_unique_id="789",
+        recipient_level="R",
+        recipient_name="MULTIPLE RECIPIENTS",
+    )
+
+    with django_assert_num_queries(1):
+        recipient_ids = bulk_obtain_recipient_ids("recipient_unique_id", ["123", "456", "789", "000", None])
+    assert recipient_ids == {
+        "123": "01c03484-d1bd-41cc-2aca-4b427a2d0611-C",
+        "456": "1c4e7c2a-efe3-1b7e-2190-6f4487f808ac-R",
+        "789": None,
+        "000": None,
+    }
+
+    recipient_ids = bulk_obtain_recipient_ids("recipient_hash", ["1c4e7c2a-efe3-1b7e-2190-6f4487f808ac"])
+    assert recipient_ids == {"1c4e7c2a-efe3-1b7e-2190-6f4487f808ac": "1c4e7c2a-efe3-1b7e-2190-6f4487f808ac-R"}
+
+    with pytest.raises(ValueError):
+        bulk_obtain_recipient_ids("recipient_name", ["RECIPIENT"])
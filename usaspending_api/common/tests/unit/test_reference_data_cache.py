@@ -0,0 +1,33 @@
+from usaspending_api.common import reference_data_cache as reference_data_cache_module
+from usaspending_api.common.reference_data_cache import reference_data_cache
+
+
+def test_reference_data_cache_invalidation(monkeypatch):
+    now = 1000.0
+    version = "v1"
+    calls = []
+    monkeypatch.setattr(reference_data_cache_module, "monotonic", lambda: now)
+    monkeypatch.setattr(reference_data_cache_module, "get_api_data_version", lambda: version)
+
+    @reference_data_cache(timeout=60)
+    def lookup(argument):
+        calls.append(argument)
+        return argument, len(calls)
+
+    assert lookup("a") == ("a", 1)
+    assert lookup("a") == ("a", 1)
+    assert lookup("b") == ("b", 2)
+
+    # Expired by the timeout
+    now = 1060.0
+    assert lookup("a") == ("a", 3)
+    assert lookup("a") == ("a", 3)
+
+    # Invalidated by a new data version before the timeout
+    version = "v2"
+    assert lookup("a") == ("a", 4)
+
+    # Invalidated explicitly
+    lookup.cache_clear()
+    assert lookup("a") == ("a", 5)
+    assert calls == ["a", "b", "a", "a", "a"]
@@ -0,0 +1,27 @@
+from django.conf import settings
+
+from usaspending_api.common.elasticsearch.client import get_shared_elasticsearch_client
+from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch, BatchedSearches, TransactionSearch
+
+
+def test_batched_searches_use_one_msearch_request(monkeypatch):
+    requests = []
+
+    def mock_msearch(index=None, doc_type=None, body=None, **kwargs):
+        requests.append(body)
+        return {"responses": [{"hits": {"total": {"value": i, "relation": "eq"}, "hits": []}} for i in range(2)]}
+
+    monkeypatch.setattr(get_shared_elasticsearch_client(), "msearch", mock_msearch)
+
+    transaction_search = TransactionSearch().filter("term", type="A")
+    award_search = AwardSearch().filter("term", type="B")
+    responses = BatchedSearches().add(transaction_search).add(award_search).handle_execute(timeout="30s")
+
+    assert len(requests) == 1
+    header_1, body_1, header_2, body_2 = requests[0]
+    assert header_1 == {"index": [f"{settings.ES_TRANSACTIONS_QUERY_ALIAS_PREFIX}*"]}
+    assert header_2 == {"index": [f"{settings.ES_AWARDS_QUERY_ALIAS_PREFIX}*"]}
+    assert body_1["timeout"] == body_2["timeout"] == "30s"
+    assert body_1["query"] == transaction_search.to_dict()["query"]
+    assert body_2["query"] == award_search.to_dict()["query"]
+    assert [response.hits.total.value for response in responses] == [0, 1]
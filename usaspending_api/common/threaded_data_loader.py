@@ -1,14 +1,20 @@
-from django.db import connection
+from django.db import connection, transaction
+from django.utils import timezone
 from retrying import retry
-from multiprocessing import Process, JoinableQueue
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Process, Queue, cpu_count
 from django import db
 import logging
+import queue
 import csv
 import codecs
 
 from usaspending_api.common.long_to_terse import LONG_TO_TERSE_LABELS
 
 
+QUEUE_TIMEOUT_SECONDS = 5
+
+
 # This class is a threaded data loader
 # IMPLEMENTATION NOTE!!
 # If you write a test that will use this loader, mark it with
@@ -18,7 +24,7 @@ class ThreadedDataLoader:
     # The threaded data loader requires a bit of set up, and explanation of the
     # parameters are below. Most parameter defaults are about where you'd want them:
     #   model_class - The class of the model each row of the file corresponds to
-    #   processes - The number of processes to use. Default: 2 * number of machine cores
+    #   processes - The number of processes to use. Default: number of machine cores
     #   field_map - A dict map from the CSV's columns to model field names. Default: Empty
     #   value_map - A dict map of default or processed values to use. Keys should be model fields
     #               To process values, create a lambda function that accepts a parameter which is
@@ -38,6 +44,11 @@ class ThreadedDataLoader:
     #   pre_row_function - Like post_row_function, but before the model class is updated
     #   post_process_function - A function to call when all rows have been processed, uses the same
     #                           function parameters as post_row_function
+    #   chunk_size - The number of rows sent to a process at a time, and written to the data store at a time
+    #
+    # Rows are distributed between processes by their collision_field value (as the model field converts it, so "053021"
+    # and "53021" collide on an integer field), so all rows colliding with each other are handled, in file order, by the
+    # same process. Processes log through this process, so their messages don't get garbled.
     def __init__(
         self,
         model_class,
@@ -50,15 +61,13 @@ class ThreadedDataLoader:
         post_row_function=None,
         post_process_function=None,
         loghandler="console",
+        chunk_size=1000,
     ):
         self.logger = logging.getLogger(loghandler)
         self.model_class = model_class
         self.processes = processes
         if self.processes is None:
-            # self.processes is set to 1 because the logger threading doesn't work, resulting in a bunch of garbage
-            # being spat to console whenever this loader is used.
-            # can change to self.processes = multiprocessing.cpu_count() * 2 or something else if we fix this issue
-            self.processes = 1
+            self.processes = cpu_count()
             self.logger.info("Setting processes count to " + str(self.processes))
         self.field_map = field_map
         self.value_map = value_map
@@ -67,6 +76,7 @@ class ThreadedDataLoader:
         self.pre_row_function = pre_row_function
         self.post_row_function = post_row_function
         self.post_process_function = post_process_function
+        self.chunk_size = chunk_size
         self.fields = [field.name for field in self.model_class._meta.get_fields()]
 
     # Loads data from a file using parameters set during creation of the loader
@@ -75,13 +85,16 @@ class ThreadedDataLoader:
         if not remote_file:
             self.logger.info("Started processing file " + filepath)
 
-        # Create the Queue object - this will hold all the rows in the CSV
-        row_queue = JoinableQueue(500)
+        # One queue of chunks of rows per process, since rows are assigned to processes by their collision field
+        row_queues = [Queue(2) for _ in range(self.processes)]
+        log_queue = Queue()
+        log_listener = QueueListener(log_queue, *get_logger_handlers(self.logger), respect_handler_level=True)
 
         references = {
             "collision_field": self.collision_field,
             "collision_behavior": self.collision_behavior,
             "logger": self.logger,
+            "log_queue": log_queue,
             "pre_row_function": self.pre_row_function,
             "post_row_function": self.post_row_function,
             "fields": self.fields.copy(),
@@ -92,7 +105,7 @@ class ThreadedDataLoader:
         # connection with all processes and we don't want to have any deadlock/efficiency problems due to that
         db.connections.close_all()
         pool = []
-        for i in range(self.processes):
+        for row_queue in row_queues:
             pool.append(
                 DataLoaderThread(
                     "Process-" + str(len(pool)),
@@ -104,39 +117,57 @@ class ThreadedDataLoader:
                 )
             )
 
-        for process in pool:
-            process.start()
-
-        if remote_file:
-            csv_file = codecs.getreader("utf-8")(filepath["Body"])
-            row_queue = self.csv_file_to_queue(csv_file, row_queue)
-        else:
-            with open(filepath, encoding=encoding) as csv_file:
-                row_queue = self.csv_file_to_queue(csv_file, row_queue)
+        log_listener.start()
+        try:
+            for process in pool:
+                process.start()
 
-        for i in range(self.processes):
-            row_queue.put(None)
+            if remote_file:
+                csv_file = codecs.getreader("utf-8")(filepath["Body"])
+                self.csv_file_to_queues(csv_file, row_queues, pool)
+            else:
+                with open(filepath, encoding=encoding) as csv_file:
+                    self.csv_file_to_queues(csv_file, row_queues, pool)
 
-        row_queue.join()
+            for row_queue in row_queues:
+                put_while_alive(row_queue, None, pool)
 
-        for process in pool:
-            process.terminate()
+            for process in pool:
+                process.join()
+            raise_if_failed(pool)
+        finally:
+            for process in pool:
+                if process.is_alive():
+                    process.terminate()
+            log_listener.stop()
 
         if self.post_process_function is not None:
             self.post_process_function()
 
         self.logger.info("Finished processing all rows")
 
-    def csv_file_to_queue(self, csv_file, row_queue):
+    def csv_file_to_queues(self, csv_file, row_queues, pool):
         reader = csv.DictReader(csv_file)
-        temp_row_queue = row_queue
+        chunks = [[] for _ in row_queues]
         count = 0
         for row in reader:
+            row = cleanse_values(row)
+            if self.collision_field is not None:
+                # Only this process routes rows, so hash() doesn't need to be stable across processes
+                key = get_collision_key(self.model_class, self.field_map, self.collision_field, row)
+                index = hash(key) % len(row_queues)
+            else:
+                index = (count // self.chunk_size) % len(row_queues)
             count = count + 1
-            temp_row_queue.put(row)
-            if count % 1000 == 0:
+            chunks[index].append(row)
+            if len(chunks[index]) >= self.chunk_size:
+                put_while_alive(row_queues[index], chunks[index], pool)
+                chunks[index] = []
+            if count % 10000 == 0:
                 self.logger.info("Queued row " + str(count))
-        return temp_row_queue
+        for index, chunk in enumerate(chunks):
+            if chunk:
+                put_while_alive(row_queues[index], chunk, pool)
 
 
 class DataLoaderThread(Process):
@@ -150,79 +181,122 @@ class DataLoaderThread(Process):
         self.references = references
 
     def run(self):
-        self.references["logger"].info("Starting " + self.name)
+        # Hand log records to the parent process to write, instead of writing to its handlers from several processes
+        logger = self.references["logger"]
+        logger.handlers = [QueueHandler(self.references["log_queue"])]
+        logger.propagate = False
+
+        logger.info("Starting " + self.name)
         connection.connect()
-        self.process_data()
-        self.references["logger"].info("Exiting " + self.name)
+        try:
+            row_count = self.process_data()
+        finally:
+            connection.close()
+        logger.info("Exiting {} after saving {} rows".format(self.name, row_count))
 
     def process_data(self):
-        # Make sure we weren't flagged to exit
+        row_count = 0
         while True:
-            row = self.data_queue.get()
-            # If row is none, we need to die.
-            if row is None:
-                self.data_queue.task_done()
-                connection.close()
-                return
-            row = cleanse_values(row)
-            # Grab the collision field
+            rows = self.data_queue.get()
+            # If rows is none, we need to die.
+            if rows is None:
+                return row_count
+            row_count += self.process_chunk(rows)
+
+    def process_chunk(self, rows):
+        """Saves a chunk of rows with a few queries, handling collisions with existing and earlier rows in order"""
+        collision_instances = self.get_collision_instances(rows)
+        new_instances = {}  # Instances to create by collision key (or row number if there's no collision field)
+        updated_instances = {}  # Existing instances to update by collision key
+        deleted_pks = []
+
+        for row_number, row in enumerate(rows):
+            key = self.get_collision_key(row) if self.references["collision_field"] is not None else row_number
+            collision_instance = new_instances.get(key) or updated_instances.get(key) or collision_instances.get(key)
             update = False
-            collision_instance = None
-            model_instance = None
-            if self.references["collision_field"] is not None:
-                model_collision_field = self.references["collision_field"]
-                data_collision_field = model_collision_field
-                # If it's in the field map, we need to look it up
-                if model_collision_field in self.field_map:
-                    data_collision_field = self.field_map[model_collision_field]
-                query = {model_collision_field: row[data_collision_field]}
-                collision_instance = self.model_class.objects.filter(**query).first()
-
-                if collision_instance is not None:
-                    behavior = self.references["collision_behavior"]
-                    if behavior == "delete":  # Delete the row from the data store and load new row
-                        collision_instance.delete()
-                    if behavior == "update":  # Update the row in the data store with new values from the CSV
-                        update = True
-                    if behavior == "skip":  # Skip the row
-                        self.data_queue.task_done()
-                        continue
-                    if behavior == "skip_and_complain":  # Log a warning and skip the row
-                        self.references["logger"].warning("Hit a collision on row %s" % (row))
-                        self.data_queue.task_done()
-                        continue
-                    if behavior == "die":  # Raise an exception and cease execution
-                        raise Exception("Hit collision on row %s" % (row))
-
-            if not update:
-                model_instance = self.model_class()
-            else:
-                model_instance = collision_instance
-
+            if collision_instance is not None:
+                behavior = self.references["collision_behavior"]
+                if behavior == "delete":  # Delete the row from the data store and load new row
+                    if key in collision_instances and key not in new_instances:
+                        deleted_pks.append(collision_instances[key].pk)
+                    updated_instances.pop(key, None)
+                if behavior == "update":  # Update the row in the data store with new values from the CSV
+                    update = True
+                if behavior == "skip":  # Skip the row
+                    continue
+                if behavior == "skip_and_complain":  # Log a warning and skip the row
+                    self.references["logger"].warning("Hit a collision on row %s" % (row))
+                    continue
+                if behavior == "die":  # Save the rows before this one, raise an exception and cease execution
+                    self.save_instances(deleted_pks, list(new_instances.values()), list(updated_instances.values()))
+                    raise Exception("Hit collision on row %s" % (row))
+
+            model_instance = collision_instance if update else self.model_class()
             try:
-                if self.references["pre_row_function"] is not None:
-                    self.references["pre_row_function"](row=row, instance=model_instance)
-
-                self.load_data_into_model(
-                    model_instance,
-                    self.references["fields"],
-                    self.field_map,
-                    self.value_map,
-                    row,
-                    self.references["logger"],
-                )
-
-                # If we have a post row function, run it before saving
-                if self.references["post_row_function"] is not None:
-                    self.references["post_row_function"](row=row, instance=model_instance)
-
-                model_instance.save()
+                self.prepare_instance(model_instance, row)
             except SkipRowException as e:
                 self.references["logger"].info(e)
+                continue
             except Exception as e:
                 self.references["logger"].error(e)
+                continue
 
-            self.data_queue.task_done()
+            if update and key not in new_instances:
+                updated_instances[key] = model_instance
+            else:
+                new_instances[key] = model_instance
+
+        self.save_instances(deleted_pks, list(new_instances.values()), list(updated_instances.values()))
+        return len(new_instances) + len(updated_instances)
+
+    def get_collision_key(self, row):
+        return get_collision_key(self.model_class, self.field_map, self.references["collision_field"], row)
+
+    def get_collision_instances(self, rows):
+        """Existing instances colliding with the rows, by their collision field value"""
+        model_collision_field = self.references["collision_field"]
+        if model_collision_field is None:
+            return {}
+        keys = {self.get_collision_key(row) for row in rows}
+        instances = self.model_class.objects.filter(**{model_collision_field + "__in": keys})
+        return {getattr(instance, model_collision_field): instance for instance in instances}
+
+    def prepare_instance(self, model_instance, row):
+        if self.references["pre_row_function"] is not None:
+            self.references["pre_row_function"](row=row, instance=model_instance)
+
+        self.load_data_into_model(
+            model_instance, self.references["fields"], self.field_map, self.value_map, row, self.references["logger"]
+        )
+
+        # If we have a post row function, run it before saving
+        if self.references["post_row_function"] is not None:
+            self.references["post_row_function"](row=row, instance=model_instance)
+
+    def save_instances(self, deleted_pks, new_instances, updated_instances):
+        update_fields = [field for field in self.model_class._meta.concrete_fields if not field.primary_key]
+        for field in update_fields:
+            # Like save() would, but bulk_update doesn't
+            if getattr(field, "auto_now", False):
+                for instance in updated_instances:
+                    setattr(instance, field.attname, timezone.now())
+
+        try:
+            with transaction.atomic():
+                if deleted_pks:
+                    self.model_class.objects.filter(pk__in=deleted_pks).delete()
+                self.model_class.objects.bulk_update(updated_instances, [field.name for field in update_fields])
+                self.model_class.objects.bulk_create(new_instances)
+        except Exception as e:
+            # Find the offending rows by saving one at a time, like this loader used to
+            self.references["logger"].warning("Batch save failed, saving rows one at a time: %s" % e)
+            if deleted_pks:
+                self.model_class.objects.filter(pk__in=deleted_pks).delete()
+            for model_instance in updated_instances + new_instances:
+                try:
+                    model_instance.save()
+                except Exception as e:
+                    self.references["logger"].error(e)
 
     # Retry decorator to help resolve race conditions when constructing auxilliary objects
     @retry(stop_max_attempt_number=3, wait_fixed=10)
@@ -274,6 +348,13 @@ class DataLoaderThread(Process):
             setattr(model_instance_or_dict, field, value)
 
 
+def get_collision_key(model_class, field_map, model_collision_field, row):
+    """The collision field value of the row, as the model field converts it (and as it's compared to existing rows)"""
+    # If it's in the field map, we need to look it up
+    value = row.get(field_map.get(model_collision_field, model_collision_field))
+    return model_class._meta.get_field(model_collision_field).to_python(value)
+
+
 def cleanse_values(row):
     """
     Remove textual quirks from CSV values.
@@ -285,3 +366,29 @@ def cleanse_values(row):
 
 class SkipRowException(Exception):
     pass
+
+
+def get_logger_handlers(logger):
+    """The handlers that records of logger are handled by, following propagation like logging does"""
+    handlers = []
+    while logger:
+        handlers.extend(logger.handlers)
+        logger = logger.parent if logger.propagate else None
+    return handlers
+
+
+def put_while_alive(data_queue, item, pool):
+    """Put item on data_queue without blocking forever if the processes reading it died"""
+    while True:
+        raise_if_failed(pool)
+        try:
+            data_queue.put(item, timeout=QUEUE_TIMEOUT_SECONDS)
+            return
+        except queue.Full:
+            continue
+
+
+def raise_if_failed(pool):
+    failed = [process for process in pool if process.exitcode not in (None, 0)]
+    if failed:
+        raise Exception(", ".join("%s exited with code %s" % (process.name, process.exitcode) for process in failed))
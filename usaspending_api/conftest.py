@@ -21,6 +21,7 @@ from usaspending_api.common.sqs.sqs_handler import (
     _FakeUnitTestFileBackedSQSQueue,
 )
 from usaspending_api.common.helpers.generic_helper import generate_matviews
+from usaspending_api.common.reference_data_cache import clear_reference_data_caches
 from usaspending_api.conftest_helpers import (
     TestElasticSearchIndex,
     ensure_broker_server_dblink_exists,
@@ -67,6 +68,12 @@ def add_view_protection():
         pass
 
 
+@pytest.fixture(autouse=True)
+def fresh_reference_data_caches():
+    """Reference data lookups cached while running one test must not be reused by the next"""
+    clear_reference_data_caches()
+
+
 @pytest.fixture(scope="session")
 def local(request):
     return request.config.getoption("--local")
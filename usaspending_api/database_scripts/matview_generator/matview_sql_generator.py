@@ -49,6 +49,11 @@ EXAMPLE SQL DESCRIPTION JSON FILE:
     "  action_date DESC"
 
     ],
+    "incremental": {  # Optional: build a table that `make_incremental_sql` can update, instead of a matview
+        "key": "<unique col name>",
+        "source_table": "<table whose update_date marks the changed keys>",
+        "source_key": "<col of source_table with the key values>"
+    },
     "index": {
         "name": "<name>",
         "columns": [
@@ -67,39 +72,82 @@ EXAMPLE SQL DESCRIPTION JSON FILE:
 """
 
 
-def make_matview_drops(final_matview_name):
+def make_matview_drops(final_matview_name, as_table=False):
     matview_temp_name = final_matview_name + "_temp"
     matview_archive_name = final_matview_name + "_old"
 
-    return [TEMPLATE["drop_matview"].format(matview_temp_name), TEMPLATE["drop_matview"].format(matview_archive_name)]
+    # Either kind may exist while switching between matviews and tables
+    drop = TEMPLATE["drop_matview_or_table"] if as_table else TEMPLATE["drop_matview"]
+    return [drop.format(matview_temp_name), drop.format(matview_archive_name)]
 
 
-def make_matview_create(final_matview_name, final_matview_schema_name, sql):
+def make_matview_create(final_matview_name, final_matview_schema_name, sql, as_table=False):
     matview_sql = "\n".join(sql)
     matview_temp_name = final_matview_name + "_temp"
     with_or_without_data = ""
     if GLOBAL_ARGS.no_data:
         with_or_without_data = "NO "
     matview_name_with_schema = f"{final_matview_schema_name}.{matview_temp_name}"
-    return [TEMPLATE["create_matview"].format(matview_name_with_schema, matview_sql, with_or_without_data)]
+    create = TEMPLATE["create_table_as"] if as_table else TEMPLATE["create_matview"]
+    return [create.format(matview_name_with_schema, matview_sql, with_or_without_data)]
 
 
-def make_rename_sql(matview_name, old_indexes, old_stats, new_indexes, new_stats):
+def make_rename_sql(matview_name, old_indexes, old_stats, new_indexes, new_stats, as_table=False):
     matview_temp_name = matview_name + "_temp"
     matview_archive_name = matview_name + "_old"
+    # ALTER TABLE can also rename the matview built before switching to a table
+    rename = TEMPLATE["rename_table"] if as_table else TEMPLATE["rename_matview"]
     sql_strings = []
-    sql_strings.append(TEMPLATE["rename_matview"].format("IF EXISTS ", matview_name, matview_archive_name))
+    sql_strings.append(rename.format("IF EXISTS ", matview_name, matview_archive_name))
     sql_strings += old_indexes
     sql_strings.append("")
     sql_strings += old_stats
     sql_strings.append("")
-    sql_strings.append(TEMPLATE["rename_matview"].format("", matview_temp_name, matview_name))
+    sql_strings.append(rename.format("", matview_temp_name, matview_name))
     sql_strings += new_indexes
     sql_strings.append("")
     sql_strings += new_stats
     return sql_strings
 
 
+def make_incremental_sql(sql_json):
+    """
+    Update the table of an incremental matview JSON in place: delete the rows of the keys whose source rows were
+    updated (per update_date) since the last_load_date recorded under the table's name by matview_runner or that were
+    deleted, then insert the rows of those keys. Everything runs in one DO block, so readers never see a partial update.
+    """
+    key = sql_json["incremental"]["key"]
+    source_table = sql_json["incremental"]["source_table"]
+    source_key = sql_json["incremental"]["source_key"]
+    table_name = "{}.{}".format(sql_json.get("schema_name", "public"), sql_json["final_name"])
+    changed_keys = sql_json["final_name"] + "_changed_keys"
+    matview_sql = sql_json["matview_sql"]
+    if "ORDER BY" in matview_sql:
+        # Postgres can't merge a sorted subquery into the INSERT; it would build every row before filtering them
+        matview_sql = matview_sql[: max(i for i, line in enumerate(matview_sql) if line == "ORDER BY")]
+    return [
+        "DO $$ BEGIN",
+        f"CREATE TEMPORARY TABLE {changed_keys} ON COMMIT DROP AS",
+        f"  SELECT {source_key} AS {key} FROM {source_table}",
+        f"  WHERE update_date >= (",
+        "    SELECT COALESCE(MAX(last_load_date), '-infinity') FROM external_data_load_date",
+        "    INNER JOIN external_data_type USING (external_data_type_id)",
+        f"    WHERE external_data_type.name = '{sql_json['final_name']}'",
+        "  );",
+        f"INSERT INTO {changed_keys}",
+        f"  SELECT {key} FROM {table_name}",
+        f"  WHERE NOT EXISTS (SELECT FROM {source_table} WHERE {source_table}.{source_key} = {table_name}.{key});",
+        f"ANALYZE {changed_keys};",
+        f"DELETE FROM {table_name} USING {changed_keys} WHERE {table_name}.{key} = {changed_keys}.{key};",
+        f"INSERT INTO {table_name}",
+        "SELECT * FROM (",
+        *matview_sql,
+        f") AS matview WHERE matview.{key} IN (SELECT {key} FROM {changed_keys});",
+        "END $$;",
+        TEMPLATE["analyze"].format(table_name),
+    ]
+
+
 def create_all_sql_strings(sql_json):
     """Desired ordering of steps for final SQL:
     1. Drop existing "_temp" and "_old" matviews
@@ -117,15 +165,16 @@ def create_all_sql_strings(sql_json):
     matview_name = sql_json["final_name"]
     matview_schema_name = sql_json.get("schema_name", "public")
     matview_temp_name = matview_name + "_temp"
+    as_table = "incremental" in sql_json
 
     create_indexes, rename_old_indexes, rename_new_indexes = make_indexes_sql(
         sql_json, matview_temp_name, UNIQUE_STRING, True, GLOBAL_ARGS.quiet
     )
     create_stats, rename_old_stats, rename_new_stats = make_stats_sql(sql_json, matview_temp_name, UNIQUE_STRING)
 
-    final_sql_strings.extend(make_matview_drops(matview_name))
+    final_sql_strings.extend(make_matview_drops(matview_name, as_table))
     final_sql_strings.append("")
-    final_sql_strings.extend(make_matview_create(matview_name, matview_schema_name, sql_json["matview_sql"]))
+    final_sql_strings.extend(make_matview_create(matview_name, matview_schema_name, sql_json["matview_sql"], as_table))
 
     final_sql_strings.append("")
     final_sql_strings += create_indexes
@@ -133,9 +182,15 @@ def create_all_sql_strings(sql_json):
     final_sql_strings += create_stats
     final_sql_strings.append("")
     if GLOBAL_ARGS.no_data:
-        final_sql_strings.extend([TEMPLATE["refresh_matview"].format("", matview_name), ""])
+        if as_table:
+            table_temp_name = f"{matview_schema_name}.{matview_temp_name}"
+            final_sql_strings.extend([f"INSERT INTO {table_temp_name}", *sql_json["matview_sql"], ";", ""])
+        else:
+            final_sql_strings.extend([TEMPLATE["refresh_matview"].format("", matview_name), ""])
     final_sql_strings.extend(
-        make_rename_sql(matview_name, rename_old_indexes, rename_old_stats, rename_new_indexes, rename_new_stats)
+        make_rename_sql(
+            matview_name, rename_old_indexes, rename_old_stats, rename_new_indexes, rename_new_stats, as_table
+        )
     )
     final_sql_strings.append("")
     final_sql_strings.extend(make_modification_sql(matview_name, GLOBAL_ARGS.quiet))
@@ -159,16 +214,17 @@ def create_componentized_files(sql_json):
     matview_name = sql_json["final_name"]
     matview_schema_name = sql_json.get("schema_name", "public")
     matview_temp_name = matview_name + "_temp"
+    as_table = "incremental" in sql_json
 
     create_indexes, rename_old_indexes, rename_new_indexes = make_indexes_sql(
         sql_json, matview_temp_name, UNIQUE_STRING, True, GLOBAL_ARGS.quiet
     )
     create_stats, rename_old_stats, rename_new_stats = make_stats_sql(sql_json, matview_temp_name, UNIQUE_STRING)
 
-    sql_strings = make_matview_drops(matview_name)
+    sql_strings = make_matview_drops(matview_name, as_table)
     write_sql_file(sql_strings, filename_base + "__drops")
 
-    sql_strings = make_matview_create(matview_name, matview_schema_name, sql_json["matview_sql"])
+    sql_strings = make_matview_create(matview_name, matview_schema_name, sql_json["matview_sql"], as_table)
     write_sql_file(sql_strings, filename_base + "__matview")
 
     indexes_and_stats = create_indexes + create_stats
@@ -184,11 +240,14 @@ def create_componentized_files(sql_json):
     write_sql_file(sql_strings, filename_base + "__mods")
 
     sql_strings = make_rename_sql(
-        matview_name, rename_old_indexes, rename_old_stats, rename_new_indexes, rename_new_stats
+        matview_name, rename_old_indexes, rename_old_stats, rename_new_indexes, rename_new_stats, as_table
     )
     write_sql_file(sql_strings, filename_base + "__renames")
 
-    if "refresh" in sql_json and sql_json["refresh"] is True:
+    if as_table:
+        # Tables can't be refreshed, they are updated incrementally instead
+        write_sql_file(make_incremental_sql(sql_json), filename_base + "__incremental")
+    elif "refresh" in sql_json and sql_json["refresh"] is True:
         if GLOBAL_ARGS.no_data:
             sql_strings = make_matview_refresh(matview_temp_name, "")
         else:
@@ -7,8 +7,14 @@ from uuid import uuid4
 TEMPLATE = {
     "create_matview": "CREATE MATERIALIZED VIEW {} AS\n{} WITH {}DATA;",
     "create_table": "CREATE TABLE {} AS SELECT * from {} WITH NO DATA;",
+    "create_table_as": "CREATE TABLE {} AS\n{} WITH {}DATA;",
     "drop_table": "DROP TABLE IF EXISTS {} CASCADE;",
     "drop_matview": "DROP MATERIALIZED VIEW IF EXISTS {} CASCADE;",
+    "drop_matview_or_table": (
+        "DO $$ DECLARE kind CHAR := (SELECT relkind FROM pg_class WHERE oid = to_regclass('{0}')); BEGIN"
+        " IF kind = 'm' THEN DROP MATERIALIZED VIEW {0} CASCADE;"
+        " ELSIF kind = 'r' THEN DROP TABLE {0} CASCADE; END IF; END $$;"
+    ),
     "rename_matview": "ALTER MATERIALIZED VIEW {}{} RENAME TO {};",
     "rename_table": "ALTER TABLE {}{} RENAME TO {};",
     "cluster_matview": "CLUSTER VERBOSE {} USING {};",
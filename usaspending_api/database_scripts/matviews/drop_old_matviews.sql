@@ -1,12 +1,30 @@
 DROP MATERIALIZED VIEW IF EXISTS mv_agency_autocomplete_old;
-DROP MATERIALIZED VIEW IF EXISTS mv_contract_award_search_old;
 DROP MATERIALIZED VIEW IF EXISTS mv_covid_financial_account_old;
-DROP MATERIALIZED VIEW IF EXISTS mv_directpayment_award_search_old;
-DROP MATERIALIZED VIEW IF EXISTS mv_grant_award_search_old;
-DROP MATERIALIZED VIEW IF EXISTS mv_idv_award_search_old;
-DROP MATERIALIZED VIEW IF EXISTS mv_loan_award_search_old;
-DROP MATERIALIZED VIEW IF EXISTS mv_other_award_search_old;
-DROP MATERIALIZED VIEW IF EXISTS mv_pre2008_award_search_old;
 DROP MATERIALIZED VIEW IF EXISTS subaward_view_old;
 DROP MATERIALIZED VIEW IF EXISTS summary_state_view_old;
 DROP MATERIALIZED VIEW IF EXISTS tas_autocomplete_matview_old;
+
+-- Award search matviews with an "incremental" JSON definition are built as tables (or were matviews before that)
+DO $$
+DECLARE
+    old_relation RECORD;
+BEGIN
+    FOR old_relation IN
+        SELECT oid::regclass AS name, relkind FROM pg_class
+        WHERE relname IN (
+            'mv_contract_award_search_old',
+            'mv_directpayment_award_search_old',
+            'mv_grant_award_search_old',
+            'mv_idv_award_search_old',
+            'mv_loan_award_search_old',
+            'mv_other_award_search_old',
+            'mv_pre2008_award_search_old'
+        ) AND relkind IN ('m', 'r') AND pg_table_is_visible(oid)
+    LOOP
+        IF old_relation.relkind = 'm' THEN
+            EXECUTE format('DROP MATERIALIZED VIEW %s', old_relation.name);
+        ELSE
+            EXECUTE format('DROP TABLE %s', old_relation.name);
+        END IF;
+    END LOOP;
+END $$;
@@ -1,3 +1,4 @@
+import json
 import pytest
 
 from django.db import connection
@@ -7,6 +8,12 @@ from usaspending_api.common.matview_manager import MATERIALIZED_VIEWS, CHUNKED_M
 ALL_MATVIEWS = {**MATERIALIZED_VIEWS, **CHUNKED_MATERIALIZED_VIEWS}
 
 
+def is_incremental(config):
+    """Matviews with an "incremental" definition are generated as tables"""
+    with open(config["json_filepath"]) as f:
+        return "incremental" in json.load(f)
+
+
 @pytest.fixture
 def convert_traditional_views_to_materialized_views(transactional_db):
     """
@@ -26,7 +33,12 @@ def convert_traditional_views_to_materialized_views(transactional_db):
 
     # Great.  Test is over.  Drop all of our materialized views.
     with connection.cursor() as cursor:
-        cursor.execute("; ".join(f"drop materialized view if exists {v} cascade" for v in ALL_MATVIEWS))
+        cursor.execute(
+            "; ".join(
+                f"drop {'table' if is_incremental(c) else 'materialized view'} if exists {v} cascade"
+                for v, c in ALL_MATVIEWS.items()
+            )
+        )
 
     # Recreate our traditional views.
     generate_matviews(materialized_views_as_traditional_views=True)
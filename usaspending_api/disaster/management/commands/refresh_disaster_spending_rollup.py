@@ -0,0 +1,138 @@
+import logging
+
+from datetime import datetime, timezone
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from usaspending_api.broker.helpers.last_load_date import update_last_load_date
+
+logger = logging.getLogger("script")
+
+# DEF Codes only started appearing in submissions for FY2020 P07 (Apr 1, 2020)
+REPORTING_PERIOD_MIN_DATE = "2020-04-01"
+
+REFRESH_DISASTER_SPENDING_ROLLUP_SQL = f"""
+DELETE FROM disaster_spending_rollup;
+
+WITH gtas AS (
+    SELECT
+        disaster_emergency_fund_code AS def_code,
+        fiscal_year,
+        fiscal_period,
+        FALSE AS is_quarter,
+        SUM(total_budgetary_resources_cpe) - (
+            SUM(budget_authority_unobligated_balance_brought_forward_cpe)
+            + SUM(deobligations_or_recoveries_or_refunds_from_prior_year_cpe)
+            + SUM(prior_year_paid_obligation_recoveries)
+        ) AS total_budget_authority,
+        SUM(obligations_incurred_total_cpe)
+            - SUM(deobligations_or_recoveries_or_refunds_from_prior_year_cpe) AS total_obligations,
+        SUM(gross_outlay_amount_by_tas_cpe) - SUM(anticipated_prior_year_obligation_recoveries) AS total_outlays
+    FROM
+        gtas_sf133_balances
+    WHERE
+        disaster_emergency_fund_code IS NOT NULL
+    GROUP BY
+        disaster_emergency_fund_code, fiscal_year, fiscal_period
+),
+file_c AS (
+    SELECT
+        faba.disaster_emergency_fund_code AS def_code,
+        sa.reporting_fiscal_year AS fiscal_year,
+        sa.reporting_fiscal_period AS fiscal_period,
+        sa.quarter_format_flag AS is_quarter,
+        COALESCE(
+            SUM(faba.transaction_obligated_amount) FILTER (
+                WHERE sa.reporting_period_start >= '{REPORTING_PERIOD_MIN_DATE}'
+            ),
+            0
+        ) AS award_obligations,
+        COALESCE(
+            SUM(faba.gross_outlay_amount_by_award_cpe) FILTER (WHERE sa.is_final_balances_for_fy)
+            + SUM(faba.ussgl487200_down_adj_pri_ppaid_undel_orders_oblig_refund_cpe) FILTER (
+                WHERE sa.is_final_balances_for_fy
+            )
+            + SUM(faba.ussgl497200_down_adj_pri_paid_deliv_orders_oblig_refund_cpe) FILTER (
+                WHERE sa.is_final_balances_for_fy
+            ),
+            0
+        ) AS award_outlays
+    FROM
+        financial_accounts_by_awards AS faba
+    INNER JOIN
+        submission_attributes AS sa ON sa.submission_id = faba.submission_id
+    WHERE
+        faba.disaster_emergency_fund_code IS NOT NULL
+    GROUP BY
+        faba.disaster_emergency_fund_code, sa.reporting_fiscal_year, sa.reporting_fiscal_period, sa.quarter_format_flag
+),
+file_b AS (
+    SELECT
+        fabpaoc.disaster_emergency_fund_code AS def_code,
+        sa.reporting_fiscal_year AS fiscal_year,
+        sa.reporting_fiscal_period AS fiscal_period,
+        sa.quarter_format_flag AS is_quarter,
+        COUNT(*) AS non_zero_file_b_count
+    FROM
+        financial_accounts_by_program_activity_object_class AS fabpaoc
+    INNER JOIN
+        submission_attributes AS sa ON sa.submission_id = fabpaoc.submission_id
+    WHERE
+        fabpaoc.disaster_emergency_fund_code IS NOT NULL
+        AND sa.reporting_period_start >= '{REPORTING_PERIOD_MIN_DATE}'
+        AND NOT (
+            fabpaoc.obligations_incurred_by_program_object_class_cpe
+                = -fabpaoc.deobligations_recoveries_refund_pri_program_object_class_cpe
+            AND fabpaoc.gross_outlay_amount_by_program_object_class_cpe
+                = -fabpaoc.ussgl487200_down_adj_pri_ppaid_undel_orders_oblig_refund_cpe
+                - fabpaoc.ussgl497200_down_adj_pri_paid_deliv_orders_oblig_refund_cpe
+        )
+    GROUP BY
+        fabpaoc.disaster_emergency_fund_code, sa.reporting_fiscal_year, sa.reporting_fiscal_period, sa.quarter_format_flag
+)
+INSERT INTO disaster_spending_rollup (
+    def_code,
+    fiscal_year,
+    fiscal_period,
+    is_quarter,
+    total_budget_authority,
+    total_obligations,
+    total_outlays,
+    award_obligations,
+    award_outlays,
+    non_zero_file_b_count
+)
+SELECT
+    def_code,
+    fiscal_year,
+    fiscal_period,
+    is_quarter,
+    gtas.total_budget_authority,
+    gtas.total_obligations,
+    gtas.total_outlays,
+    COALESCE(file_c.award_obligations, 0),
+    COALESCE(file_c.award_outlays, 0),
+    COALESCE(file_b.non_zero_file_b_count, 0)
+FROM
+    gtas
+FULL OUTER JOIN
+    file_c USING (def_code, fiscal_year, fiscal_period, is_quarter)
+FULL OUTER JOIN
+    file_b USING (def_code, fiscal_year, fiscal_period, is_quarter);
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the disaster_spending_rollup table of GTAS, File B, and File C disaster spending totals for each "
+        "DEF Code and period. Run after GTAS or submissions are loaded and after is_final_balances_for_fy changes."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(REFRESH_DISASTER_SPENDING_ROLLUP_SQL)
+            cursor.execute("SELECT COUNT(*) FROM disaster_spending_rollup")
+            logger.info(f"Refreshed disaster_spending_rollup with {cursor.fetchone()[0]:,} rows")
+
+        # Changes the API data version once the refreshed rollup is committed (or along with the caller's transaction)
+        update_last_load_date("disaster_spending_rollup", datetime.now(timezone.utc))
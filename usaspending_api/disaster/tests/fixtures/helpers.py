@@ -3,6 +3,8 @@ import json
 import pytest
 import usaspending_api.common.helpers.fiscal_year_helpers
 
+from django.core.management import call_command
+
 
 class Helpers:
     @staticmethod
@@ -74,6 +76,10 @@ class Helpers:
     def reset_dabs_cache():
         usaspending_api.disaster.v2.views.disaster_base.final_submissions_for_all_fy.cache_clear()
 
+    @staticmethod
+    def refresh_disaster_spending_rollup():
+        call_command("refresh_disaster_spending_rollup")
+
 
 @pytest.fixture
 def helpers():
@@ -9,6 +9,7 @@ url = "/api/v2/disaster/def_code/count/"
 def test_def_code_count_success(client, monkeypatch, disaster_account_data, helpers):
     helpers.patch_datetime_now(monkeypatch, 2022, 12, 31)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
 
     resp = helpers.post_for_count_endpoint(client, url, ["L", "M", "N", "O", "P"])
     assert resp.status_code == status.HTTP_200_OK
@@ -23,6 +23,7 @@ OVERVIEW_URL = "/api/v2/disaster/overview/"
 def test_basic_data_set(client, monkeypatch, helpers, defc_codes, basic_ref_data, early_gtas, basic_faba):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, EARLY_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data == {
         "funding": [{"amount": EARLY_GTAS_CALCULATIONS["total_budgetary_resources"], "def_code": "M"}],
@@ -43,6 +44,7 @@ def test_using_only_latest_gtas(
 ):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, LATE_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["funding"] == [{"amount": Decimal("0.3"), "def_code": "M"}]
     assert resp.data["total_budget_authority"] == LATE_GTAS_CALCULATIONS["total_budgetary_resources"]
@@ -55,6 +57,7 @@ def test_total_obligations(
     client, monkeypatch, helpers, defc_codes, basic_ref_data, unobligated_balance_gtas, basic_faba
 ):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, LATE_MONTH, 25)
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["spending"]["total_obligations"] == Decimal("0.0")
 
@@ -65,6 +68,7 @@ def test_exclude_gtas_for_incompleted_period(
 ):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, LATE_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["funding"] == [{"amount": EARLY_GTAS_CALCULATIONS["total_budgetary_resources"], "def_code": "M"}]
     assert resp.data["total_budget_authority"] == EARLY_GTAS_CALCULATIONS["total_budgetary_resources"]
@@ -78,6 +82,7 @@ def test_exclude_non_selected_defc_for_gtas(
 ):
     helpers.patch_datetime_now(monkeypatch, LATE_YEAR, EARLY_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL + "?def_codes=M,N")
     assert resp.data["spending"]["total_obligations"] == Decimal("0.0")
     assert resp.data["spending"]["total_outlays"] == Decimal("0.0")
@@ -93,6 +98,7 @@ def test_summing_multiple_years(
 ):
     helpers.patch_datetime_now(monkeypatch, LATE_YEAR, EARLY_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["funding"] == [
         {
@@ -121,6 +127,7 @@ def test_summing_period_and_quarterly_in_same_year(
 ):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, LATE_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["funding"] == [
         {
@@ -142,6 +149,7 @@ def test_ignore_gtas_not_yet_revealed(
 ):
     helpers.patch_datetime_now(monkeypatch, LATE_YEAR, EARLY_MONTH - 1, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["funding"] == [{"amount": LATE_GTAS_CALCULATIONS["total_budgetary_resources"], "def_code": "M"}]
     assert resp.data["total_budget_authority"] == LATE_GTAS_CALCULATIONS["total_budgetary_resources"]
@@ -155,6 +163,7 @@ def test_ignore_funding_for_unselected_defc(
 ):
     helpers.patch_datetime_now(monkeypatch, LATE_YEAR, EARLY_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL + "?def_codes=M,A")
     assert resp.data["funding"] == [{"amount": YEAR_2_GTAS_CALCULATIONS["total_budgetary_resources"], "def_code": "M"}]
     assert resp.data["total_budget_authority"] == YEAR_2_GTAS_CALCULATIONS["total_budgetary_resources"]
@@ -175,6 +184,7 @@ def test_ignore_funding_for_unselected_defc(
 def test_adds_budget_values(client, monkeypatch, helpers, defc_codes, basic_ref_data, other_budget_authority_gtas):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, EARLY_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["funding"] == [
         {"amount": OTHER_BUDGET_AUTHORITY_GTAS_CALCULATIONS["total_budgetary_resources"], "def_code": "M"}
@@ -190,6 +200,7 @@ def test_award_obligation_adds_values(
 ):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, LATE_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["spending"]["award_obligations"] == Decimal("2.3")
     assert resp.data["spending"]["award_outlays"] == Decimal("1.15")
@@ -201,6 +212,7 @@ def test_faba_excludes_non_selected_defc(
 ):
     helpers.patch_datetime_now(monkeypatch, EARLY_YEAR, LATE_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL + "?def_codes=M,N")
     assert resp.data["spending"]["award_obligations"] == Decimal("1.6")
     assert resp.data["spending"]["award_outlays"] == Decimal("0.8")
@@ -212,6 +224,7 @@ def test_award_outlays_sum_multiple_years(
 ):
     helpers.patch_datetime_now(monkeypatch, LATE_YEAR, EARLY_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["spending"]["award_outlays"] == Decimal("1.15")
 
@@ -222,6 +235,7 @@ def test_award_outlays_doesnt_sum_multiple_periods(
 ):
     helpers.patch_datetime_now(monkeypatch, LATE_YEAR, LATE_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["spending"]["award_outlays"] == Decimal("0.8")
 
@@ -232,6 +246,7 @@ def test_award_outlays_ignores_future_faba(
 ):
     helpers.patch_datetime_now(monkeypatch, LATE_YEAR, LATE_MONTH, 25)
     helpers.reset_dabs_cache()
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(OVERVIEW_URL)
     assert resp.data["spending"]["award_outlays"] == Decimal("0.35")
 
@@ -268,6 +283,7 @@ def test_dol_defc_v_special_case(client, monkeypatch, helpers, defc_codes, basic
         {"disaster_emergency_fund_id": "V", "treasury_account_identifier": None, "tas_rendering_label": None}
     )
     mommy.make("references.GTASSF133Balances", fiscal_year=2022, fiscal_period=5, **defc_v_values)
+    helpers.refresh_disaster_spending_rollup()
     resp = client.get(f"{OVERVIEW_URL}?def_codes=V")
     assert resp.data == {
         "funding": [{"amount": 599334.0, "def_code": "V"}],
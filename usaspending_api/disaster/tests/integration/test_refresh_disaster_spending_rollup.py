@@ -0,0 +1,18 @@
+import pytest
+
+from django.core.management import call_command
+
+from usaspending_api.broker.helpers.last_load_date import get_last_load_date
+
+
+@pytest.mark.django_db
+def test_refresh_disaster_spending_rollup_records_load_date():
+    assert get_last_load_date("disaster_spending_rollup") is None
+
+    call_command("refresh_disaster_spending_rollup")
+    first_load_date = get_last_load_date("disaster_spending_rollup")
+    assert first_load_date is not None
+
+    # Each refresh changes the API data version
+    call_command("refresh_disaster_spending_rollup")
+    assert get_last_load_date("disaster_spending_rollup") > first_load_date
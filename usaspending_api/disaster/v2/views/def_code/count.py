@@ -1,11 +1,9 @@
-from django.db.models import OuterRef, Q, Exists
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from usaspending_api.common.cache_decorator import cache_response
-from usaspending_api.disaster.v2.views.disaster_base import DisasterBase
-from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
-from usaspending_api.references.models import DisasterEmergencyFundCode
+from usaspending_api.disaster.v2.views.disaster_base import DisasterBase, filter_rollup_by_defc_closed_periods
+from usaspending_api.references.models import DisasterSpendingRollup
 
 
 class DefCodeCountViewSet(DisasterBase):
@@ -17,18 +15,13 @@ class DefCodeCountViewSet(DisasterBase):
 
     @cache_response()
     def post(self, request: Request) -> Response:
-        filters = [
-            Q(disaster_emergency_fund_id=OuterRef("pk")),
-            self.is_in_provided_def_codes,
-            self.all_closed_defc_submissions,
-            self.is_non_zero_total_spending,
-        ]
+        # A DEF Code is counted when any closed File B row of it has non-zero spending
         count = (
-            DisasterEmergencyFundCode.objects.annotate(
-                include=Exists(FinancialAccountsByProgramActivityObjectClass.objects.filter(*filters).values("pk"))
+            DisasterSpendingRollup.objects.filter(
+                filter_rollup_by_defc_closed_periods(), def_code__in=self.def_codes, non_zero_file_b_count__gt=0
             )
-            .filter(include=True)
-            .values("pk")
+            .values("def_code")
+            .distinct()
             .count()
         )
         return Response({"count": count})
@@ -1,14 +1,11 @@
-import json
-
 from datetime import date
 from django.db.models import Max, Q, F, Value, Case, When, Sum, Count
 from django.db.models.functions import Coalesce
 from django.http import HttpRequest
 from django.utils.functional import cached_property
 from django_cte import With
-from functools import lru_cache
 from rest_framework.views import APIView
-from typing import List
+from typing import List, Tuple
 
 from usaspending_api.awards.models.financial_accounts_by_awards import FinancialAccountsByAwards
 from usaspending_api.awards.v2.lookups.lookups import award_type_mapping, loan_type_mapping, assistance_type_mapping
@@ -16,8 +13,10 @@ from usaspending_api.common.containers import Bunch
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.helpers.date_helper import now
 from usaspending_api.common.helpers.fiscal_year_helpers import generate_fiscal_year_and_month
+from usaspending_api.common.parsers import get_request_payload
+from usaspending_api.common.reference_data_cache import reference_data_cache
 from usaspending_api.common.validator import customize_pagination_with_sort_columns, TinyShield
-from usaspending_api.references.models import DisasterEmergencyFundCode
+from usaspending_api.references.models import DisasterEmergencyFundCode, DisasterSpendingRollup
 from usaspending_api.references.models.gtas_sf133_balances import GTASSF133Balances
 from usaspending_api.submissions.helpers import get_last_closed_submission_date
 from usaspending_api.submissions.models import DABSSubmissionWindowSchedule
@@ -28,16 +27,30 @@ REPORTING_PERIOD_MIN_DATE = date(2020, 4, 1)
 REPORTING_PERIOD_MIN_YEAR, REPORTING_PERIOD_MIN_MONTH = generate_fiscal_year_and_month(REPORTING_PERIOD_MIN_DATE)
 
 
-def latest_gtas_of_each_year_queryset():
+def latest_monthly_periods() -> Q:
+    """Return Django Q for the latest closed monthly period of each fiscal year"""
     q = Q()
     for sub in final_submissions_for_all_fy():
         if not sub.is_quarter:
             q |= Q(fiscal_year=sub.fiscal_year) & Q(fiscal_period=sub.fiscal_period)
+    return q
+
+
+def latest_gtas_of_each_year_queryset():
+    q = latest_monthly_periods()
     if not q:
         return GTASSF133Balances.objects.none()
     return GTASSF133Balances.objects.filter(q)
 
 
+def latest_gtas_rollup_of_each_year_queryset():
+    """Rollup rows holding the GTAS totals of latest_gtas_of_each_year_queryset()"""
+    q = latest_monthly_periods()
+    if not q:
+        return DisasterSpendingRollup.objects.none()
+    return DisasterSpendingRollup.objects.filter(q, is_quarter=False, total_budget_authority__isnull=False)
+
+
 def latest_faba_of_each_year_queryset() -> FinancialAccountsByAwards.objects:
     q = filter_by_latest_closed_periods()
     if not q:
@@ -57,15 +70,12 @@ def filter_by_defc_closed_periods() -> Q:
     for FY2020 P07 (Apr 1, 2020) and after
     """
     q = Q()
-    for sub in final_submissions_for_all_fy():
-        if (
-            sub.fiscal_year == REPORTING_PERIOD_MIN_YEAR and sub.fiscal_period >= REPORTING_PERIOD_MIN_MONTH
-        ) or sub.fiscal_year > REPORTING_PERIOD_MIN_YEAR:
-            q |= (
-                Q(submission__reporting_fiscal_year=sub.fiscal_year)
-                & Q(submission__quarter_format_flag=sub.is_quarter)
-                & Q(submission__reporting_fiscal_period__lte=sub.fiscal_period)
-            )
+    for sub in final_defc_submissions_for_all_fy():
+        q |= (
+            Q(submission__reporting_fiscal_year=sub.fiscal_year)
+            & Q(submission__quarter_format_flag=sub.is_quarter)
+            & Q(submission__reporting_fiscal_period__lte=sub.fiscal_period)
+        )
     if not q:
         # Edgecase not expected in production. If there are no DABS between
         # FY2020 P07 (Apr 1, 2020) and now() then ensure nothing is returned
@@ -73,13 +83,36 @@ def filter_by_defc_closed_periods() -> Q:
     return q & Q(submission__reporting_period_start__gte=str(REPORTING_PERIOD_MIN_DATE))
 
 
-@lru_cache(maxsize=1)
-def final_submissions_for_all_fy() -> List[tuple]:
+def filter_rollup_by_defc_closed_periods() -> Q:
+    """
+    Equivalent of filter_by_defc_closed_periods() for DisasterSpendingRollup rows; the rollup
+    only counts submission data for FY2020 P07 (Apr 1, 2020) and after
+    """
+    q = Q()
+    for sub in final_defc_submissions_for_all_fy():
+        q |= Q(fiscal_year=sub.fiscal_year) & Q(is_quarter=sub.is_quarter) & Q(fiscal_period__lte=sub.fiscal_period)
+    if not q:
+        q = Q(pk__isnull=True)
+    return q
+
+
+def final_defc_submissions_for_all_fy() -> List[tuple]:
+    """Returns the final_submissions_for_all_fy() that can include DEF Codes (FY2020 P07 and after)"""
+    return [
+        sub
+        for sub in final_submissions_for_all_fy()
+        if (sub.fiscal_year == REPORTING_PERIOD_MIN_YEAR and sub.fiscal_period >= REPORTING_PERIOD_MIN_MONTH)
+        or sub.fiscal_year > REPORTING_PERIOD_MIN_YEAR
+    ]
+
+
+@reference_data_cache()
+def final_submissions_for_all_fy() -> Tuple[tuple, ...]:
     """
     Returns a list the latest monthly and quarterly submission for each
     fiscal year IF it is "closed" aka ready for display on USAspending.gov
     """
-    return (
+    return tuple(
         DABSSubmissionWindowSchedule.objects.filter(submission_reveal_date__lte=now())
         .values("submission_fiscal_year", "is_quarter")
         .annotate(fiscal_year=F("submission_fiscal_year"), fiscal_period=Max("submission_fiscal_month"))
@@ -87,6 +120,12 @@ def final_submissions_for_all_fy() -> List[tuple]:
     )
 
 
+@reference_data_cache()
+def all_def_codes() -> Tuple[str, ...]:
+    """Returns every DEF Code, sorted"""
+    return tuple(sorted(DisasterEmergencyFundCode.objects.values_list("code", flat=True)))
+
+
 class DisasterBase(APIView):
     required_filters = ["def_codes"]
 
@@ -95,9 +134,9 @@ class DisasterBase(APIView):
         """Return True if an endpoint was requested with filter.award_type_codes"""
 
         # NOTE: The point at which this is used in the request life cycle, it has not been post-processed to include
-        # a POST or data attribute. Must get payload from body
-        if request and request.body:
-            body_json = json.loads(request.body)
+        # a POST or data attribute. The payload parsed here is reused by DRF for request.data
+        if request:
+            body_json = get_request_payload(request)
             if "filter" in body_json and "award_type_codes" in body_json["filter"]:
                 return True
         return False
@@ -107,23 +146,22 @@ class DisasterBase(APIView):
         """Return True if an endpoint was requested with spending_type = award"""
 
         # NOTE: The point at which this is used in the request life cycle, it has not been post-processed to include
-        # a POST or data attribute. Must get payload from body
-        if request and request.body:
-            body_json = json.loads(request.body)
+        # a POST or data attribute. The payload parsed here is reused by DRF for request.data
+        if request:
+            body_json = get_request_payload(request)
             if body_json.get("spending_type", "") == "award":
                 return True
         return False
 
     @cached_property
     def filters(self):
-        all_def_codes = sorted(DisasterEmergencyFundCode.objects.values_list("code", flat=True))
         object_keys_lookup = {
             "def_codes": {
                 "key": "filter|def_codes",
                 "name": "def_codes",
                 "type": "array",
                 "array_type": "enum",
-                "enum_values": all_def_codes,
+                "enum_values": list(all_def_codes()),
                 "allow_nulls": False,
                 "optional": False,
             },
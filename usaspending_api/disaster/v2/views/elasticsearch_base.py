@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from django.conf import settings
 from django.utils.functional import cached_property
@@ -9,14 +9,16 @@ from rest_framework.response import Response
 
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.data_classes import Pagination
-from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch
+from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch, BatchedSearches
 from usaspending_api.common.exceptions import ForbiddenException
 from usaspending_api.common.helpers.generic_helper import get_pagination_metadata
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.disaster.v2.views.disaster_base import DisasterBase, _BasePaginationMixin
 from usaspending_api.search.v2.elasticsearch_helper import (
+    add_unique_terms_count_aggregation,
     get_number_of_unique_terms_for_awards,
     get_summed_value_as_float,
+    get_unique_terms_count_from_response,
 )
 
 
@@ -67,6 +69,7 @@ class ElasticsearchDisasterBase(DisasterBase):
 
     filter_query: ES_Q
     bucket_count: int
+    sub_bucket_count: Optional[int]
 
     pagination: Pagination  # Overwritten by a pagination mixin
     sort_column_mapping: Dict[str, str]  # Overwritten by a pagination mixin
@@ -88,9 +91,7 @@ class ElasticsearchDisasterBase(DisasterBase):
             non_zero_queries.append(ES_Q("range", **{field: {"lt": 0}}))
         self.filter_query.must.append(ES_Q("bool", should=non_zero_queries, minimum_should_match=1))
 
-        self.bucket_count = get_number_of_unique_terms_for_awards(
-            self.filter_query, f"{self.agg_key.replace('.keyword', '')}.hash"
-        )
+        self.bucket_count, self.sub_bucket_count = self.get_bucket_counts()
 
         messages = []
         if self.pagination.sort_key in ("id", "code"):
@@ -118,6 +119,28 @@ class ElasticsearchDisasterBase(DisasterBase):
 
         return Response(response)
 
+    def get_bucket_counts(self) -> Tuple[int, Optional[int]]:
+        """
+        Count the unique values of the agg_key and, if provided, of the sub_agg_key (among records with an agg_key,
+        matching the filters of the final aggregation). Both counts are fetched in a single round-trip to the cluster
+        """
+        count_field = f"{self.agg_key.replace('.keyword', '')}.hash"
+        if not self.sub_agg_key:
+            return get_number_of_unique_terms_for_awards(self.filter_query, count_field), None
+
+        bucket_count_search = add_unique_terms_count_aggregation(AwardSearch().filter(self.filter_query), count_field)
+        sub_bucket_count_search = add_unique_terms_count_aggregation(
+            AwardSearch().filter(self.filter_query).filter(ES_Q("exists", field=self.agg_key)),
+            f"{self.sub_agg_key}.hash",
+        )
+        bucket_count_response, sub_bucket_count_response = (
+            BatchedSearches().add(bucket_count_search).add(sub_bucket_count_search).handle_execute()
+        )
+        return (
+            get_unique_terms_count_from_response(bucket_count_response),
+            get_unique_terms_count_from_response(sub_bucket_count_response),
+        )
+
     @abstractmethod
     def build_elasticsearch_result(self, info_buckets: List[dict]) -> List[dict]:
         pass
@@ -211,9 +234,8 @@ class ElasticsearchDisasterBase(DisasterBase):
 
         Example: Subtier Agency spending rolled up to Toptier Agency spending
         """
-        sub_bucket_count = get_number_of_unique_terms_for_awards(self.filter_query, f"{self.sub_agg_key}.hash")
-        size = sub_bucket_count
-        shard_size = sub_bucket_count + 100
+        size = self.sub_bucket_count
+        shard_size = self.sub_bucket_count + 100
         sub_group_by_sub_agg_key_values = {}
 
         if shard_size > 10000:
@@ -1,24 +1,25 @@
 from decimal import Decimal
 from typing import Optional
 
-from django.db.models import Sum, F
+from django.db.models import Sum
 from rest_framework.response import Response
 
-from usaspending_api.awards.models.financial_accounts_by_awards import FinancialAccountsByAwards
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.disaster.v2.views.disaster_base import (
     DisasterBase,
-    filter_by_defc_closed_periods,
-    latest_faba_of_each_year_queryset,
+    all_def_codes,
+    filter_rollup_by_defc_closed_periods,
     latest_gtas_of_each_year_queryset,
+    latest_gtas_rollup_of_each_year_queryset,
 )
-from usaspending_api.references.models import DisasterEmergencyFundCode, GTASSF133Balances
+from usaspending_api.references.models import DisasterSpendingRollup, GTASSF133Balances
 
 
 class OverviewViewSet(DisasterBase):
     """
-    This route gathers aggregate data about Disaster spending
+    This route gathers aggregate data about Disaster spending.  Funding and spending totals are
+    read from the DisasterSpendingRollup table rather than aggregated from GTAS and File C.
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/disaster/overview.md"
@@ -40,7 +41,6 @@ class OverviewViewSet(DisasterBase):
         )
 
     def _parse_and_validate(self, request):
-        all_def_codes = sorted(list(DisasterEmergencyFundCode.objects.values_list("code", flat=True)))
         models = [
             {
                 "key": "def_codes",
@@ -49,28 +49,19 @@ class OverviewViewSet(DisasterBase):
                 "text_type": "search",
                 "allow_nulls": True,
                 "optional": True,
-                "default": ",".join(all_def_codes),
+                "default": ",".join(all_def_codes()),
             },
         ]
         return TinyShield(models).block(request)
 
     def funding(self):
         funding = list(
-            latest_gtas_of_each_year_queryset()
-            .filter(disaster_emergency_fund__in=self.defc)
-            .values("disaster_emergency_fund")
-            .annotate(
-                def_code=F("disaster_emergency_fund"),
-                amount=(
-                    Sum("total_budgetary_resources_cpe")
-                    - (
-                        Sum("budget_authority_unobligated_balance_brought_forward_cpe")
-                        + Sum("deobligations_or_recoveries_or_refunds_from_prior_year_cpe")
-                        + Sum("prior_year_paid_obligation_recoveries")
-                    )
-                ),
-            )
+            latest_gtas_rollup_of_each_year_queryset()
+            .filter(def_code__in=self.defc)
+            .values("def_code")
+            .annotate(amount=Sum("total_budget_authority"))
             .values("def_code", "amount")
+            .order_by("def_code")
         )
 
         total_budget_authority = self.sum_values(funding, "amount")
@@ -82,47 +73,24 @@ class OverviewViewSet(DisasterBase):
 
     def award_obligations(self):
         return (
-            FinancialAccountsByAwards.objects.filter(
-                filter_by_defc_closed_periods(), disaster_emergency_fund__in=self.defc
-            )
-            .values("transaction_obligated_amount")
-            .aggregate(total=Sum("transaction_obligated_amount"))["total"]
+            DisasterSpendingRollup.objects.filter(
+                filter_rollup_by_defc_closed_periods(), def_code__in=self.defc
+            ).aggregate(total=Sum("award_obligations"))["total"]
             or 0.0
         )
 
     def award_outlays(self):
+        # The rollup only holds award outlays of final balance submissions
         return (
-            latest_faba_of_each_year_queryset()
-            .filter(disaster_emergency_fund__in=self.defc)
-            .aggregate(
-                total=(
-                    Sum("gross_outlay_amount_by_award_cpe")
-                    + Sum("ussgl487200_down_adj_pri_ppaid_undel_orders_oblig_refund_cpe")
-                    + Sum("ussgl497200_down_adj_pri_paid_deliv_orders_oblig_refund_cpe")
-                )
-            )["total"]
-        ) or 0.0
+            DisasterSpendingRollup.objects.filter(def_code__in=self.defc).aggregate(total=Sum("award_outlays"))["total"]
+            or 0.0
+        )
 
     def totals(self) -> dict:
-        obligation_values = [
-            "obligations_incurred_total_cpe",
-            "deobligations_or_recoveries_or_refunds_from_prior_year_cpe",
-        ]
-        outlay_values = ["gross_outlay_amount_by_tas_cpe", "anticipated_prior_year_obligation_recoveries"]
-
         results = (
-            latest_gtas_of_each_year_queryset()
-            .filter(disaster_emergency_fund__in=self.defc)
-            .values(*obligation_values, *outlay_values)
-            .aggregate(
-                obligation_totals=(
-                    Sum("obligations_incurred_total_cpe")
-                    - Sum("deobligations_or_recoveries_or_refunds_from_prior_year_cpe")
-                ),
-                outlay_totals=(
-                    Sum("gross_outlay_amount_by_tas_cpe") - Sum("anticipated_prior_year_obligation_recoveries")
-                ),
-            )
+            latest_gtas_rollup_of_each_year_queryset()
+            .filter(def_code__in=self.defc)
+            .aggregate(obligation_totals=Sum("total_obligations"), outlay_totals=Sum("total_outlays"))
         )
 
         return {
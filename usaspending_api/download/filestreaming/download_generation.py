@@ -22,7 +22,7 @@ from usaspending_api.download.models.download_job_lookup import DownloadJobLooku
 from usaspending_api.settings import MAX_DOWNLOAD_LIMIT
 from usaspending_api.awards.v2.filters.filter_helpers import add_date_range_comparison_types
 from usaspending_api.awards.v2.lookups.lookups import contract_type_mapping, assistance_type_mapping, idv_type_mapping
-from usaspending_api.common.csv_helpers import count_rows_in_delimited_file, partition_large_delimited_file
+from usaspending_api.common.csv_helpers import partition_large_delimited_file
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.orm_helpers import generate_raw_quoted_query
 from usaspending_api.common.helpers.s3_helpers import multipart_upload
@@ -33,7 +33,12 @@ from usaspending_api.download.download_utils import construct_data_date_range
 from usaspending_api.download.filestreaming import NAMING_CONFLICT_DISCRIMINATOR
 from usaspending_api.download.filestreaming.download_source import DownloadSource
 from usaspending_api.download.filestreaming.file_description import build_file_description, save_file_description
-from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+from usaspending_api.download.filestreaming.zip_file import (
+    ParallelZipWriter,
+    append_files_to_zip_file,
+    split_delimited_data_to_files,
+    stream_delimited_data_to_zip_file,
+)
 from usaspending_api.download.helpers import verify_requested_columns_available, write_to_download_log as write_to_log
 from usaspending_api.download.lookups import JOB_STATUS_DICT, VALUE_MAPPINGS, FILE_FORMATS
 from usaspending_api.download.models.download_job import DownloadJob
@@ -84,18 +89,40 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
 
         # Generate sources from the JSON request object
         sources = get_download_sources(json_request, download_job, origination)
-        for source in sources:
-            # Parse and write data to the file; if there are no matching columns for a source then add an empty file
-            source_column_count = len(source.columns(columns))
-            if source_column_count == 0:
-                create_empty_data_file(
-                    source, download_job, working_dir, piid, assistance_id, zip_file_path, file_format
-                )
-            else:
-                download_job.number_of_columns += source_column_count
-                parse_source(
-                    source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format
-                )
+        if settings.DOWNLOAD_PARALLEL_WORKERS > 1:
+            parse_sources_in_parallel(
+                sources,
+                columns,
+                download_job,
+                working_dir,
+                piid,
+                assistance_id,
+                zip_file_path,
+                limit,
+                file_format,
+                settings.DOWNLOAD_PARALLEL_WORKERS,
+            )
+        else:
+            for source in sources:
+                # Parse and write data to the file; if there are no matching columns for a source then add an empty file
+                source_column_count = len(source.columns(columns))
+                if source_column_count == 0:
+                    create_empty_data_file(
+                        source, download_job, working_dir, piid, assistance_id, zip_file_path, file_format
+                    )
+                else:
+                    download_job.number_of_columns += source_column_count
+                    parse_source(
+                        source,
+                        columns,
+                        download_job,
+                        working_dir,
+                        piid,
+                        assistance_id,
+                        zip_file_path,
+                        limit,
+                        file_format,
+                    )
         include_data_dictionary = json_request.get("include_data_dictionary")
         if include_data_dictionary:
             add_data_dictionary_to_zip(working_dir, zip_file_path)
@@ -306,13 +333,94 @@ def build_data_file_name(source, download_job, piid, assistance_id):
 
 def parse_source(source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format):
     """Write to delimited text file(s) and zip file(s) using the source data"""
+    source_export = prepare_source_export(source, columns, download_job, piid, assistance_id, limit, file_format)
 
+    start_time = time.perf_counter()
+    try:
+        psql_process, row_count = start_source_export(source, source_export, download_job, zip_file_path, file_format)
+        download_job.number_of_rows += wait_for_source_export(psql_process, row_count, start_time, download_job)
+        download_job.save()
+    finally:
+        remove_source_export(source_export)
+
+
+def parse_sources_in_parallel(
+    sources, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format, max_workers
+):
+    """
+    Same as calling parse_source for each of the sources, but runs up to max_workers of their psql exports at the same
+    time, each writing its partitions uncompressed into its own directory in working_dir. The partitions of finished
+    exports are compressed up to max_workers at a time while the other exports run, and are written into the zip file
+    in the order of the sources.
+    """
+    source_exports = []
+    running_exports = []
+    try:
+        for index, source in enumerate(sources):
+            partitions_dir = os.path.join(working_dir, f"source_{index}")
+            os.mkdir(partitions_dir)
+            # If there are no matching columns for a source then add an empty file
+            source_column_count = len(source.columns(columns))
+            if source_column_count == 0:
+                source_export = None
+                write_empty_data_file(source, download_job, partitions_dir, piid, assistance_id, file_format)
+            else:
+                download_job.number_of_columns += source_column_count
+                source_export = prepare_source_export(
+                    source, columns, download_job, piid, assistance_id, limit, file_format
+                )
+            source_exports.append((source, source_export, partitions_dir))
+
+        start_time = time.perf_counter()
+        exports_to_start = [source_export for source_export in source_exports if source_export[1] is not None]
+        with ParallelZipWriter(zip_file_path, max_workers) as zip_writer:
+            for source, source_export, partitions_dir in source_exports:
+                while exports_to_start and len(running_exports) < max_workers:
+                    export_source, export, export_partitions_dir = exports_to_start.pop(0)
+                    running_exports.append(
+                        start_source_export(
+                            export_source, export, download_job, zip_file_path, file_format, export_partitions_dir
+                        )
+                    )
+                if source_export is not None:
+                    download_job.number_of_rows += wait_for_source_export(*running_exports[0], start_time, download_job)
+                    running_exports.pop(0)
+                zip_writer.add_files(list_partition_files(partitions_dir))
+        download_job.save()
+    except BaseException:
+        # Stop the other exports so they don't keep writing into the working directory of a failed download
+        for psql_process, _ in running_exports:
+            if psql_process.is_alive():
+                write_to_log(
+                    message=f"Attempting to terminate process (pid {psql_process.pid})",
+                    download_job=download_job,
+                    is_error=True,
+                )
+                psql_process.terminate()
+            psql_process.join()
+        raise
+    finally:
+        for _, source_export, _ in source_exports:
+            if source_export is not None:
+                remove_source_export(source_export)
+
+
+def list_partition_files(partitions_dir):
+    """
+    Return the paths of the files in partitions_dir in the order of their partition numbers. The partitions of a
+    source only differ by their number, so ordering them by length first puts e.g. "_9.csv" before "_10.csv".
+    """
+    file_names = sorted(os.listdir(partitions_dir), key=lambda file_name: (len(file_name), file_name))
+    return [os.path.join(partitions_dir, file_name) for file_name in file_names]
+
+
+def prepare_source_export(source, columns, download_job, piid, assistance_id, limit, file_format):
+    """Name the source's data file and save its export query to a temporary file"""
     data_file_name = build_data_file_name(source, download_job, piid, assistance_id)
 
     source_query = source.row_emitter(columns)
     extension = FILE_FORMATS[file_format]["extension"]
     source.file_name = f"{data_file_name}.{extension}"
-    source_path = os.path.join(working_dir, source.file_name)
 
     write_to_log(message=f"Preparing to download data as {source.file_name}", download_job=download_job)
 
@@ -320,40 +428,33 @@ def parse_source(source, columns, download_job, working_dir, piid, assistance_id
     export_query = generate_export_query(source_query, limit, source, columns, file_format)
     temp_file, temp_file_path = generate_export_query_temp_file(export_query, download_job)
 
-    start_time = time.perf_counter()
-    try:
-        # Create a separate process to run the PSQL command; wait
-        psql_process = multiprocessing.Process(target=execute_psql, args=(temp_file_path, source_path, download_job))
-        write_to_log(message=f"Running {source.file_name} using psql", download_job=download_job)
-        psql_process.start()
-        wait_for_process(psql_process, start_time, download_job)
+    return data_file_name, temp_file, temp_file_path
 
-        delim = FILE_FORMATS[file_format]["delimiter"]
 
-        # Log how many rows we have
-        write_to_log(message="Counting rows in delimited text file", download_job=download_job)
-        try:
-            number_of_rows = count_rows_in_delimited_file(filename=source_path, has_header=True, delimiter=delim)
-            download_job.number_of_rows += number_of_rows
-            write_to_log(message=f"Number of rows in text file: {number_of_rows}", download_job=download_job)
-        except Exception:
-            write_to_log(
-                message="Unable to obtain delimited text file line count", is_error=True, download_job=download_job
-            )
-        download_job.save()
+def start_source_export(source, source_export, download_job, zip_file_path, file_format, partitions_dir=None):
+    """Create a separate process to run the PSQL command, streaming its output into partitions of the zip"""
+    data_file_name, _, temp_file_path = source_export
+    row_count = multiprocessing.Value("q", 0)
+    psql_process = multiprocessing.Process(
+        target=execute_psql_to_zip_file,
+        args=(temp_file_path, zip_file_path, data_file_name, file_format, download_job, row_count, partitions_dir),
+    )
+    write_to_log(message=f"Running {source.file_name} using psql", download_job=download_job)
+    psql_process.start()
+    return psql_process, row_count
 
-        # Create a separate process to split the large data files into smaller file and write to zip; wait
-        zip_process = multiprocessing.Process(
-            target=split_and_zip_data_files,
-            args=(zip_file_path, source_path, data_file_name, file_format, download_job),
-        )
-        zip_process.start()
-        wait_for_process(zip_process, start_time, download_job)
-        download_job.save()
-    except Exception as e:
-        raise e
-    finally:
-        # Remove temporary files
+
+def wait_for_source_export(psql_process, row_count, start_time, download_job):
+    """Wait for a process started by start_source_export and return the number of rows it wrote"""
+    wait_for_process(psql_process, start_time, download_job)
+    write_to_log(message=f"Number of rows in text file: {row_count.value}", download_job=download_job)
+    return row_count.value
+
+
+def remove_source_export(source_export):
+    """Remove the temporary file of an export query (if it still exists)"""
+    _, temp_file, temp_file_path = source_export
+    if os.path.exists(temp_file_path):
         os.close(temp_file)
         os.remove(temp_file_path)
 
@@ -615,13 +716,7 @@ def execute_psql(temp_sql_file_path, source_path, download_job):
     ):
         try:
             log_time = time.perf_counter()
-            temp_env = os.environ.copy()
-            if download_job and not download_job.monthly_download:
-                # Since terminating the process isn't guaranteed to end the DB statement, add timeout to client connection
-                temp_env["PGOPTIONS"] = (
-                    f"--statement-timeout={settings.DOWNLOAD_DB_TIMEOUT_IN_HOURS}h "
-                    f"--work-mem={settings.DOWNLOAD_DB_WORK_MEM_IN_MB}MB"
-                )
+            temp_env = _psql_environment(download_job)
 
             cat_command = subprocess.Popen(["cat", temp_sql_file_path], stdout=subprocess.PIPE)
             subprocess.check_output(
@@ -648,6 +743,92 @@ def execute_psql(temp_sql_file_path, source_path, download_job):
             raise e
 
 
+def execute_psql_to_zip_file(
+    temp_sql_file_path, zip_file_path, data_file_name, file_format, download_job, row_count, partitions_dir=None
+):
+    """
+    Executes a single PSQL command within its own Subprocess, streaming its output directly into the zip file as
+    partitions of at most EXCEL_ROW_LIMIT rows, and sets the number of rows written on the shared row_count value.
+
+    With a partitions_dir, the partitions are instead written there uncompressed for the caller to add to the zip file.
+    """
+    download_sql = Path(temp_sql_file_path).read_text()
+    if download_sql.startswith("\\COPY"):
+        # Trace library parses the SQL, but cannot understand the psql-specific \COPY command. Use standard COPY here.
+        download_sql = download_sql[1:]
+    # Stack 3 context managers: (1) psql code, (2) Download replica query, (3) (same) Postgres query
+    with SubprocessTrace(
+        name=f"job.{JOB_TYPE}.download.psql",
+        service="bulk-download",
+        resource=download_sql,
+        span_type=SpanTypes.SQL,
+        zip_file_path=zip_file_path,
+    ) as span, tracer.trace(
+        name="postgres.query",
+        service=f"{settings.DOWNLOAD_DATABASE_ALIAS}db",
+        resource=download_sql,
+        span_type=SpanTypes.SQL,
+    ), tracer.trace(
+        name="postgres.query", service="postgres", resource=download_sql, span_type=SpanTypes.SQL
+    ):
+        try:
+            log_time = time.perf_counter()
+            extension = FILE_FORMATS[file_format]["extension"]
+
+            with open(temp_sql_file_path) as sql_file, tempfile.TemporaryFile() as psql_errors:
+                psql_command = subprocess.Popen(
+                    ["psql", "-q", retrieve_db_string(), "-v", "ON_ERROR_STOP=1"],
+                    stdin=sql_file,
+                    stdout=subprocess.PIPE,
+                    stderr=psql_errors,
+                    env=_psql_environment(download_job),
+                )
+                try:
+                    output_template = f"{data_file_name}_%s.{extension}"
+                    if partitions_dir:
+                        number_of_rows, list_of_files = split_delimited_data_to_files(
+                            psql_command.stdout, partitions_dir, output_template, EXCEL_ROW_LIMIT
+                        )
+                    else:
+                        number_of_rows, list_of_files = stream_delimited_data_to_zip_file(
+                            psql_command.stdout, zip_file_path, output_template, EXCEL_ROW_LIMIT
+                        )
+                finally:
+                    psql_command.stdout.close()
+                    return_code = psql_command.wait()
+                if return_code != 0:
+                    psql_errors.seek(0)
+                    raise subprocess.CalledProcessError(return_code, "psql", output=psql_errors.read())
+
+            row_count.value = number_of_rows
+            span.set_tag("file_parts", len(list_of_files))
+            duration = time.perf_counter() - log_time
+            write_to_log(
+                message=f"Wrote {number_of_rows} rows as {len(list_of_files)} files into "
+                f"{os.path.basename(zip_file_path)}, took {duration:.4f} seconds",
+                download_job=download_job,
+            )
+        except subprocess.CalledProcessError as e:
+            write_to_log(message=f"PSQL Error: {e.output.decode()}", is_error=True, download_job=download_job)
+            raise e
+        except Exception as e:
+            write_to_log(message=e, is_error=True, download_job=download_job)
+            sql = Path(temp_sql_file_path).read_text()
+            write_to_log(message=f"Faulty SQL: {sql}", is_error=True, download_job=download_job)
+            raise e
+
+
+def _psql_environment(download_job):
+    temp_env = os.environ.copy()
+    if download_job and not download_job.monthly_download:
+        # Since terminating the process isn't guaranteed to end the DB statement, add timeout to client connection
+        temp_env["PGOPTIONS"] = (
+            f"--statement-timeout={settings.DOWNLOAD_DB_TIMEOUT_IN_HOURS}h "
+            f"--work-mem={settings.DOWNLOAD_DB_WORK_MEM_IN_MB}MB"
+        )
+    return temp_env
+
+
 def retrieve_db_string():
     """It is necessary for this to be a function so the test suite can mock the connection string"""
     return settings.DOWNLOAD_DATABASE_URL
@@ -700,6 +881,13 @@ def create_empty_data_file(
     zip_file_path: str,
     file_format: str,
 ) -> None:
+    source_path = write_empty_data_file(source, download_job, working_dir, piid, assistance_id, file_format)
+    append_files_to_zip_file([source_path], zip_file_path)
+
+
+def write_empty_data_file(
+    source: DownloadSource, download_job: DownloadJob, working_dir: str, piid: str, assistance_id: str, file_format: str
+) -> str:
     data_file_name = build_data_file_name(source, download_job, piid, assistance_id)
     extension = FILE_FORMATS[file_format]["extension"]
     source.file_name = f"{data_file_name}.{extension}"
@@ -708,4 +896,4 @@ def create_empty_data_file(
         message=f"Skipping download of {source.file_name} due to no valid columns provided", download_job=download_job
     )
     Path(source_path).touch()
-    append_files_to_zip_file([source_path], zip_file_path)
+    return source_path
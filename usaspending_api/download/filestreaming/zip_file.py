@@ -1,5 +1,33 @@
+import io
 import os
+import struct
+import time
 import zipfile
+import zlib
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, List, Tuple
+
+# Bytes buffered before each write to a file streamed into, or copied between, zip archives
+STREAMING_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Records of the ZIP file format written by ParallelZipWriter, as described in PKWARE's APPNOTE.TXT
+ZIP_LOCAL_FILE_HEADER = struct.Struct("<4sHHHHHIIIHH")
+ZIP_CENTRAL_DIRECTORY_HEADER = struct.Struct("<4sHHHHHHIIIHHHHHII")
+ZIP64_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4sQHHIIQQQQ")
+ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR = struct.Struct("<4sIQI")
+ZIP_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4sHHHHIIH")
+ZIP_VERSION = 20
+ZIP64_VERSION = 45
+ZIP_CREATED_ON_UNIX = 3
+ZIP_FLAG_UTF8_FILE_NAME = 0x800
+ZIP64_EXTRA_FIELD_ID = 0x0001
+
+# Same limits as the zipfile module: sizes and offsets above ZIP64_LIMIT and member counts above
+# ZIP_FILECOUNT_LIMIT are written in ZIP64 records
+ZIP64_LIMIT = (1 << 31) - 1
+ZIP_FILECOUNT_LIMIT = 0xFFFF
 
 
 def append_files_to_zip_file(file_paths, zip_file_path):
@@ -17,3 +45,290 @@ def append_files_to_zip_file(file_paths, zip_file_path):
         for file_path in file_paths:
             archive_name = os.path.basename(file_path)
             zip_file.write(file_path, archive_name)
+
+
+def stream_delimited_data_to_zip_file(
+    stream: BinaryIO, zip_file_path: str, output_name_template: str, row_limit: int
+) -> Tuple[int, List[str]]:
+    """
+    Write delimited data with a header row, read from a binary stream such as psql's stdout, directly into the zip
+    archive at zip_file_path as one or more compressed files of at most row_limit rows each. Each file repeats the
+    header and is named using the %s-style output_name_template and its partition number.
+
+    Returns the number of rows (not including headers) and the names of the files added to the archive.
+    """
+    archive_names = []
+    with zipfile.ZipFile(zip_file_path, "a", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zip_file:
+
+        def open_partition(partition_number):
+            archive_names.append(output_name_template % partition_number)
+            return io.BufferedWriter(
+                zip_file.open(archive_names[-1], "w", force_zip64=True), buffer_size=STREAMING_WRITE_BUFFER_SIZE
+            )
+
+        number_of_rows = _split_delimited_data(stream, row_limit, open_partition)
+
+    return number_of_rows, archive_names
+
+
+def split_delimited_data_to_files(
+    stream: BinaryIO, output_dir: str, output_name_template: str, row_limit: int
+) -> Tuple[int, List[str]]:
+    """
+    Same as stream_delimited_data_to_zip_file, but writes the partitions as uncompressed files in output_dir so
+    that they can be compressed at the same time. Returns the number of rows and the paths of the files.
+    """
+    file_paths = []
+
+    def open_partition(partition_number):
+        file_paths.append(os.path.join(output_dir, output_name_template % partition_number))
+        return open(file_paths[-1], "wb", buffering=STREAMING_WRITE_BUFFER_SIZE)
+
+    number_of_rows = _split_delimited_data(stream, row_limit, open_partition)
+
+    return number_of_rows, file_paths
+
+
+def _split_delimited_data(stream: BinaryIO, row_limit: int, open_partition: Callable[[int], BinaryIO]) -> int:
+    """
+    Copy delimited data with a header row from stream into partitions of at most row_limit rows, each opened with
+    open_partition(partition_number) and starting with the header. Returns the number of rows copied.
+
+    Rows are not parsed: the data is only split on line endings that aren't inside a quoted value, which are
+    found by tracking whether each line has an odd number of quote characters. This relies on the data being in
+    CSV format (as written by COPY ... WITH CSV) where all quotes in values are doubled.
+    """
+    number_of_rows = 0
+    lines = iter(stream)
+
+    header_lines = []
+    in_quotes = False
+    for line in lines:
+        header_lines.append(line)
+        if line.count(b'"') % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            break
+    header = b"".join(header_lines)
+
+    partition_number = 1
+    partition = open_partition(partition_number)
+    try:
+        partition.write(header)
+        rows_in_partition = 0
+        for line in lines:
+            if not in_quotes:  # This line starts a new row
+                if rows_in_partition == row_limit:
+                    partition.close()
+                    partition_number += 1
+                    partition = open_partition(partition_number)
+                    partition.write(header)
+                    rows_in_partition = 0
+                rows_in_partition += 1
+                number_of_rows += 1
+            partition.write(line)
+            if line.count(b'"') % 2:
+                in_quotes = not in_quotes
+    finally:
+        partition.close()
+
+    return number_of_rows
+
+
+class ParallelZipWriter:
+    """
+    Write a new zip archive at zip_file_path (replacing any file already there) from files that are compressed up
+    to max_workers at the same time, adding them to the archive in the order they were given to add_files().
+
+    The zipfile module compresses the members it writes one at a time and has no public API to add data that is
+    already compressed. Instead, each file is deflated with zlib on a thread pool (threads are enough since zlib
+    releases the GIL while compressing) into a temporary file next to it, and this writer adds that data to the
+    archive with the records described in the ZIP file format specification. The archive can then be read, or
+    appended to, with the zipfile module like any other.
+    """
+
+    def __init__(self, zip_file_path: str, max_workers: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._zip_file = open(zip_file_path, "wb")
+        self._compressing = deque()
+        self._central_directory = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_files(self, file_paths: List[str]) -> None:
+        """Start compressing the files and add those compressed (in order) so far to the archive"""
+        for file_path in file_paths:
+            future = self._executor.submit(_deflate_file, file_path, f"{file_path}.deflate")
+            self._compressing.append((file_path, future))
+        while self._compressing and self._compressing[0][1].done():
+            self._write_member(*self._compressing.popleft())
+
+    def close(self) -> None:
+        """Wait for the remaining files to be compressed, add them to the archive and finish it"""
+        try:
+            while self._compressing:
+                self._write_member(*self._compressing.popleft())
+            self._write_end_of_central_directory()
+        except BaseException:
+            self.abort()
+            raise
+        self._executor.shutdown()
+        self._zip_file.close()
+
+    def abort(self) -> None:
+        """Stop compressing files and remove their temporary files, leaving the archive incomplete"""
+        for _, future in self._compressing:
+            future.cancel()
+        self._executor.shutdown()
+        for file_path, _ in self._compressing:
+            if os.path.exists(f"{file_path}.deflate"):
+                os.remove(f"{file_path}.deflate")
+        self._compressing.clear()
+        self._zip_file.close()
+
+    def _write_member(self, file_path, future):
+        deflated_file_path = f"{file_path}.deflate"
+        try:
+            crc, file_size, compress_size = future.result()
+            file_stat = os.stat(file_path)
+
+            archive_name = os.path.basename(file_path)
+            try:
+                encoded_name, flags = archive_name.encode("ascii"), 0
+            except UnicodeEncodeError:
+                encoded_name, flags = archive_name.encode("utf-8"), ZIP_FLAG_UTF8_FILE_NAME
+            date_time = time.localtime(file_stat.st_mtime)
+            dos_date = max(date_time.tm_year - 1980, 0) << 9 | date_time.tm_mon << 5 | date_time.tm_mday
+            dos_time = date_time.tm_hour << 11 | date_time.tm_min << 5 | date_time.tm_sec // 2
+            header_offset = self._zip_file.tell()
+
+            # Sizes and offsets too large for their field are replaced by 0xFFFFFFFF and written in a ZIP64 extra field
+            local_extra = b""
+            local_sizes = (compress_size, file_size)
+            if file_size > ZIP64_LIMIT or compress_size > ZIP64_LIMIT:
+                local_extra = struct.pack("<HHQQ", ZIP64_EXTRA_FIELD_ID, 16, file_size, compress_size)
+                local_sizes = (0xFFFFFFFF, 0xFFFFFFFF)
+            zip64_values = [value for value in (file_size, compress_size, header_offset) if value > ZIP64_LIMIT]
+            central_extra = b""
+            if zip64_values:
+                central_extra = struct.pack(
+                    f"<HH{len(zip64_values)}Q", ZIP64_EXTRA_FIELD_ID, 8 * len(zip64_values), *zip64_values
+                )
+            version = ZIP64_VERSION if zip64_values else ZIP_VERSION
+
+            self._zip_file.write(
+                ZIP_LOCAL_FILE_HEADER.pack(
+                    b"PK\x03\x04",
+                    version,
+                    flags,
+                    zipfile.ZIP_DEFLATED,
+                    dos_time,
+                    dos_date,
+                    crc,
+                    *local_sizes,
+                    len(encoded_name),
+                    len(local_extra),
+                )
+            )
+            self._zip_file.write(encoded_name)
+            self._zip_file.write(local_extra)
+            with open(deflated_file_path, "rb") as deflated_file:
+                for data in iter(lambda: deflated_file.read(STREAMING_WRITE_BUFFER_SIZE), b""):
+                    self._zip_file.write(data)
+
+            self._central_directory.append(
+                ZIP_CENTRAL_DIRECTORY_HEADER.pack(
+                    b"PK\x01\x02",
+                    ZIP_CREATED_ON_UNIX << 8 | version,
+                    version,
+                    flags,
+                    zipfile.ZIP_DEFLATED,
+                    dos_time,
+                    dos_date,
+                    crc,
+                    compress_size if compress_size <= ZIP64_LIMIT else 0xFFFFFFFF,
+                    file_size if file_size <= ZIP64_LIMIT else 0xFFFFFFFF,
+                    len(encoded_name),
+                    len(central_extra),
+                    0,
+                    0,
+                    0,
+                    (file_stat.st_mode & 0xFFFF) << 16,
+                    header_offset if header_offset <= ZIP64_LIMIT else 0xFFFFFFFF,
+                )
+                + encoded_name
+                + central_extra
+            )
+        finally:
+            if os.path.exists(deflated_file_path):
+                os.remove(deflated_file_path)
+
+    def _write_end_of_central_directory(self):
+        central_directory_offset = self._zip_file.tell()
+        for central_directory_header in self._central_directory:
+            self._zip_file.write(central_directory_header)
+        central_directory_size = self._zip_file.tell() - central_directory_offset
+        member_count = len(self._central_directory)
+
+        if (
+            member_count > ZIP_FILECOUNT_LIMIT
+            or central_directory_offset > ZIP64_LIMIT
+            or central_directory_size > ZIP64_LIMIT
+        ):
+            zip64_end_offset = self._zip_file.tell()
+            self._zip_file.write(
+                ZIP64_END_OF_CENTRAL_DIRECTORY.pack(
+                    b"PK\x06\x06",
+                    ZIP64_END_OF_CENTRAL_DIRECTORY.size - 12,
+                    ZIP_CREATED_ON_UNIX << 8 | ZIP64_VERSION,
+                    ZIP64_VERSION,
+                    0,
+                    0,
+                    member_count,
+                    member_count,
+                    central_directory_size,
+                    central_directory_offset,
+                )
+            )
+            self._zip_file.write(ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR.pack(b"PK\x06\x07", 0, zip64_end_offset, 1))
+            member_count = min(member_count, 0xFFFF)
+            central_directory_offset = min(central_directory_offset, 0xFFFFFFFF)
+            central_directory_size = min(central_directory_size, 0xFFFFFFFF)
+
+        self._zip_file.write(
+            ZIP_END_OF_CENTRAL_DIRECTORY.pack(
+                b"PK\x05\x06",
+                0,
+                0,
+                member_count,
+                member_count,
+                central_directory_size,
+                central_directory_offset,
+                0,
+            )
+        )
+
+
+def _deflate_file(file_path: str, deflated_file_path: str) -> Tuple[int, int, int]:
+    """
+    Write the file's data deflated (without zlib's header and checksum, as stored in zip archives) to
+    deflated_file_path. Returns the CRC-32 and size of the file's data and the size of the deflated data.
+    """
+    crc = 0
+    file_size = 0
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    with open(file_path, "rb") as source, open(deflated_file_path, "wb") as dest:
+        for data in iter(lambda: source.read(STREAMING_WRITE_BUFFER_SIZE), b""):
+            crc = zlib.crc32(data, crc)
+            file_size += len(data)
+            dest.write(compressor.compress(data))
+        dest.write(compressor.flush())
+        compress_size = dest.tell()
+    return crc, file_size, compress_size
@@ -0,0 +1,106 @@
+import logging
+import multiprocessing as mp
+import os
+import psutil
+
+from django.conf import settings
+from typing import Optional
+
+from usaspending_api.common.elasticsearch.search_wrappers import TransactionSearch
+from usaspending_api.common.query_with_filters import QueryWithFilters
+
+logger = logging.getLogger(__name__)
+
+ESTIMATED_ROWS_MESSAGE_ATTRIBUTE = "estimated_rows"
+
+# Downloads of a single award's transactions are always small
+SINGLE_AWARD_REQUEST_TYPES = ("idv", "contract", "assistance")
+# Download types of Advanced Search downloads whose filters can be counted like /api/v2/download/count/ does
+ELASTICSEARCH_DOWNLOAD_TYPES = ("elasticsearch_awards", "elasticsearch_transactions")
+
+
+def estimate_download_rows(json_request: dict) -> Optional[int]:
+    """
+    Returns an upper bound of the rows in each file of a download (e.g. the number of transactions matching the
+    filters of an award download is more than the number of matching awards), or None when it isn't known
+    """
+    if json_request.get("request_type") in SINGLE_AWARD_REQUEST_TYPES:
+        return 0
+
+    limit = json_request.get("limit")
+    download_types = json_request.get("download_types") or []
+    if (
+        json_request.get("request_type") == "award"
+        and download_types
+        and all(download_type in ELASTICSEARCH_DOWNLOAD_TYPES for download_type in download_types)
+    ):
+        try:
+            filter_query = QueryWithFilters.generate_transactions_elasticsearch_query(json_request["filters"])
+            count = TransactionSearch().filter(filter_query).handle_count()
+            if count is not None:
+                return min(count, limit) if limit is not None else count
+        except Exception:
+            logger.exception("Unable to count the transactions of a download")
+
+    return limit
+
+
+def is_small_download(estimated_rows: Optional[int]) -> bool:
+    return estimated_rows is not None and estimated_rows <= settings.DOWNLOAD_SMALL_JOB_MAX_ROWS
+
+
+def get_download_queue_name(estimated_rows: Optional[int]) -> str:
+    if settings.BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME and is_small_download(estimated_rows):
+        return settings.BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME
+    return settings.BULK_DOWNLOAD_SQS_QUEUE_NAME
+
+
+def get_estimated_rows_from_message(queue_message) -> Optional[int]:
+    attribute = (queue_message.message_attributes or {}).get(ESTIMATED_ROWS_MESSAGE_ATTRIBUTE)
+    return int(attribute["StringValue"]) if attribute else None
+
+
+def default_large_download_slots(dispatchers: int) -> int:
+    """As many large downloads as the host has the memory for, leaving a core for each dispatcher's own work"""
+    memory_slots = psutil.virtual_memory().total // (settings.DOWNLOAD_LARGE_JOB_MEMORY_MB * 1024 * 1024)
+    cpu_slots = (psutil.cpu_count() or 1) // 2
+    return max(1, min(dispatchers, memory_slots, cpu_slots))
+
+
+class LargeDownloadAdmission:
+    """
+    Admission policy shared by the download dispatcher processes of one host (create it before starting them). A
+    dispatcher must be admitted before polling the queue of downloads that may be large, which requires a free slot
+    and DOWNLOAD_LARGE_JOB_MEMORY_MB of available memory. Once the received download is known to be small, or when it
+    is done, the dispatcher releases its slot.
+
+    Each slot records the pid of the dispatcher holding it, so that the process supervising the dispatchers can
+    release the slot of one that died without releasing it (e.g. when killed for running out of memory).
+    """
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self._holders = mp.Array("i", slots)  # The pid of the dispatcher holding each slot, or 0 when it is free
+
+    def admit(self) -> bool:
+        pid = os.getpid()
+        with self._holders.get_lock():
+            holders = self._holders[:]
+            if pid in holders:
+                return True
+            if 0 not in holders:
+                return False
+            if psutil.virtual_memory().available < settings.DOWNLOAD_LARGE_JOB_MEMORY_MB * 1024 * 1024:
+                return False
+            self._holders[holders.index(0)] = pid
+            return True
+
+    def release(self, pid: Optional[int] = None) -> bool:
+        """Release the slot held by the process with the given pid (this process by default), if it holds one"""
+        pid = pid or os.getpid()
+        with self._holders.get_lock():
+            holders = self._holders[:]
+            if pid not in holders:
+                return False
+            self._holders[holders.index(pid)] = 0
+            return True
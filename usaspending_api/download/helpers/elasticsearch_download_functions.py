@@ -8,10 +8,10 @@ from typing import Union
 
 from django.conf import settings
 from django.db.models import QuerySet
-from elasticsearch_dsl import A
 
 from usaspending_api.awards.models import Award, TransactionNormalized
 from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch, TransactionSearch
+from usaspending_api.common.helpers.sql_helpers import copy_rows_from_iterable, get_connection
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.download.models import DownloadJob
 from usaspending_api.download.models.download_job_lookup import DownloadJobLookup
@@ -19,6 +19,8 @@ from usaspending_api.download.helpers import write_to_download_log as write_to_l
 
 logger = logging.getLogger(__name__)
 
+REPLICATION_CHECK_INTERVAL_SECONDS = 2
+
 
 class _ElasticsearchDownload(metaclass=ABCMeta):
     _source_field = None
@@ -28,69 +30,56 @@ class _ElasticsearchDownload(metaclass=ABCMeta):
     @classmethod
     def _get_download_ids_generator(cls, search: Union[AwardSearch, TransactionSearch], size: int):
         """
-        Takes an AwardSearch or TransactionSearch object (that specifies the index, filter, and source) and returns
-        a generator that yields list of IDs in chunksize SIZE.
+        Takes an AwardSearch or TransactionSearch object (that specifies the index and filter) and returns a generator
+        that yields lists of up to SIZE IDs. The IDs are paged through in order with search_after, so that each page
+        only costs the cluster a sorted search instead of a terms aggregation over every matching document.
         """
         max_retries = 10
-        total = search.handle_count(retries=max_retries)
-        if total is None:
-            logger.error("Error retrieving total results. Max number of attempts reached.")
-            return
-        max_iterations = settings.MAX_DOWNLOAD_LIMIT // size
-        req_iterations = (total // size) + 1
-        num_iterations = min(max(1, req_iterations), max_iterations)
-
-        # Setting the shard_size below works in this case because we are aggregating on a unique field. Otherwise, this
-        # would not work due to the number of records. Other places this is set are in the different spending_by
-        # endpoints which are either routed or contain less than 10k unique values, both allowing for the shard
-        # size to be manually set to 10k.
-        for iteration in range(num_iterations):
-            aggregation = A(
-                "terms",
-                field=cls._source_field,
-                include={"partition": iteration, "num_partitions": num_iterations},
-                size=size,
-                shard_size=size,
-            )
-            search.aggs.bucket("results", aggregation)
-            response = search.handle_execute(retries=max_retries).to_dict()
+        remaining = settings.MAX_DOWNLOAD_LIMIT
+        search = search.source(False).sort(cls._source_field).extra(track_total_hits=False)
+        last_id = None
+        while remaining > 0:
+            page_size = min(size, remaining)
+            page_search = search.extra(size=page_size)
+            if last_id is not None:
+                page_search = page_search.extra(search_after=[last_id])
+            response = page_search.handle_execute(retries=max_retries)
 
             if response is None:
                 raise Exception("Breaking generator, unable to reach cluster")
-            results = []
-            for bucket in response["aggregations"]["results"]["buckets"]:
-                results.append(bucket["key"])
+            results = [hit["sort"][0] for hit in response.to_dict()["hits"]["hits"]]
+            if results:
+                yield results
 
-            yield results
+            if len(results) < page_size:
+                return
+            remaining -= len(results)
+            last_id = results[-1]
 
     @classmethod
     def _populate_download_lookups(cls, filters: dict, download_job: DownloadJob, size: int = 10000) -> None:
         """
-        Takes a dictionary of the different download filters and returns a flattened list of ids.
+        Takes a dictionary of the different download filters and streams the IDs of the matching records into
+        download_job_lookup with COPY, without holding them in memory.
         """
         filter_query = cls._filter_query_func(filters)
-        search = cls._search_type().filter(filter_query).source([cls._source_field])
+        search = cls._search_type().filter(filter_query)
         ids = cls._get_download_ids_generator(search, size)
         lookup_id_type = cls._search_type.type_as_string()
         now = datetime.now(timezone.utc)
-        download_lookup_obj_list = [
-            DownloadJobLookup(
-                created_at=now,
-                download_job_id=download_job.download_job_id,
-                lookup_id=es_id,
-                lookup_id_type=lookup_id_type,
-            )
-            for es_id in itertools.chain.from_iterable(ids)
-        ]
-        write_to_log(
-            message=f"Found {len(download_lookup_obj_list)} {cls._source_field} based on filters",
-            download_job=download_job,
+        rows = (
+            (now, download_job.download_job_id, es_id, lookup_id_type) for es_id in itertools.chain.from_iterable(ids)
         )
 
-        created_obj_list = DownloadJobLookup.objects.bulk_create(download_lookup_obj_list, batch_size=10000)
-        number_of_created_objects = len(created_obj_list)
+        with get_connection(DownloadJobLookup, read_only=False).cursor() as cursor:
+            number_of_created_objects = copy_rows_from_iterable(
+                cursor,
+                DownloadJobLookup._meta.db_table,
+                ["created_at", "download_job_id", "lookup_id", "lookup_id_type"],
+                rows,
+            )
         write_to_log(
-            message=f"Inserted {number_of_created_objects} rows into download_job_lookup",
+            message=f"Inserted {number_of_created_objects} {cls._source_field} based on filters into download_job_lookup",
             download_job=download_job,
         )
 
@@ -105,14 +94,16 @@ class _ElasticsearchDownload(metaclass=ABCMeta):
                 .filter(download_job_id=download_job.download_job_id)
                 .exists()
             )
+            if not is_lookup_replicated:
+                write_to_log(message="Waiting on replication for Download Lookup", download_job=download_job)
             while not is_lookup_replicated and time.time() - wait_start_time < time_to_wait_in_seconds:
-                time.sleep(30)  # Wait 30 seconds before checking again; should catch majority of cases
+                # The check is an index lookup, so check often to start the download as soon as the rows replicate
+                time.sleep(REPLICATION_CHECK_INTERVAL_SECONDS)
                 is_lookup_replicated = (
                     DownloadJobLookup.objects.using(settings.DOWNLOAD_DATABASE_ALIAS)
                     .filter(download_job_id=download_job.download_job_id)
                     .exists()
                 )
-                write_to_log(message=f"Waiting on replication for Download Lookup", download_job=download_job)
 
             if is_lookup_replicated:
                 write_to_log(
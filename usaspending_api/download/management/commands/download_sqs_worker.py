@@ -1,11 +1,16 @@
 import logging
+import multiprocessing as mp
+import os
+import signal
 import time
 import traceback
 from ddtrace import tracer
 from ddtrace.ext import SpanTypes
 from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 
 from usaspending_api.common.sqs.sqs_handler import get_sqs_queue
 from usaspending_api.common.sqs.sqs_work_dispatcher import (
@@ -16,68 +21,202 @@ from usaspending_api.common.sqs.sqs_work_dispatcher import (
 from usaspending_api.common.tracing import DatadogEagerlyDropTraceFilter, SubprocessTrace
 from usaspending_api.download.filestreaming.download_generation import generate_download
 from usaspending_api.common.sqs.sqs_job_logging import log_job_message
+from usaspending_api.download.helpers.admission_helpers import (
+    LargeDownloadAdmission,
+    default_large_download_slots,
+    get_estimated_rows_from_message,
+    is_small_download,
+)
 from usaspending_api.download.helpers.monthly_helpers import download_job_to_log_dict
 from usaspending_api.download.lookups import JOB_STATUS_DICT
 from usaspending_api.download.models.download_job import DownloadJob
 
 logger = logging.getLogger(__name__)
 JOB_TYPE = "USAspendingDownloader"
+ADMISSION_SLEEP_SECONDS = 5
+SUPERVISOR_SLEEP_SECONDS = 5
 
 
 class Command(BaseCommand):
+    help = """
+    Polls the download queue for DownloadJobs and generates them. By default one download is generated at a time.
+    With --dispatchers N, supervises N dispatcher processes that each generate one download at a time: the first
+    --small-job-dispatchers of them poll the queue of small downloads (BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME) and the
+    others poll the main queue, but only while one of the host's --large-job-slots is free and the host has
+    DOWNLOAD_LARGE_JOB_MEMORY_MB of available memory
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dispatchers",
+            type=int,
+            default=1,
+            help="Number of downloads generated at the same time, each by its own dispatcher process",
+        )
+        parser.add_argument(
+            "--small-job-dispatchers",
+            type=int,
+            default=0,
+            help="How many of the dispatchers only poll the queue of small downloads",
+        )
+        parser.add_argument(
+            "--large-job-slots",
+            type=int,
+            help="Maximum number of downloads not known to be small that are generated at the same time. Defaults to"
+            " what the host's cores and memory (DOWNLOAD_LARGE_JOB_MEMORY_MB per download) allow",
+        )
+
     def handle(self, *args, **options):
         # Configure Tracer to drop traces of polls of the queue that have been flagged as uninteresting
         DatadogEagerlyDropTraceFilter.activate()
 
-        queue = get_sqs_queue()
-        log_job_message(logger=logger, message="Starting SQS polling", job_type=JOB_TYPE)
-
-        message_found = None
-        keep_polling = True
-        while keep_polling:
-
-            # Start a Datadog Trace for this poll iter to capture activity in APM
-            with tracer.trace(
-                name=f"job.{JOB_TYPE}", service="bulk-download", resource=queue.url, span_type=SpanTypes.WORKER
-            ) as span:
-                # Set True to add trace to App Analytics:
-                # - https://docs.datadoghq.com/tracing/app_analytics/?tab=python#custom-instrumentation
-                span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, 1.0)
-
-                # Setup dispatcher that coordinates job activity on SQS
-                dispatcher = SQSWorkDispatcher(
-                    queue, worker_process_name=JOB_TYPE, worker_can_start_child_processes=True
-                )
-
-                try:
-
-                    # Check the queue for work and hand it to the given processing function
-                    message_found = dispatcher.dispatch(download_service_app)
-
-                    # Mark the job as failed if: there was an error processing the download; retries after interrupt
-                    # are not allowed; or all retries have been exhausted
-                    # If the job is interrupted by an OS signal, the dispatcher's signal handling logic will log and
-                    # handle this case
-                    # Retries are allowed or denied by the SQS queue's RedrivePolicy config
-                    # That is, if maxReceiveCount > 1 in the policy, then retries are allowed
-                    # - if queue retries are allowed, the queue message will retry to the max allowed by the queue
-                    # - As coded, no cleanup should be needed to retry a download
-                    #   - the psql -o will overwrite the output file
-                    #   - the zip will use 'w' write mode to create from scratch each time
-                    # The worker function controls the maximum allowed runtime of the job
-
-                except (QueueWorkerProcessError, QueueWorkDispatcherError) as exc:
-                    _handle_queue_error(exc)
-
-                if not message_found:
-                    # Flag the the Datadog trace for dropping, since no trace-worthy activity happened on this poll
-                    DatadogEagerlyDropTraceFilter.drop(span)
-
-                    # When you receive an empty response from the queue, wait before trying again
-                    time.sleep(1)
-
-                # If this process is exiting, don't poll for more work
-                keep_polling = not dispatcher.is_exiting
+        if options["dispatchers"] <= 1:
+            poll_queue()
+            return
+
+        small_job_dispatchers = options["small_job_dispatchers"]
+        if not 0 <= small_job_dispatchers < options["dispatchers"]:
+            raise CommandError("--small-job-dispatchers must be less than --dispatchers")
+        if small_job_dispatchers and not settings.BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME:
+            raise CommandError("--small-job-dispatchers requires BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME")
+
+        large_job_dispatchers = options["dispatchers"] - small_job_dispatchers
+        large_job_slots = options["large_job_slots"] or default_large_download_slots(large_job_dispatchers)
+        DispatcherSupervisor(
+            small_job_dispatchers, large_job_dispatchers, LargeDownloadAdmission(large_job_slots)
+        ).run()
+
+
+class DispatcherSupervisor:
+    """Runs, and restarts if they die, the dispatcher processes of this host; forwards exit signals to them"""
+
+    def __init__(self, small_job_dispatchers, large_job_dispatchers, admission):
+        self.lanes = [(settings.BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME, None)] * small_job_dispatchers + [
+            (settings.BULK_DOWNLOAD_SQS_QUEUE_NAME, admission)
+        ] * large_job_dispatchers
+        self.admission = admission
+        self.processes = [None] * len(self.lanes)
+        self.exiting = False
+
+    def run(self):
+        for sig in SQSWorkDispatcher.EXIT_SIGNALS:
+            signal.signal(sig, self._forward_exit_signal)
+        log_job_message(
+            logger=logger,
+            message=f"Supervising {len(self.lanes)} dispatchers with {self.admission.slots} large download slots",
+            job_type=JOB_TYPE,
+        )
+
+        while not self.exiting:
+            self._restart_dead_dispatchers()
+            time.sleep(SUPERVISOR_SLEEP_SECONDS)
+
+        for process in self.processes:
+            if process is not None:
+                process.join()
+
+    def _restart_dead_dispatchers(self):
+        for index, process in enumerate(self.processes):
+            if process is None or not process.is_alive():
+                if process is not None:
+                    log_job_message(
+                        logger=logger,
+                        message=f"Dispatcher {process.name} exited with code {process.exitcode}; restarting it",
+                        job_type=JOB_TYPE,
+                        is_exception=True,
+                    )
+                    # A dispatcher that was killed couldn't release its large download slot
+                    _, admission = self.lanes[index]
+                    if admission and admission.release(process.pid):
+                        log_job_message(
+                            logger=logger,
+                            message=f"Released the large download slot of dispatcher {process.name}",
+                            job_type=JOB_TYPE,
+                        )
+                self.processes[index] = self._start_dispatcher(index)
+
+    def _start_dispatcher(self, index):
+        queue_name, admission = self.lanes[index]
+        # Forked processes must not share the database connections of this process
+        connections.close_all()
+        process = mp.get_context("fork").Process(
+            name=f"{JOB_TYPE}Dispatcher{index}", target=poll_queue, args=(queue_name, admission)
+        )
+        process.start()
+        return process
+
+    def _forward_exit_signal(self, signum, frame):
+        self.exiting = True
+        for process in self.processes:
+            if process is not None and process.is_alive():
+                os.kill(process.pid, signum)
+
+
+def poll_queue(queue_name=None, admission=None):
+    """
+    Poll the queue (BULK_DOWNLOAD_SQS_QUEUE_NAME by default) and generate one download at a time until an exit signal
+    is received. When an admission is given, only poll while admitted by it.
+    """
+    queue = get_sqs_queue(queue_name=queue_name or settings.BULK_DOWNLOAD_SQS_QUEUE_NAME)
+    log_job_message(logger=logger, message="Starting SQS polling", job_type=JOB_TYPE)
+
+    message_found = None
+    keep_polling = True
+    while keep_polling:
+
+        if admission and not admission.admit():
+            time.sleep(ADMISSION_SLEEP_SECONDS)
+            continue
+
+        # Start a Datadog Trace for this poll iter to capture activity in APM
+        with tracer.trace(
+            name=f"job.{JOB_TYPE}", service="bulk-download", resource=queue.url, span_type=SpanTypes.WORKER
+        ) as span:
+            # Set True to add trace to App Analytics:
+            # - https://docs.datadoghq.com/tracing/app_analytics/?tab=python#custom-instrumentation
+            span.set_tag(ANALYTICS_SAMPLE_RATE_KEY, 1.0)
+
+            # Setup dispatcher that coordinates job activity on SQS
+            dispatcher = SQSWorkDispatcher(queue, worker_process_name=JOB_TYPE, worker_can_start_child_processes=True)
+
+            def message_transformer(queue_message):
+                # A download known to be small doesn't need the large download slot this dispatcher was admitted with
+                if admission and is_small_download(get_estimated_rows_from_message(queue_message)):
+                    admission.release()
+                return queue_message.body
+
+            try:
+
+                # Check the queue for work and hand it to the given processing function
+                message_found = dispatcher.dispatch(download_service_app, message_transformer=message_transformer)
+
+                # Mark the job as failed if: there was an error processing the download; retries after interrupt
+                # are not allowed; or all retries have been exhausted
+                # If the job is interrupted by an OS signal, the dispatcher's signal handling logic will log and
+                # handle this case
+                # Retries are allowed or denied by the SQS queue's RedrivePolicy config
+                # That is, if maxReceiveCount > 1 in the policy, then retries are allowed
+                # - if queue retries are allowed, the queue message will retry to the max allowed by the queue
+                # - As coded, no cleanup should be needed to retry a download
+                #   - the psql -o will overwrite the output file
+                #   - the zip will use 'w' write mode to create from scratch each time
+                # The worker function controls the maximum allowed runtime of the job
+
+            except (QueueWorkerProcessError, QueueWorkDispatcherError) as exc:
+                _handle_queue_error(exc)
+            finally:
+                if admission:
+                    admission.release()
+
+            if not message_found:
+                # Flag the the Datadog trace for dropping, since no trace-worthy activity happened on this poll
+                DatadogEagerlyDropTraceFilter.drop(span)
+
+                # When you receive an empty response from the queue, wait before trying again
+                time.sleep(1)
+
+            # If this process is exiting, don't poll for more work
+            keep_polling = not dispatcher.is_exiting
 
 
 def download_service_app(download_job_id):
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('download', '0005_downloadjoblookup'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='downloadjob',
+            name='file_name',
+            field=models.TextField(db_index=True),
+        ),
+        migrations.AddField(
+            model_name='downloadjob',
+            name='json_request_hash',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.RunSQL(
+            sql="UPDATE download_job SET json_request_hash = md5(json_request) WHERE json_request IS NOT NULL;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='downloadjob',
+            index=models.Index(fields=['json_request_hash', 'update_date'], name='download_job_req_hash_idx'),
+        ),
+    ]
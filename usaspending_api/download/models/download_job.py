@@ -1,5 +1,8 @@
+import hashlib
+
 from django.db import models
 from django.utils import timezone
+from typing import Optional
 
 
 class JobStatus(models.Model):
@@ -17,7 +20,7 @@ class JobStatus(models.Model):
 class DownloadJob(models.Model):
     download_job_id = models.AutoField(primary_key=True)
     job_status = models.ForeignKey(JobStatus, models.DO_NOTHING, null=False)
-    file_name = models.TextField(blank=False, null=False)
+    file_name = models.TextField(blank=False, null=False, db_index=True)
     file_size = models.BigIntegerField(blank=True, null=True)
     number_of_rows = models.IntegerField(blank=True, null=True)
     number_of_columns = models.IntegerField(blank=True, null=True)
@@ -26,13 +29,26 @@ class DownloadJob(models.Model):
     update_date = models.DateTimeField(auto_now=True, null=True)
     monthly_download = models.BooleanField(default=False)
     json_request = models.TextField(blank=True, null=True)
+    json_request_hash = models.TextField(blank=True, null=True)
 
     class Meta:
         managed = True
         db_table = "download_job"
+        indexes = [models.Index(fields=["json_request_hash", "update_date"], name="download_job_req_hash_idx")]
+
+    def save(self, *args, **kwargs):
+        self.json_request_hash = hash_json_request(self.json_request)
+        super().save(*args, **kwargs)
 
     def seconds_elapsed(self):
         if self.job_status.name == "running":
             return timezone.now() - self.create_date
         elif self.job_status.name in ("finished", "failed"):
             return self.update_date - self.create_date
+
+
+def hash_json_request(json_request: Optional[str]) -> Optional[str]:
+    """Same as Postgres' md5(json_request), which backfilled the hashes of download jobs created before it existed"""
+    if json_request is None:
+        return None
+    return hashlib.md5(json_request.encode("utf-8")).hexdigest()
@@ -1,6 +1,11 @@
+import csv
+import io
 import json
+import os
 import pytest
 import random
+import re
+import zipfile
 
 from model_mommy import mommy
 from rest_framework import status
@@ -175,6 +180,44 @@ def test_download_awards_with_columns(client, monkeypatch, download_test_data, e
     assert ".zip" in resp.json()["file_url"]
 
 
+@pytest.mark.django_db(transaction=True)
+def test_download_awards_in_parallel(client, monkeypatch, settings, download_test_data, elasticsearch_award_index):
+    # Give the contract and the assistance award a type that is requested, and the IDV one that isn't
+    for award_id, award_type in ((123, "IDV_A"), (456, "A"), (789, "02")):
+        TransactionNormalized.objects.filter(award_id=award_id).update(type=award_type)
+    update_awards()
+    setup_elasticsearch_test(monkeypatch, elasticsearch_award_index)
+    download_generation.retrieve_db_string = Mock(return_value=generate_test_db_connection_string())
+    settings.DOWNLOAD_PARALLEL_WORKERS = 4
+
+    resp = client.post(
+        "/api/v2/download/awards/",
+        content_type="application/json",
+        data=json.dumps({"filters": {"award_type_codes": ["A", "02"]}, "columns": []}),
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert ".zip" in resp.json()["file_url"]
+
+    timestamp = r"\d{4}-\d{2}-\d{2}_H\d{2}M\d{2}S\d{2}"
+    expected_rows = {
+        "Contracts_PrimeAwardSummaries": 1,
+        "Assistance_PrimeAwardSummaries": 1,
+        "Contracts_Subawards": 0,
+        "Assistance_Subawards": 0,
+    }
+    with zipfile.ZipFile(resp.json()["file_url"], "r") as zip_file:
+        assert zip_file.testzip() is None
+        member_names = zip_file.namelist()
+        assert len(member_names) == len(expected_rows)
+        for member_name, (file_name, row_count) in zip(member_names, expected_rows.items()):
+            assert re.fullmatch(f"{file_name}_{timestamp}_1\\.csv", member_name)
+            with zip_file.open(member_name) as member:
+                # Every file starts with a header row
+                assert len(list(csv.reader(io.TextIOWrapper(member, encoding="utf-8")))) == row_count + 1
+    os.remove(resp.json()["file_url"])
+
+
 @pytest.mark.django_db(transaction=True)
 def test_download_awards_bad_filter_type_raises(client, monkeypatch, download_test_data, elasticsearch_award_index):
     setup_elasticsearch_test(monkeypatch, elasticsearch_award_index)
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+from usaspending_api.download.helpers import admission_helpers
+from usaspending_api.download.helpers.admission_helpers import (
+    LargeDownloadAdmission,
+    estimate_download_rows,
+    get_download_queue_name,
+    get_estimated_rows_from_message,
+)
+
+
+def test_estimate_download_rows_without_elasticsearch():
+    assert estimate_download_rows({"request_type": "contract", "award_id": 1}) == 0
+    assert estimate_download_rows({"request_type": "account", "limit": 500}) == 500
+    assert estimate_download_rows({"request_type": "award", "download_types": ["prime_awards"]}) is None
+
+
+def test_estimate_download_rows_counts_elasticsearch_downloads(monkeypatch):
+    monkeypatch.setattr(
+        admission_helpers.QueryWithFilters, "generate_transactions_elasticsearch_query", lambda filters: None
+    )
+    monkeypatch.setattr(
+        admission_helpers,
+        "TransactionSearch",
+        lambda: SimpleNamespace(filter=lambda query: SimpleNamespace(handle_count=lambda: 1234)),
+    )
+    request = {"request_type": "award", "download_types": ["elasticsearch_awards"], "filters": {}}
+    assert estimate_download_rows(request) == 1234
+    assert estimate_download_rows({**request, "limit": 100}) == 100
+
+
+def test_get_download_queue_name(settings):
+    settings.BULK_DOWNLOAD_SQS_QUEUE_NAME = "downloads"
+    settings.BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME = ""
+    settings.DOWNLOAD_SMALL_JOB_MAX_ROWS = 100
+    assert get_download_queue_name(10) == "downloads"
+
+    settings.BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME = "small-downloads"
+    assert get_download_queue_name(10) == "small-downloads"
+    assert get_download_queue_name(100) == "small-downloads"
+    assert get_download_queue_name(101) == "downloads"
+    assert get_download_queue_name(None) == "downloads"
+
+
+def test_get_estimated_rows_from_message():
+    message = SimpleNamespace(message_attributes={"estimated_rows": {"DataType": "Number", "StringValue": "42"}})
+    assert get_estimated_rows_from_message(message) == 42
+    assert get_estimated_rows_from_message(SimpleNamespace(message_attributes=None)) is None
+
+
+def test_large_download_admission_slots(settings, monkeypatch):
+    settings.DOWNLOAD_LARGE_JOB_MEMORY_MB = 0
+    admission = LargeDownloadAdmission(1)
+
+    # Dispatcher processes share the admission's slots
+    monkeypatch.setattr(admission_helpers, "os", SimpleNamespace(getpid=lambda: 101))
+    assert admission.admit()
+    assert admission.admit()  # Admitting again doesn't take another slot
+    monkeypatch.setattr(admission_helpers, "os", SimpleNamespace(getpid=lambda: 102))
+    assert not admission.admit()
+
+    monkeypatch.setattr(admission_helpers, "os", SimpleNamespace(getpid=lambda: 101))
+    assert admission.release()
+    assert not admission.release()  # Releasing again doesn't free another slot
+    monkeypatch.setattr(admission_helpers, "os", SimpleNamespace(getpid=lambda: 102))
+    assert admission.admit()
+
+    # The slot of another process, e.g. a dispatcher that died, can be released by its pid
+    monkeypatch.setattr(admission_helpers, "os", SimpleNamespace(getpid=lambda: 101))
+    assert not admission.admit()
+    assert admission.release(102)
+    assert admission.admit()
+
+
+def test_large_download_admission_requires_memory(settings):
+    settings.DOWNLOAD_LARGE_JOB_MEMORY_MB = 1024**3
+    assert not LargeDownloadAdmission(1).admit()
@@ -3,11 +3,14 @@ import pytest
 
 
 from datetime import datetime, timezone
+from django.db import connection
 from model_mommy import mommy
 from unittest.mock import patch
 
 from usaspending_api.broker.lookups import EXTERNAL_DATA_TYPE_DICT
 from usaspending_api.download.lookups import JOB_STATUS
+from usaspending_api.download.models import DownloadJob
+from usaspending_api.download.models.download_job import hash_json_request
 from usaspending_api.download.v2.base_download_viewset import BaseDownloadViewSet
 
 
@@ -283,3 +286,18 @@ def test_non_elasticsearch_cached_download_not_found(common_test_data):
 
     result = BaseDownloadViewSet._get_cached_download(json.dumps(JSON_REQUEST))
     assert result is None
+
+
+def test_download_job_request_hash_matches_backfill(common_test_data):
+    # Download jobs created before the hash existed were backfilled with Postgres' md5()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT download_job_id, md5(json_request) FROM download_job ORDER BY download_job_id")
+        backfilled_hashes = cursor.fetchall()
+    assert backfilled_hashes == list(
+        DownloadJob.objects.order_by("download_job_id").values_list("download_job_id", "json_request_hash")
+    )
+
+    download_job = DownloadJob.objects.get(download_job_id=1)
+    download_job.json_request = json.dumps({"other_key": "other_value"})
+    download_job.save()
+    assert DownloadJob.objects.filter(json_request_hash=hash_json_request(download_job.json_request)).count() == 1
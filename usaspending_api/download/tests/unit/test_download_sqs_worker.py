@@ -0,0 +1,38 @@
+import multiprocessing as mp
+import os
+import signal
+import time
+
+from usaspending_api.download.helpers.admission_helpers import LargeDownloadAdmission
+from usaspending_api.download.management.commands import download_sqs_worker
+from usaspending_api.download.management.commands.download_sqs_worker import DispatcherSupervisor
+
+
+def test_supervisor_releases_slot_of_killed_dispatcher(settings, monkeypatch):
+    settings.DOWNLOAD_LARGE_JOB_MEMORY_MB = 0
+    # A pipe rather than a queue, whose lock could be left held by the killed dispatcher
+    admitted_pids, admitted_pid_sender = mp.get_context("fork").Pipe(duplex=False)
+
+    def poll_queue(queue_name, admission):
+        while not admission.admit():
+            time.sleep(0.01)
+        admitted_pid_sender.send(os.getpid())
+        time.sleep(60)
+
+    monkeypatch.setattr(download_sqs_worker, "poll_queue", poll_queue)
+    supervisor = DispatcherSupervisor(0, 1, LargeDownloadAdmission(1))
+    try:
+        supervisor._restart_dead_dispatchers()
+        assert admitted_pids.poll(10)
+        os.kill(admitted_pids.recv(), signal.SIGKILL)
+        supervisor.processes[0].join()
+
+        # The restarted dispatcher is admitted with the slot of the killed one
+        supervisor._restart_dead_dispatchers()
+        assert admitted_pids.poll(10)
+        assert admitted_pids.recv() == supervisor.processes[0].pid
+    finally:
+        for process in supervisor.processes:
+            if process is not None:
+                process.kill()
+                process.join()
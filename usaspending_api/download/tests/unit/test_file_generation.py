@@ -1,3 +1,7 @@
+import multiprocessing
+import pytest
+import time
+
 from unittest.mock import MagicMock
 
 from usaspending_api.awards.v2.lookups.lookups import award_type_mapping, contract_type_mapping, idv_type_mapping
@@ -144,3 +148,37 @@ def test_idv_treasury_account_funding_csv_sources():
     VALUE_MAPPINGS["idv_federal_account_funding"]["filter_function"] = original
     assert csv_sources[0].file_type == "treasury_account"
     assert csv_sources[0].source_type == "idv_federal_account_funding"
+
+
+def test_parse_sources_in_parallel_stops_other_exports_on_failure(monkeypatch, tmp_path):
+    sources = [MagicMock(columns=MagicMock(return_value=["id"])) for _ in range(3)]
+    running_processes = []
+    cleanup_calls = []
+
+    def start_source_export(source, source_export, download_job, zip_file_path, file_format, partitions_dir):
+        psql_process = multiprocessing.Process(target=time.sleep, args=(60,))
+        psql_process.start()
+        running_processes.append(psql_process)
+        return psql_process, multiprocessing.Value("q", 0)
+
+    def wait_for_source_export(psql_process, row_count, start_time, download_job):
+        raise Exception("Command failed. Please see the logs for details.")
+
+    def remove_source_export(source_export):
+        cleanup_calls.append([psql_process.exitcode for psql_process in running_processes])
+
+    monkeypatch.setattr(download_generation, "write_to_log", MagicMock())
+    monkeypatch.setattr(download_generation, "prepare_source_export", MagicMock())
+    monkeypatch.setattr(download_generation, "start_source_export", start_source_export)
+    monkeypatch.setattr(download_generation, "wait_for_source_export", wait_for_source_export)
+    monkeypatch.setattr(download_generation, "remove_source_export", remove_source_export)
+
+    with pytest.raises(Exception, match="Command failed"):
+        download_generation.parse_sources_in_parallel(
+            sources, [], MagicMock(), str(tmp_path), None, None, str(tmp_path / "download.zip"), None, "csv", 3
+        )
+
+    # Every export was terminated and joined before the query files were removed
+    assert len(running_processes) == 3
+    assert len(cleanup_calls) == 3
+    assert all(exitcode is not None for exitcode in cleanup_calls[0])
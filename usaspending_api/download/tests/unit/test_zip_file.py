@@ -1,8 +1,16 @@
+import io
 import os
+import pytest
 import zipfile
 
-from tempfile import NamedTemporaryFile
-from usaspending_api.download.filestreaming.zip_file import append_files_to_zip_file
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from usaspending_api.download.filestreaming import zip_file as zip_file_module
+from usaspending_api.download.filestreaming.zip_file import (
+    ParallelZipWriter,
+    append_files_to_zip_file,
+    split_delimited_data_to_files,
+    stream_delimited_data_to_zip_file,
+)
 
 
 def test_append_files_to_zip_file():
@@ -20,3 +28,116 @@ def test_append_files_to_zip_file():
                         os.path.basename(include_file_1.name),
                         os.path.basename(include_file_2.name),
                     ]
+
+
+def test_stream_delimited_data_to_zip_file():
+    data = (
+        b'id,"multi\nline header"\n'
+        b'1,"a value with a\nnewline"\n'
+        b'2,"a value with ""quotes"""\n'
+        b'3,"a value with ""quotes"" and a\n""quoted\nnewline"""\n'
+        b"4,plain\n"
+        b"5,plain\n"
+    )
+    with NamedTemporaryFile() as zip_file:
+        number_of_rows, archive_names = stream_delimited_data_to_zip_file(
+            io.BytesIO(data), zip_file.name, "data_%s.csv", row_limit=2
+        )
+
+        assert number_of_rows == 5
+        assert archive_names == ["data_1.csv", "data_2.csv", "data_3.csv"]
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert [z.filename for z in zf.filelist] == archive_names
+            header = b'id,"multi\nline header"\n'
+            assert zf.read("data_1.csv") == header + b'1,"a value with a\nnewline"\n2,"a value with ""quotes"""\n'
+            assert zf.read("data_2.csv") == (
+                header + b'3,"a value with ""quotes"" and a\n""quoted\nnewline"""\n4,plain\n'
+            )
+            assert zf.read("data_3.csv") == header + b"5,plain\n"
+
+
+def test_stream_delimited_data_to_zip_file_without_rows():
+    with NamedTemporaryFile() as zip_file:
+        number_of_rows, archive_names = stream_delimited_data_to_zip_file(
+            io.BytesIO(b"id,name\n"), zip_file.name, "data_%s.csv", row_limit=2
+        )
+
+        assert number_of_rows == 0
+        with zipfile.ZipFile(zip_file.name, "r") as zf:
+            assert zf.read(archive_names[0]) == b"id,name\n"
+
+
+def test_split_delimited_data_to_files():
+    with TemporaryDirectory() as output_dir:
+        number_of_rows, file_paths = split_delimited_data_to_files(
+            io.BytesIO(b'id,name\n1,"two\nlines"\n2,b\n3,c\n'), output_dir, "data_%s.csv", row_limit=2
+        )
+
+        assert number_of_rows == 3
+        assert file_paths == [os.path.join(output_dir, "data_1.csv"), os.path.join(output_dir, "data_2.csv")]
+        with open(file_paths[0], "rb") as f:
+            assert f.read() == b'id,name\n1,"two\nlines"\n2,b\n'
+        with open(file_paths[1], "rb") as f:
+            assert f.read() == b"id,name\n3,c\n"
+
+
+def write_files(working_dir, file_contents):
+    file_paths = []
+    for file_name, content in file_contents.items():
+        file_paths.append(os.path.join(working_dir, file_name))
+        with open(file_paths[-1], "wb") as f:
+            f.write(content)
+    return file_paths
+
+
+def test_parallel_zip_writer():
+    with TemporaryDirectory() as working_dir:
+        file_contents = {f"data_{i}.csv": f"id\n{i}\n".encode() * 1000 for i in range(1, 6)}
+        file_contents["empty.csv"] = b""
+        file_paths = write_files(working_dir, file_contents)
+
+        zip_file_path = os.path.join(working_dir, "download.zip")
+        with ParallelZipWriter(zip_file_path, max_workers=3) as zip_writer:
+            zip_writer.add_files(file_paths[:2])
+            zip_writer.add_files(file_paths[2:])
+        # The archive can be appended to like any other, as is done for the data dictionary
+        dictionary_path = write_files(working_dir, {"dictionary.txt": b"a dictionary"})[0]
+        append_files_to_zip_file([dictionary_path], zip_file_path)
+
+        with zipfile.ZipFile(zip_file_path, "r") as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == [*file_contents, "dictionary.txt"]
+            assert all(zf.getinfo(name).compress_type == zipfile.ZIP_DEFLATED for name in file_contents)
+            assert {name: zf.read(name) for name in file_contents} == file_contents
+        assert sorted(os.listdir(working_dir)) == sorted([*file_contents, "dictionary.txt", "download.zip"])
+
+
+def test_parallel_zip_writer_zip64(monkeypatch):
+    # Lower the limits so that the ZIP64 records are written without needing files of several GB
+    monkeypatch.setattr(zip_file_module, "ZIP64_LIMIT", 100)
+    monkeypatch.setattr(zip_file_module, "ZIP_FILECOUNT_LIMIT", 2)
+    with TemporaryDirectory() as working_dir:
+        file_contents = {"small.csv": b"id\n1\n", **{f"data_{i}.csv": os.urandom(200) for i in range(1, 4)}}
+        file_paths = write_files(working_dir, file_contents)
+
+        zip_file_path = os.path.join(working_dir, "download.zip")
+        with ParallelZipWriter(zip_file_path, max_workers=2) as zip_writer:
+            zip_writer.add_files(file_paths)
+        append_files_to_zip_file(write_files(working_dir, {"dictionary.txt": b"a dictionary"}), zip_file_path)
+
+        with zipfile.ZipFile(zip_file_path, "r") as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == [*file_contents, "dictionary.txt"]
+            assert {name: zf.read(name) for name in file_contents} == file_contents
+
+
+def test_parallel_zip_writer_removes_temporary_files_on_error():
+    with TemporaryDirectory() as working_dir:
+        file_paths = write_files(working_dir, {f"data_{i}.csv": b"id\n1\n" * 1000 for i in range(1, 4)})
+
+        with pytest.raises(ZeroDivisionError):
+            with ParallelZipWriter(os.path.join(working_dir, "download.zip"), max_workers=2) as zip_writer:
+                zip_writer.add_files(file_paths)
+                1 / 0
+
+        assert sorted(os.listdir(working_dir)) == ["data_1.csv", "data_2.csv", "data_3.csv", "download.zip"]
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional, Type, List
 
 from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import QuerySet, Max
 from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
@@ -19,8 +20,13 @@ from usaspending_api.download.download_utils import create_unique_filename, log_
 from usaspending_api.download.filestreaming import download_generation
 from usaspending_api.download.filestreaming.s3_handler import S3Handler
 from usaspending_api.download.helpers import write_to_download_log as write_to_log
+from usaspending_api.download.helpers.admission_helpers import (
+    ESTIMATED_ROWS_MESSAGE_ATTRIBUTE,
+    estimate_download_rows,
+    get_download_queue_name,
+)
 from usaspending_api.download.lookups import JOB_STATUS_DICT
-from usaspending_api.download.models.download_job import DownloadJob
+from usaspending_api.download.models.download_job import DownloadJob, hash_json_request
 from usaspending_api.download.v2.request_validations import DownloadValidatorBase
 from usaspending_api.submissions.models import DABSSubmissionWindowSchedule
 
@@ -51,20 +57,29 @@ class BaseDownloadViewSet(APIView):
             )
             return self.get_download_response(file_name=filename)
 
-        # Check if the same request has been called today
         ordered_json_request = json.dumps(json_request)
-        cached_download = self._get_cached_download(ordered_json_request, json_request.get("download_types", []))
-
-        if cached_download and not settings.IS_LOCAL:
-            # By returning the cached files, there should be no duplicates on a daily basis
-            write_to_log(message=f"Generating file from cached download job ID: {cached_download['download_job_id']}")
-            cached_filename = cached_download["file_name"]
-            return self.get_download_response(file_name=cached_filename)
-
-        final_output_zip_name = create_unique_filename(json_request, origination=origination)
-        download_job = DownloadJob.objects.create(
-            job_status_id=JOB_STATUS_DICT["ready"], file_name=final_output_zip_name, json_request=ordered_json_request
-        )
+        with transaction.atomic():
+            # Identical requests wait for each other here, so that concurrent ones share the download job created by
+            # the first of them instead of each generating the same files
+            lock_json_request(ordered_json_request)
+
+            # Check if the same request has been called since the data last changed (including jobs still running)
+            cached_download = self._get_cached_download(ordered_json_request, json_request.get("download_types", []))
+
+            if cached_download and not settings.IS_LOCAL:
+                # By returning the cached files, there should be no duplicates on a daily basis
+                write_to_log(
+                    message=f"Generating file from cached download job ID: {cached_download['download_job_id']}"
+                )
+                cached_filename = cached_download["file_name"]
+                return self.get_download_response(file_name=cached_filename)
+
+            final_output_zip_name = create_unique_filename(json_request, origination=origination)
+            download_job = DownloadJob.objects.create(
+                job_status_id=JOB_STATUS_DICT["ready"],
+                file_name=final_output_zip_name,
+                json_request=ordered_json_request,
+            )
 
         log_new_download_job(request, download_job)
         self.process_request(download_job)
@@ -78,11 +93,22 @@ class BaseDownloadViewSet(APIView):
         else:
             # Send a SQS message that will be processed by another server which will eventually run
             # download_generation.generate_download(download_source) (see download_sqs_worker.py)
+            # The estimated size of the download routes it to the queue of small downloads (if there is one) and lets
+            # the download workers admit it without holding capacity reserved for large downloads
+            estimated_rows = estimate_download_rows(json.loads(download_job.json_request))
+            message_attributes = {}
+            if estimated_rows is not None:
+                message_attributes[ESTIMATED_ROWS_MESSAGE_ATTRIBUTE] = {
+                    "DataType": "Number",
+                    "StringValue": str(estimated_rows),
+                }
+            queue_name = get_download_queue_name(estimated_rows)
             write_to_log(
-                message=f"Passing download_job {download_job.download_job_id} to SQS", download_job=download_job
+                message=f"Passing download_job {download_job.download_job_id} to SQS queue {queue_name}",
+                download_job=download_job,
             )
-            queue = get_sqs_queue(queue_name=settings.BULK_DOWNLOAD_SQS_QUEUE_NAME)
-            queue.send_message(MessageBody=str(download_job.download_job_id))
+            queue = get_sqs_queue(queue_name=queue_name)
+            queue.send_message(MessageBody=str(download_job.download_job_id), MessageAttributes=message_attributes)
 
     def get_download_response(self, file_name: str):
         """
@@ -147,6 +173,7 @@ class BaseDownloadViewSet(APIView):
             ).aggregate(Max("submission_reveal_date"))["submission_reveal_date__max"]
             cached_download = (
                 DownloadJob.objects.filter(
+                    json_request_hash=hash_json_request(ordered_json_request),
                     json_request=ordered_json_request,
                     update_date__gte=max(updated_date_timestamp, recent_submission_window_date),
                 )
@@ -158,6 +185,13 @@ class BaseDownloadViewSet(APIView):
         return cached_download
 
 
+def lock_json_request(ordered_json_request: str) -> None:
+    """Hold a lock on the download request until the end of the current transaction"""
+    lock_id = int(hash_json_request(ordered_json_request)[:15], 16)  # Fits in the bigint of Postgres advisory locks
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_id])
+
+
 def get_file_path(file_name: str) -> str:
     if settings.IS_LOCAL:
         file_path = settings.CSV_LOCAL_PATH + file_name
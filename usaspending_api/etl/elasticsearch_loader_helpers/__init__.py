@@ -6,6 +6,8 @@ from usaspending_api.etl.elasticsearch_loader_helpers.delete_data import (
 from usaspending_api.etl.elasticsearch_loader_helpers.extract_data import (
     count_of_records_to_process,
     extract_records,
+    extract_records_streaming,
+    id_quantiles_of_records_to_process,
     obtain_extract_sql,
 )
 from usaspending_api.etl.elasticsearch_loader_helpers.index_config import (
@@ -17,7 +19,7 @@ from usaspending_api.etl.elasticsearch_loader_helpers.index_config import (
     toggle_refresh_on,
     check_new_index_name_is_ok,
 )
-from usaspending_api.etl.elasticsearch_loader_helpers.load_data import load_data
+from usaspending_api.etl.elasticsearch_loader_helpers.load_data import load_data, load_data_streaming
 from usaspending_api.etl.elasticsearch_loader_helpers.transform_data import (
     transform_award_data,
     transform_covid19_faba_data,
@@ -28,6 +30,7 @@ from usaspending_api.etl.elasticsearch_loader_helpers.utilities import (
     execute_sql_statement,
     format_log,
     gen_random_name,
+    prefetch_in_background,
     TaskSpec,
 )
 from usaspending_api.etl.elasticsearch_loader_helpers.controller import Controller
@@ -43,10 +46,14 @@ __all__ = [
     "delete_transactions",
     "execute_sql_statement",
     "extract_records",
+    "extract_records_streaming",
     "format_log",
     "gen_random_name",
+    "id_quantiles_of_records_to_process",
     "load_data",
+    "load_data_streaming",
     "obtain_extract_sql",
+    "prefetch_in_background",
     "set_final_index_config",
     "swap_aliases",
     "take_snapshot",
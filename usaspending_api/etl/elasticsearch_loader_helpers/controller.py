@@ -1,6 +1,8 @@
 import logging
 
+from datetime import datetime, timezone
 from django.core.management import call_command
+from elasticsearch import Elasticsearch
 from math import ceil
 from multiprocessing import Pool, Event, Value
 from time import perf_counter
@@ -14,11 +16,15 @@ from usaspending_api.etl.elasticsearch_loader_helpers import (
     delete_awards,
     delete_transactions,
     extract_records,
+    extract_records_streaming,
     format_log,
     gen_random_name,
+    id_quantiles_of_records_to_process,
     load_data,
+    load_data_streaming,
     obtain_extract_sql,
     set_final_index_config,
+    prefetch_in_background,
     swap_aliases,
     TaskSpec,
     toggle_refresh_on,
@@ -46,6 +52,7 @@ class Controller:
     def __init__(self, config):
         self.config = config
         self.tasks = []
+        self.partition_bounds = []
 
     def prepare_for_etl(self) -> None:
         logger.info(format_log("Assessing data to process"))
@@ -76,8 +83,11 @@ class Controller:
     def dispatch_tasks(self) -> None:
         _abort = Event()  # Event which when set signals an error occurred in a subprocess
         parallel_procs = self.config["processes"]
+        # Density-based partitions are handed out one at a time so that idle processes pick up the next partition as
+        # soon as they finish, instead of map() pre-assigning large runs of partitions to each process
+        chunksize = 1 if self.config.get("partition_strategy") == "density" else None
         with Pool(parallel_procs, maxtasksperchild=1, initializer=init_shared_abort, initargs=(_abort,)) as pool:
-            pool.map(extract_transform_load, self.tasks)
+            pool.map(extract_transform_load, self.tasks, chunksize=chunksize)
 
         msg = f"Total documents indexed: {total_doc_success.value}, total document fails: {total_doc_fail.value}"
         logger.info(format_log(msg))
@@ -103,14 +113,32 @@ class Controller:
                 format_log(f"Storing datetime {self.config['processing_start_datetime']} for next incremental load")
             )
             update_last_load_date(f"{self.config['stored_date_key']}", self.config["processing_start_datetime"])
+        else:
+            # Changes the API data version, since this run doesn't move the date of the next incremental load
+            update_last_load_date("es_full_load", datetime.now(timezone.utc))
 
     def determine_partitions(self) -> int:
+        if self.config.get("partition_strategy") == "density":
+            return self.determine_density_partitions()
+        return self.determine_even_partitions()
+
+    def determine_even_partitions(self) -> int:
         """Simple strategy of partitions that cover the id-range in an even distribution"""
         id_range_item_count = self.max_id - self.min_id + 1  # total number or records if all IDs exist in DB
         if self.config["partition_size"] > id_range_item_count:
             return 1
         return ceil(id_range_item_count / self.config["partition_size"])
 
+    def determine_density_partitions(self) -> int:
+        """
+        Strategy of partitions holding roughly equal numbers of records, regardless of how sparse or dense the IDs
+        are across the id-range. Partition boundaries come from quantiles of the IDs of records to process
+        """
+        quantile_count = max(ceil(self.record_count / self.config["partition_size"]), 1)
+        quantiles = id_quantiles_of_records_to_process(self.config, quantile_count)
+        self.partition_bounds = build_partition_bounds(self.min_id, self.max_id, quantiles)
+        return len(self.partition_bounds)
+
     def construct_tasks(self) -> List[TaskSpec]:
         """Create the Task objects w/ the appropriate configuration"""
         name_gen = gen_random_name()
@@ -122,7 +150,10 @@ class Controller:
         return task_list
 
     def configure_task(self, partition_number: int, name_gen: Generator, is_null_partition: bool = False) -> TaskSpec:
-        lower_bound, upper_bound = self.get_id_range_for_partition(partition_number)
+        if is_null_partition:
+            lower_bound, upper_bound = None, None  # Not used in the SQL of the null partition
+        else:
+            lower_bound, upper_bound = self.get_id_range_for_partition(partition_number)
         sql_config = {**self.config, **{"lower_bound": lower_bound, "upper_bound": upper_bound}}
         sql_str = obtain_extract_sql(sql_config, is_null_partition)
 
@@ -139,9 +170,13 @@ class Controller:
             sql=sql_str,
             transform_func=self.config["data_transform_func"],
             view=self.config["sql_view"],
+            stream_batch_size=self.config.get("stream_batch_size"),
+            pipeline_queue_size=self.config.get("pipeline_queue_size") or 0,
         )
 
     def get_id_range_for_partition(self, partition_number: int) -> Tuple[int, int]:
+        if self.partition_bounds:
+            return self.partition_bounds[partition_number]
         partition_size = self.config["partition_size"]
         lower_bound = self.min_id + (partition_number * partition_size)
         upper_bound = min(lower_bound + partition_size - 1, self.max_id)
@@ -162,6 +197,22 @@ class Controller:
             raise RuntimeError(f"No delete function implemented for type {self.config['data_type']}")
 
 
+def build_partition_bounds(min_id: int, max_id: int, quantiles: List[int]) -> List[Tuple[int, int]]:
+    """
+    Convert ascending ID quantiles into contiguous, non-overlapping (lower_bound, upper_bound) ranges covering
+    min_id..max_id, where each quantile is the inclusive upper bound of a range. Repeated quantiles (a single ID
+    holding many records) and quantiles outside the id-range are collapsed so that no empty ranges are produced
+    """
+    bounds = []
+    lower_bound = min_id
+    for quantile in sorted(set(quantiles)):
+        if lower_bound <= quantile < max_id:
+            bounds.append((lower_bound, quantile))
+            lower_bound = quantile + 1
+    bounds.append((lower_bound, max_id))
+    return bounds
+
+
 def extract_transform_load(task: TaskSpec) -> None:
     if abort.is_set():
         logger.warning(format_log(f"Skipping partition #{task.partition_number} due to previous error", name=task.name))
@@ -173,16 +224,19 @@ def extract_transform_load(task: TaskSpec) -> None:
 
     client = instantiate_elasticsearch_client()
     try:
-        records = task.transform_func(task, extract_records(task))
-        if abort.is_set():
-            f"Prematurely ending partition #{task.partition_number} due to error in another process"
-            logger.warning(format_log(msg, name=task.name))
-            return
-        if len(records) > 0:
-            success, fail = load_data(task, records, client)
+        if task.stream_batch_size:
+            success, fail = stream_transform_load(task, client)
         else:
-            logger.info(format_log("No records to index", name=task.name))
-            success, fail = 0, 0
+            records = task.transform_func(task, extract_records(task))
+            if abort.is_set():
+                msg = f"Prematurely ending partition #{task.partition_number} due to error in another process"
+                logger.warning(format_log(msg, name=task.name))
+                return
+            if len(records) > 0:
+                success, fail = load_data(task, records, client)
+            else:
+                logger.info(format_log("No records to index", name=task.name))
+                success, fail = 0, 0
         with total_doc_success.get_lock():
             total_doc_success.value += success
         with total_doc_fail.get_lock():
@@ -197,3 +251,22 @@ def extract_transform_load(task: TaskSpec) -> None:
     else:
         msg = f"Partition #{task.partition_number} was successfully processed in {perf_counter() - start:.2f}s"
         logger.info(format_log(msg, name=task.name))
+
+
+def stream_transform_load(task: TaskSpec, client: Elasticsearch) -> Tuple[int, int]:
+    """
+    Transform and index each batch of a partition as it is fetched, rather than materializing the partition.
+    When the task has a pipeline queue size, batches are extracted and transformed on a background thread while
+    previously transformed batches are being indexed, so Postgres and Elasticsearch work concurrently.
+    """
+
+    def transformed_batches():
+        for batch in extract_records_streaming(task):
+            if abort.is_set():
+                raise RuntimeError(f"Prematurely ending partition #{task.partition_number} due to error elsewhere")
+            yield task.transform_func(task, batch)
+
+    batches = transformed_batches()
+    if task.pipeline_queue_size:
+        batches = prefetch_in_background(batches, task.pipeline_queue_size)
+    return load_data_streaming(task, batches, client)
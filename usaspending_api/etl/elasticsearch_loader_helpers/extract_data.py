@@ -1,9 +1,14 @@
 import logging
 
 from time import perf_counter
-from typing import List, Tuple
+from typing import Generator, List, Tuple
 
-from usaspending_api.etl.elasticsearch_loader_helpers.utilities import TaskSpec, format_log, execute_sql_statement
+from usaspending_api.etl.elasticsearch_loader_helpers.utilities import (
+    TaskSpec,
+    format_log,
+    execute_sql_statement,
+    execute_sql_statement_streaming,
+)
 
 logger = logging.getLogger("script")
 
@@ -31,6 +36,14 @@ MIN_MAX_COUNT_SQL = """
     "\n", ""
 )
 
+ID_QUANTILES_SQL = """
+    SELECT percentile_disc(ARRAY[{fractions}]) WITHIN GROUP (ORDER BY "{primary_key}") AS quantiles
+    FROM "{sql_view}"
+    {optional_predicate}
+""".replace(
+    "\n", ""
+)
+
 
 def obtain_min_max_count_sql(config: dict) -> str:
     if "optional_predicate" not in config:
@@ -39,6 +52,14 @@ def obtain_min_max_count_sql(config: dict) -> str:
     return sql
 
 
+def obtain_id_quantiles_sql(config: dict, quantile_count: int) -> str:
+    if "optional_predicate" not in config:
+        config["optional_predicate"] = ""
+    fractions = ",".join(str(i / quantile_count) for i in range(1, quantile_count))
+    sql = ID_QUANTILES_SQL.format(**config, fractions=fractions).format(**config)
+    return sql
+
+
 def obtain_extract_sql(config: dict, is_null_partition: bool = False) -> str:
     if not config.get("optional_predicate"):
         config["optional_predicate"] = "WHERE"
@@ -61,6 +82,21 @@ def count_of_records_to_process(config: dict) -> Tuple[int, int, int]:
     return count, min_id, max_id
 
 
+def id_quantiles_of_records_to_process(config: dict, quantile_count: int) -> List[int]:
+    """
+    Return the IDs that divide the records to process into `quantile_count` groups of (roughly) equal row counts.
+    The result holds `quantile_count - 1` ascending, possibly repeated, IDs
+    """
+    if quantile_count < 2:
+        return []
+    start = perf_counter()
+    sql = obtain_id_quantiles_sql(config, quantile_count)
+    quantiles = execute_sql_statement(sql, True, config["verbose"])[0]["quantiles"] or []
+    msg = f"Sampled {len(quantiles):,} ID quantiles, took {perf_counter() - start:.2f}s"
+    logger.info(format_log(msg, action="Extract"))
+    return quantiles
+
+
 def extract_records(task: TaskSpec) -> List[dict]:
     start = perf_counter()
     logger.info(format_log(f"Extracting data from source", name=task.name, action="Extract"))
@@ -74,3 +110,21 @@ def extract_records(task: TaskSpec) -> List[dict]:
     msg = f"{len(records):,} records extracted in {perf_counter() - start:.2f}s"
     logger.info(format_log(msg, name=task.name, action="Extract"))
     return records
+
+
+def extract_records_streaming(task: TaskSpec) -> Generator[List[dict], None, None]:
+    """Yield the partition's records in batches of `task.stream_batch_size` read from a server-side cursor"""
+    start = perf_counter()
+    logger.info(format_log(f"Streaming data from source", name=task.name, action="Extract"))
+
+    record_count = 0
+    try:
+        for batch in execute_sql_statement_streaming(task.sql, task.stream_batch_size):
+            record_count += len(batch)
+            yield batch
+    except Exception as e:
+        logger.exception(f"Failed on partition {task.name} with '{task.sql}'")
+        raise e
+
+    msg = f"{record_count:,} records streamed in {perf_counter() - start:.2f}s"
+    logger.info(format_log(msg, name=task.name, action="Extract"))
@@ -2,7 +2,7 @@ import logging
 
 from elasticsearch import Elasticsearch, helpers
 from time import perf_counter
-from typing import List, Tuple
+from typing import Generator, Iterable, List, Tuple
 
 from usaspending_api.etl.elasticsearch_loader_helpers.delete_data import delete_docs_by_unique_key
 from usaspending_api.etl.elasticsearch_loader_helpers.utilities import TaskSpec, format_log
@@ -40,9 +40,38 @@ def load_data(worker: TaskSpec, records: List[dict], client: Elasticsearch) -> T
     return success, failed
 
 
+def load_data_streaming(worker: TaskSpec, batches: Iterable[List[dict]], client: Elasticsearch) -> Tuple[int, int]:
+    """Index documents as each batch is produced, so only one batch of the partition is held in memory at a time"""
+    start = perf_counter()
+    logger.info(format_log(f"Starting streaming Index operation", name=worker.name, action="Index"))
+    docs = _docs_from_batches(client, batches, worker.index, worker.name, delete_before_index=worker.is_incremental)
+    success, failed = streaming_post_to_es(client, docs, worker.index, worker.name, delete_before_index=False)
+    logger.info(format_log(f"Index operation took {perf_counter() - start:.2f}s", name=worker.name, action="Index"))
+    return success, failed
+
+
+def _docs_from_batches(
+    client: Elasticsearch,
+    batches: Iterable[List[dict]],
+    index_name: str,
+    job_name: str,
+    delete_before_index: bool,
+    delete_key: str = "_id",
+) -> Generator[dict, None, None]:
+    """
+    Flatten batches of documents into a single stream for the bulk helper. When delete_before_index is True, each
+    batch's documents are deleted before any of them are yielded (see streaming_post_to_es for why that is needed)
+    """
+    for batch in batches:
+        if delete_before_index and batch:
+            value_list = [doc[delete_key] for doc in batch]
+            delete_docs_by_unique_key(client, delete_key, value_list, job_name, index_name, refresh_after=False)
+        yield from batch
+
+
 def streaming_post_to_es(
     client: Elasticsearch,
-    chunk: list,
+    chunk: Iterable[dict],
     index_name: str,
     job_name: str = None,
     delete_before_index: bool = True,
@@ -53,7 +82,8 @@ def streaming_post_to_es(
 
     Args:
         client: Elasticsearch client
-        chunk (List[dict]): list of dictionary objects holding field_name:value data
+        chunk (Iterable[dict]): dictionary objects holding field_name:value data. Must be a list when
+            delete_before_index is True; may otherwise be any iterable (e.g. a generator) consumed incrementally
         index_name (str): name of targetted index
         job_name (str): name of ES ETL job being run, used in logging
         delete_before_index (bool): When true, attempts to delete given documents by a unique key before indexing them.
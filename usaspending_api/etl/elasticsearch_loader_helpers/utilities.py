@@ -7,8 +7,11 @@ from dataclasses import dataclass
 from django.conf import settings
 from elasticsearch import Elasticsearch
 from pathlib import Path
+from queue import Full, Queue
 from random import choice
-from typing import Any, Generator, List, Optional
+from threading import Event, Thread
+from typing import Any, Generator, Iterable, List, Optional
+from uuid import uuid4
 
 from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
 
@@ -31,6 +34,8 @@ class TaskSpec:
     is_incremental: bool
     execute_sql_func: callable = None
     transform_func: callable = None
+    stream_batch_size: Optional[int] = None
+    pipeline_queue_size: int = 0
 
 
 def chunks(items: List[Any], size: int) -> List[Any]:
@@ -39,6 +44,68 @@ def chunks(items: List[Any], size: int) -> List[Any]:
         yield items[i : i + size]
 
 
+class _ProducerFailure:
+    """Carries an exception raised on a background producer thread over to the consuming thread"""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+_PRODUCER_DONE = object()
+
+
+def prefetch_in_background(items: Iterable, max_queued: int) -> Generator[Any, None, None]:
+    """
+    Iterate `items` on a background thread, yielding them to the caller in order, with at most `max_queued` items
+    produced ahead of the caller. This lets slow producers (e.g. DB fetches) overlap with slow consumers (e.g. ES bulk
+    indexing) while bounding the memory held between the two stages.
+
+    Exceptions raised while producing are re-raised in the consuming thread. If the caller stops iterating early, the
+    producer is signaled to stop and `items` is closed (when it is a generator) on the producer thread.
+    """
+    queue = Queue(maxsize=max_queued)
+    stop = Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.5)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _produce() -> None:
+        outcome = _PRODUCER_DONE
+        try:
+            try:
+                for item in items:
+                    if not _put(item):
+                        return
+            finally:
+                if hasattr(items, "close"):
+                    items.close()
+        except BaseException as e:
+            # Not only Exceptions (e.g. also SystemExit), since the consumer must always be told the producer ended
+            outcome = _ProducerFailure(e)
+        finally:
+            _put(outcome)
+
+    producer = Thread(target=_produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = queue.get()
+            if item is _PRODUCER_DONE:
+                return
+            if isinstance(item, _ProducerFailure):
+                raise item.exception
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
 def convert_postgres_json_array_to_list(json_array: dict) -> Optional[List]:
     """
     Postgres JSON arrays (jsonb) are stored in CSVs as strings. Since we want to avoid nested types
@@ -68,6 +135,33 @@ def execute_sql_statement(cmd: str, results: bool = False, verbose: bool = False
     return rows
 
 
+def execute_sql_statement_streaming(
+    cmd: str, batch_size: int, verbose: bool = False
+) -> Generator[List[dict], None, None]:
+    """
+    Execute SQL using a named (server-side) cursor on a single-use psycopg2 connection, yielding the results
+    in lists of at most `batch_size` dicts so that the full result set is never held in memory at once
+    """
+    if verbose:
+        print(cmd)
+
+    connection = psycopg2.connect(dsn=get_database_dsn_string())
+    try:
+        # Named cursors must live inside a transaction, so autocommit is left off. The read-only transaction
+        # is rolled back when the connection is closed
+        with connection.cursor(name=f"es_etl_{uuid4().hex}") as cursor:
+            cursor.itersize = batch_size
+            cursor.execute(cmd)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                columns = [col[0] for col in cursor.description]
+                yield [dict(zip(columns, row)) for row in rows]
+    finally:
+        connection.close()
+
+
 def db_rows_to_dict(cursor: psycopg2.extensions.cursor) -> List[dict]:
     """Return a dictionary of all row results from a database connection cursor"""
     columns = [col[0] for col in cursor.description]
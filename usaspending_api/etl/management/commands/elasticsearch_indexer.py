@@ -101,6 +101,30 @@ class Command(BaseCommand):
             default=10000,
             metavar="(default: 10,000)",
         )
+        parser.add_argument(
+            "--partition-strategy",
+            type=str,
+            help="How to split the records into partitions. 'even' splits the ID range into equal-width ranges of"
+            " --partition-size IDs. 'density' samples ID quantiles so each partition holds about --partition-size"
+            " records, and hands partitions out to processes one at a time as they free up",
+            default="even",
+            choices=["even", "density"],
+        )
+        parser.add_argument(
+            "--stream-batch-size",
+            type=int,
+            help="Stream each partition from a server-side cursor, transforming and indexing this many records at a"
+            " time instead of holding the whole partition in memory. Not supported for --load-type=covid19-faba",
+            metavar="",
+        )
+        parser.add_argument(
+            "--pipeline-queue-size",
+            type=int,
+            help="Fetch and transform the next streamed batches on a background thread while the current batch is"
+            " indexed, holding at most this many batches in between. Requires --stream-batch-size",
+            default=0,
+            metavar="",
+        )
         parser.add_argument(
             "--drop-db-view",
             action="store_true",
@@ -158,14 +182,28 @@ def parse_cli_args(options: dict, es_client) -> dict:
         "index_name",
         "load_type",
         "partition_size",
+        "partition_strategy",
         "process_deletes",
         "deletes_only",
         "processes",
         "skip_counts",
         "skip_delete_index",
+        "stream_batch_size",
+        "pipeline_queue_size",
     ]
     config = set_config(passthrough_values, options)
 
+    if config["stream_batch_size"] is not None and config["stream_batch_size"] < 1:
+        raise SystemExit("Fatal error: '--stream-batch-size' must be a positive integer.")
+    elif config["stream_batch_size"] and config["load_type"] == "covid19-faba":
+        # The covid19-faba transform groups rows by award across the entire partition, which batches would break
+        raise SystemExit("Fatal error: '--stream-batch-size' is not supported for '--load-type=covid19-faba'.")
+
+    if config["pipeline_queue_size"] < 0:
+        raise SystemExit("Fatal error: '--pipeline-queue-size' cannot be negative.")
+    elif config["pipeline_queue_size"] and not config["stream_batch_size"]:
+        raise SystemExit("Fatal error: '--pipeline-queue-size' requires '--stream-batch-size'.")
+
     if config["create_new_index"] and not config["index_name"]:
         raise SystemExit("Fatal error: '--create-new-index' requires '--index-name'.")
     elif config["create_new_index"]:
@@ -278,3 +278,4 @@ class Command(BaseCommand):
         logger.info("Updating final_of_fy")
         populate_final_of_fy()
         logger.info(f"Finished updating final_of_fy.")
+        call_command("refresh_disaster_spending_rollup")
@@ -2,6 +2,7 @@ import logging
 import signal
 
 from datetime import datetime
+from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.db import transaction
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
@@ -147,6 +148,7 @@ class Command(load_base.Command):
             start_time = datetime.now()
             populate_final_of_fy()
             logger.info(f"Finished updating final_of_fy, took {datetime.now() - start_time}")
+            call_command("refresh_disaster_spending_rollup")
 
         # Once all the files have been processed, run any global cleanup/post-load tasks.
         # Cleanup not specific to this submission is run in the `.handle` method
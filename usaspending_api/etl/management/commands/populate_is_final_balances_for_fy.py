@@ -1,5 +1,6 @@
 import logging
 
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import connection
 
@@ -56,3 +57,6 @@ class Command(BaseCommand):
 
             # Queries to populate 'is_final_balances_for_fy' field in 'submission_attributes' table
             cursor.execute(POPULATE_FINAL_BALANCES_FOR_FY_SQL)
+
+        # Award outlays of the disaster spending rollup only include final balance submissions
+        call_command("refresh_disaster_spending_rollup")
@@ -0,0 +1,54 @@
+from django.db import models
+from django.utils import timezone
+
+from usaspending_api.common.helpers.sql_helpers import copy_rows_from_iterable, get_connection
+
+
+class BulkCopyManager:
+    """
+    Hide the ugliness of batching saves.  Rows are appended as dictionaries of model field name -> value (as returned
+    by load_data_into_model(..., as_dict=True)) and written with COPY FROM STDIN instead of INSERTs, so no model
+    instances are built.  Fields missing from a row get their model default, like they would with bulk_create.
+    """
+
+    batch_size = 10000
+
+    def __init__(self, model):
+        self.model = model
+        self.connection = get_connection(model, read_only=False)
+        self.fields = [
+            field
+            for field in model._meta.concrete_fields
+            if not (field.primary_key and isinstance(field, models.AutoField))
+        ]
+        self.rows = []
+        self.count = 0
+
+    def append(self, row):
+        self.rows.append(tuple(self._get_db_value(field, row) for field in self.fields))
+        self.count += 1
+        if self.count >= self.batch_size:
+            self._bulk_copy()
+
+    def save_stragglers(self):
+        self._bulk_copy()
+
+    def _get_db_value(self, field, row):
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            value = timezone.now()
+        elif field.name in row:
+            value = row[field.name]
+        else:
+            value = field.get_default()
+        if isinstance(value, models.Model):
+            value = value.pk
+        return field.get_db_prep_save(value, connection=self.connection)
+
+    def _bulk_copy(self):
+        if self.count > 0:
+            with self.connection.cursor() as cursor:
+                copy_rows_from_iterable(
+                    cursor, self.model._meta.db_table, [field.column for field in self.fields], self.rows
+                )
+            self.rows = []
+            self.count = 0
@@ -6,7 +6,7 @@ from collections import defaultdict
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
 from usaspending_api.etl.management.load_base import load_data_into_model
-from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCreateManager
+from usaspending_api.etl.submission_loader_helpers.bulk_copy_manager import BulkCopyManager
 from usaspending_api.etl.submission_loader_helpers.treasury_appropriation_account import (
     bulk_treasury_appropriation_account_tas_lookup,
     get_treasury_appropriation_account_tas_lookup,
@@ -30,7 +30,7 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
     bulk_treasury_appropriation_account_tas_lookup(appropriation_data, db_cursor)
 
     # Create account objects
-    save_manager = BulkCreateManager(AppropriationAccountBalances)
+    save_manager = BulkCopyManager(AppropriationAccountBalances)
     for row in appropriation_data:
 
         # Check and see if there is an entry for this TAS
@@ -43,8 +43,6 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
         # TODO: Figure out how we want to determine what row is overridden by what row
         # If we want to correlate, the following attributes are available in the data broker data that might be useful:
         # appropriation_id, row_number appropriation_balances = something something get appropriation balances...
-        appropriation_balances = AppropriationAccountBalances()
-
         value_map = {
             "treasury_account_identifier": treasury_account,
             "submission": submission_attributes,
@@ -56,7 +54,12 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
 
         save_manager.append(
             load_data_into_model(
-                appropriation_balances, row, field_map=field_map, value_map=value_map, save=False, reverse=reverse
+                AppropriationAccountBalances,
+                row,
+                field_map=field_map,
+                value_map=value_map,
+                as_dict=True,
+                reverse=reverse,
             )
         )
 
@@ -6,7 +6,7 @@ from collections import defaultdict
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
 from usaspending_api.etl.management.load_base import load_data_into_model
-from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCreateManager
+from usaspending_api.etl.submission_loader_helpers.bulk_copy_manager import BulkCopyManager
 from usaspending_api.etl.submission_loader_helpers.disaster_emergency_fund_codes import get_disaster_emergency_fund
 from usaspending_api.etl.submission_loader_helpers.object_class import get_object_class
 from usaspending_api.etl.submission_loader_helpers.program_activities import get_program_activity
@@ -151,7 +151,7 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
     skipped_tas = defaultdict(int)  # tracks count of rows skipped due to "missing" TAS
     bulk_treasury_appropriation_account_tas_lookup(prg_act_obj_cls_data, db_cursor)
 
-    save_manager = BulkCreateManager(FinancialAccountsByProgramActivityObjectClass)
+    save_manager = BulkCopyManager(FinancialAccountsByProgramActivityObjectClass)
     for row in prg_act_obj_cls_data:
         # Check and see if there is an entry for this TAS
         treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(row.get("account_num"))
@@ -164,8 +164,6 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
             treasury_account_identifier=treasury_account, submission_id=submission_attributes.submission_id
         )
 
-        financial_by_prg_act_obj_cls = FinancialAccountsByProgramActivityObjectClass()
-
         value_map = {
             "submission": submission_attributes,
             "reporting_period_start": submission_attributes.reporting_period_start,
@@ -178,7 +176,9 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
         }
 
         save_manager.append(
-            load_data_into_model(financial_by_prg_act_obj_cls, row, value_map=value_map, save=False, reverse=reverse)
+            load_data_into_model(
+                FinancialAccountsByProgramActivityObjectClass, row, value_map=value_map, as_dict=True, reverse=reverse
+            )
         )
 
     save_manager.save_stragglers()
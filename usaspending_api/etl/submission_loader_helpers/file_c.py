@@ -1,22 +1,21 @@
 import logging
-import numpy as np
 import pandas as pd
 import re
 
-from collections import deque, defaultdict
-from datetime import datetime
-from django.db import connections
+from collections import defaultdict
+from datetime import datetime, timezone
+from django.db import connections, models
 from django.utils.functional import cached_property
+from functools import lru_cache
 
 from usaspending_api.awards.models import FinancialAccountsByAwards
-from usaspending_api.common.helpers.dict_helpers import upper_case_dict_values
 from usaspending_api.common.helpers.etl_helpers import update_c_to_d_linkages
+from usaspending_api.common.helpers.sql_helpers import copy_rows_from_iterable, get_connection
+from usaspending_api.common.long_to_terse import LONG_TO_TERSE_LABELS
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
-from usaspending_api.etl.management.load_base import load_data_into_model
-from usaspending_api.etl.submission_loader_helpers.bulk_create_manager import BulkCreateManager
 from usaspending_api.etl.submission_loader_helpers.disaster_emergency_fund_codes import get_disaster_emergency_fund
-from usaspending_api.etl.submission_loader_helpers.object_class import get_object_class_row
-from usaspending_api.etl.submission_loader_helpers.program_activities import get_program_activity
+from usaspending_api.etl.submission_loader_helpers.object_class import get_object_class_ids
+from usaspending_api.etl.submission_loader_helpers.program_activities import get_program_activity_ids
 from usaspending_api.etl.submission_loader_helpers.treasury_appropriation_account import (
     bulk_treasury_appropriation_account_tas_lookup,
     get_treasury_appropriation_account_tas_lookup,
@@ -25,15 +24,18 @@ from usaspending_api.etl.submission_loader_helpers.treasury_appropriation_accoun
 
 logger = logging.getLogger("script")
 
+INTEGER_FIELDS = (models.AutoField, models.IntegerField)
+
 
 class CertifiedAwardFinancialIterator:
+    """Iterates over the certified_award_financial rows of a submission in DataFrames of up to chunk_size rows"""
+
     def __init__(self, submission_attributes, chunk_size):
         self.submission_attributes = submission_attributes
         self.chunk_size = chunk_size
 
         # For managing state.
         self._last_id = None
-        self._current_chunk = None
 
     def _retrieve_and_prepare_next_chunk(self):
         sql = f"""
@@ -47,25 +49,26 @@ class CertifiedAwardFinancialIterator:
         award_financial_frame = pd.read_sql(sql, connections["data_broker"])
 
         if award_financial_frame.size > 0:
-            award_financial_frame["object_class"] = award_financial_frame.apply(get_object_class_row, axis=1)
-            award_financial_frame["program_activity"] = award_financial_frame.apply(
-                get_program_activity, axis=1, submission_attributes=self.submission_attributes
+            award_financial_frame["object_class"] = get_object_class_ids(
+                award_financial_frame["object_class"], award_financial_frame["by_direct_reimbursable_fun"]
+            )
+            award_financial_frame["program_activity"] = get_program_activity_ids(
+                award_financial_frame, self.submission_attributes
             )
-            award_financial_frame = award_financial_frame.replace({np.nan: None})
-
             self._last_id = award_financial_frame["certified_award_financial_id"].max()
-            self._current_chunk = deque(award_financial_frame.to_dict(orient="records"))
+            return award_financial_frame
 
-        else:
-            self._last_id = None
-            self._current_chunk = None
+        self._last_id = None
+        return None
+
+    def __iter__(self):
+        return self
 
     def __next__(self):
-        if not self._current_chunk:
-            self._retrieve_and_prepare_next_chunk()
-            if not self._current_chunk:
-                raise StopIteration
-        return self._current_chunk.popleft()
+        award_financial_frame = self._retrieve_and_prepare_next_chunk()
+        if award_financial_frame is None:
+            raise StopIteration
+        return award_financial_frame
 
 
 class CertifiedAwardFinancial:
@@ -151,39 +154,92 @@ def load_file_c(submission_attributes, db_cursor, certified_award_financial):
 
 
 def _save_file_c_rows(certified_award_financial, total_rows, start_time, skipped_tas, submission_attributes, reverse):
-    save_manager = BulkCreateManager(FinancialAccountsByAwards)
-    for index, row in enumerate(certified_award_financial, 1):
-        if not (index % 1000):
-            logger.info(f"C File Load: Loading row {index:,} of {total_rows:,} ({datetime.now() - start_time})")
+    loaded_rows = 0
+    with get_connection(FinancialAccountsByAwards, read_only=False).cursor() as cursor:
+        for award_financial_frame in certified_award_financial:
+            loaded_rows += len(award_financial_frame)
+            file_c_frame = _build_file_c_frame(award_financial_frame, skipped_tas, submission_attributes, reverse)
+            copy_rows_from_iterable(
+                cursor,
+                FinancialAccountsByAwards._meta.db_table,
+                list(file_c_frame.columns),
+                file_c_frame.itertuples(index=False, name=None),
+            )
+            logger.info(f"C File Load: Loaded row {loaded_rows:,} of {total_rows:,} ({datetime.now() - start_time})")
 
-        upper_case_dict_values(row)
 
-        # Check and see if there is an entry for this TAS
-        treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(row.get("account_num"))
-        if treasury_account is None:
-            skipped_tas[tas_rendering_label] += 1
+def _build_file_c_frame(award_financial_frame, skipped_tas, submission_attributes, reverse):
+    """
+    Column-wise equivalent of loading each broker row with load_data_into_model: returns a DataFrame of the
+    financial_accounts_by_awards rows to insert, with a column per database column. Rows without a treasury account
+    are counted in skipped_tas instead.
+    """
+    # Check and see if there is an entry for each TAS
+    tas_lookup = lru_cache(maxsize=None)(get_treasury_appropriation_account_tas_lookup)
+    account_nums = award_financial_frame["account_num"].astype(object)
+    account_nums = account_nums.where(account_nums.notna(), None)
+    treasury_accounts = account_nums.map(lambda account_num: tas_lookup(account_num)[0])
+    has_treasury_account = treasury_accounts.notna()
+    for tas_rendering_label, count in (
+        account_nums[~has_treasury_account].map(lambda account_num: tas_lookup(account_num)[1]).value_counts().items()
+    ):
+        skipped_tas[tas_rendering_label] += int(count)
+
+    broker_frame = award_financial_frame[has_treasury_account]
+    value_map_faba = {
+        "submission": submission_attributes.submission_id,
+        "reporting_period_start": submission_attributes.reporting_period_start,
+        "reporting_period_end": submission_attributes.reporting_period_end,
+        "treasury_account": treasury_accounts[has_treasury_account].map(lambda treasury_account: treasury_account.pk),
+        "object_class": broker_frame["object_class"],
+        "program_activity": broker_frame["program_activity"],
+        "disaster_emergency_fund": _get_disaster_emergency_fund_codes(broker_frame),
+        "distinct_award_key": _get_distinct_award_keys(broker_frame),
+        "data_source": "DBR",
+        "create_date": datetime.now(timezone.utc),
+        "update_date": datetime.now(timezone.utc),
+    }
+
+    file_c_frame = pd.DataFrame(index=broker_frame.index)
+    for field in FinancialAccountsByAwards._meta.concrete_fields:
+        broker_column = LONG_TO_TERSE_LABELS.get(field.name, field.name)
+        if field.name in value_map_faba:
+            values = value_map_faba[field.name]
+        elif broker_column in broker_frame:
+            values = broker_frame[broker_column]
+        elif field.name in broker_frame:
+            values = broker_frame[field.name]
+        else:
             continue
 
-        award_financial_data = FinancialAccountsByAwards()
-
-        value_map_faba = {
-            "submission": submission_attributes,
-            "reporting_period_start": submission_attributes.reporting_period_start,
-            "reporting_period_end": submission_attributes.reporting_period_end,
-            "treasury_account": treasury_account,
-            "object_class": row.get("object_class"),
-            "program_activity": row.get("program_activity"),
-            "disaster_emergency_fund": get_disaster_emergency_fund(row),
-            "distinct_award_key": create_distinct_award_key(row),
-        }
-
-        save_manager.append(
-            load_data_into_model(award_financial_data, row, value_map=value_map_faba, save=False, reverse=reverse)
-        )
-
-    save_manager.save_stragglers()
-
-
-def create_distinct_award_key(row):
-    parent_award_id = row.get("parent_award_id") or ""
-    return f"{row.get('piid') or ''}|{parent_award_id}|{row.get('fain') or ''}|{row.get('uri') or ''}".upper()
+        if isinstance(field, models.ForeignKey) and isinstance(field.target_field, INTEGER_FIELDS):
+            values = pd.Series(values, index=broker_frame.index).astype("Int64")
+        elif isinstance(field, models.DecimalField):
+            values = pd.to_numeric(values)
+            if reverse.search(field.name):
+                values = -values
+        elif not isinstance(values, pd.Series):
+            pass
+        elif isinstance(field, models.DateField) and not isinstance(field, models.DateTimeField):
+            # Unparsable dates fail the load, as Postgres rejected them when the strings were inserted as is
+            values = pd.to_datetime(values, errors="raise").dt.date
+        elif isinstance(field, models.TextField):
+            values = values.str.upper()
+        file_c_frame[field.column] = values
+
+    return file_c_frame.astype(object).where(file_c_frame.notna(), None)
+
+
+def _get_disaster_emergency_fund_codes(broker_frame):
+    codes = broker_frame["disaster_emergency_fund_code"].str.upper()
+    codes = codes.where(codes.notna() & (codes != ""), None)
+    for code in codes.dropna().unique():
+        get_disaster_emergency_fund({"disaster_emergency_fund_code": code})  # Raises for unknown codes
+    return codes
+
+
+def _get_distinct_award_keys(broker_frame):
+    piid, parent_award_id, fain, uri = (
+        broker_frame[column].fillna("").astype(str) for column in ("piid", "parent_award_id", "fain", "uri")
+    )
+    return (piid + "|" + parent_award_id + "|" + fain + "|" + uri).str.upper()
@@ -1,8 +1,13 @@
+import pandas as pd
+
+from functools import lru_cache
+
 from usaspending_api.common.containers import Bunch
 from usaspending_api.references.models import ObjectClass
 
 
 OBJECT_CLASSES = None
+OBJECT_CLASS_FRAME = None
 
 
 def reset_object_class_cache():
@@ -11,25 +16,23 @@ def reset_object_class_cache():
     for tests.  So, to keep the performance of caching object classes globally but still
     allow tests to function properly, we need a way to reset the object class cache.
     """
-    global OBJECT_CLASSES
+    global OBJECT_CLASSES, OBJECT_CLASS_FRAME
     OBJECT_CLASSES = None
+    OBJECT_CLASS_FRAME = None
 
 
-def get_object_class_row(row):
-    """Lookup an object class record.
-
-    (As ``get_object_class``, but arguments are bunched into a ``row`` object.)
-
-     Args:
-         row.object_class: object class from the broker
-         row.by_direct_reimbursable_fun: direct/reimbursable flag from the broker
-    """
+def _get_object_classes():
     global OBJECT_CLASSES
     if OBJECT_CLASSES is None:
         OBJECT_CLASSES = {(oc.object_class, oc.direct_reimbursable): oc for oc in ObjectClass.objects.all()}
+    return OBJECT_CLASSES
+
+
+def normalize_object_class(object_class):
+    """Converts an object class from the broker to the format of ObjectClass.object_class (e.g. "1010" to "10.1")"""
 
     # Object classes are numeric strings so let's ensure the one we're passed is actually a string before we begin.
-    object_class = str(row.object_class).zfill(3) if type(row.object_class) is int else row.object_class
+    object_class = str(object_class).zfill(3) if type(object_class) is int else object_class
 
     # As per DEV-4030, "000" object class is a special case due to common spreadsheet mangling issues.  If
     # we receive an object class that is all zeroes, convert it to "000".  This also handles the special
@@ -37,9 +40,6 @@ def get_object_class_row(row):
     if object_class is not None and object_class == "0" * len(object_class):
         object_class = "000"
 
-    # Alias this to cut down on line lengths a little below.
-    ocdr = ObjectClass.DIRECT_REIMBURSABLE
-
     if len(object_class) == 4:
         # this is a 4 digit object class, first three digits should be the code and last one's a redundant 0
         if object_class[3] == "0":
@@ -47,21 +47,38 @@ def get_object_class_row(row):
         else:
             raise ValueError(f"Invalid format for object_class={object_class}.")
 
-    # grab direct/reimbursable information from a separate field
+    return f"{object_class[:2]}.{object_class[2:]}"
+
+
+def normalize_direct_reimbursable(by_direct_reimbursable_fun):
+    """Converts a direct/reimbursable flag from the broker to the format of ObjectClass.direct_reimbursable"""
     try:
-        direct_reimbursable = ocdr.BY_DIRECT_REIMBURSABLE_FUN_MAPPING[row.by_direct_reimbursable_fun]
+        return ObjectClass.DIRECT_REIMBURSABLE.BY_DIRECT_REIMBURSABLE_FUN_MAPPING[by_direct_reimbursable_fun]
     except KeyError:
         # So Broker sort of validates this data, but not really.  It warns submitters that their data
         # is bad but doesn't force them to actually fix it.  As such, we are going to just ignore
         # anything we do not recognize.  Terrible solution, but it's what we've been doing to date
         # and I don't have a better one.
-        direct_reimbursable = None
+        return None
+
 
-    object_class = f"{object_class[:2]}.{object_class[2:]}"
+def get_object_class_row(row):
+    """Lookup an object class record.
+
+    (As ``get_object_class``, but arguments are bunched into a ``row`` object.)
+
+     Args:
+         row.object_class: object class from the broker
+         row.by_direct_reimbursable_fun: direct/reimbursable flag from the broker
+    """
+    object_classes = _get_object_classes()
+
+    object_class = normalize_object_class(row.object_class)
+    direct_reimbursable = normalize_direct_reimbursable(row.by_direct_reimbursable_fun)
 
     # This will throw an exception if the object class does not exist which is the new desired behavior.
     try:
-        return OBJECT_CLASSES[(object_class, direct_reimbursable)]
+        return object_classes[(object_class, direct_reimbursable)]
     except KeyError:
         raise ObjectClass.DoesNotExist(
             f"Unable to find object class for object_class={object_class}, direct_reimbursable={direct_reimbursable}."
@@ -77,3 +94,37 @@ def get_object_class(row_object_class, row_direct_reimbursable):
     """
     row = Bunch(object_class=row_object_class, by_direct_reimbursable_fun=row_direct_reimbursable)
     return get_object_class_row(row)
+
+
+def get_object_class_ids(object_classes: pd.Series, by_direct_reimbursable_funs: pd.Series) -> pd.Series:
+    """
+    As ``get_object_class_row``, but for whole columns of broker values at once; returns the ids of the object
+    classes. Each distinct value is normalized once and the object classes are found with a merge.
+    """
+    global OBJECT_CLASS_FRAME
+    if OBJECT_CLASS_FRAME is None:
+        OBJECT_CLASS_FRAME = pd.DataFrame(
+            [(key[0], key[1], oc.id) for key, oc in _get_object_classes().items()],
+            columns=["object_class", "direct_reimbursable", "object_class_id"],
+        )
+
+    keys = pd.DataFrame(
+        {
+            "object_class": object_classes.map(lru_cache(maxsize=None)(normalize_object_class)),
+            "direct_reimbursable": by_direct_reimbursable_funs.map(
+                lru_cache(maxsize=None)(normalize_direct_reimbursable)
+            ),
+        },
+        index=object_classes.index,
+    )
+    merged = keys.merge(OBJECT_CLASS_FRAME, how="left", on=["object_class", "direct_reimbursable"])
+    merged.index = keys.index
+
+    missing = merged[merged["object_class_id"].isna()]
+    if not missing.empty:
+        # This will throw an exception if the object class does not exist which is the desired behavior.
+        raise ObjectClass.DoesNotExist(
+            f"Unable to find object class for object_class={missing['object_class'].iloc[0]},"
+            f" direct_reimbursable={missing['direct_reimbursable'].iloc[0]}."
+        )
+    return merged["object_class_id"].astype(int)
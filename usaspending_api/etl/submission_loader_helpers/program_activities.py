@@ -1,9 +1,20 @@
+import pandas as pd
+
 from django.conf import settings
 from django.db import connection
 from usaspending_api.references.models import RefProgramActivity
 
 
 PROGRAM_ACTIVITIES = {}
+PROGRAM_ACTIVITY_KEY_COLUMNS = [
+    "program_activity_code",
+    "program_activity_name",
+    "budget_year",
+    "agency_identifier",
+    "allocation_transfer_agency",
+    "main_account_code",
+]
+PROGRAM_ACTIVITY_FRAME = pd.DataFrame(columns=PROGRAM_ACTIVITY_KEY_COLUMNS + ["program_activity_id"])
 
 
 def update_program_activities(submission_id):
@@ -13,7 +24,7 @@ def update_program_activities(submission_id):
     the program activities we need for this load.  Because other processes may also be running, we
     have to do this per submission just in case a new program activity is snuck in by another.
     """
-    global PROGRAM_ACTIVITIES
+    global PROGRAM_ACTIVITIES, PROGRAM_ACTIVITY_FRAME
 
     sql = f"""
         insert into ref_program_activity (
@@ -97,6 +108,10 @@ def update_program_activities(submission_id):
         ): pa
         for pa in RefProgramActivity.objects.all()
     }
+    PROGRAM_ACTIVITY_FRAME = pd.DataFrame(
+        [key + (pa.id,) for key, pa in PROGRAM_ACTIVITIES.items()],
+        columns=PROGRAM_ACTIVITY_KEY_COLUMNS + ["program_activity_id"],
+    )
 
     return rowcount
 
@@ -113,3 +128,22 @@ def get_program_activity(row, submission_attributes):
         row["main_account_code"],
     )
     return PROGRAM_ACTIVITIES[key]
+
+
+def get_program_activity_ids(award_financial_frame: pd.DataFrame, submission_attributes) -> pd.Series:
+    """
+    As ``get_program_activity``, but for a whole frame of broker rows at once; returns the ids of the program
+    activities (NaN for rows without a program activity code), found with a merge.
+    """
+    key_columns = [column for column in PROGRAM_ACTIVITY_KEY_COLUMNS if column != "budget_year"]
+    keys = award_financial_frame[key_columns].assign(
+        program_activity_name=award_financial_frame["program_activity_name"].str.upper(),
+        budget_year=str(submission_attributes.reporting_fiscal_year),
+    )
+    merged = keys.merge(PROGRAM_ACTIVITY_FRAME, how="left", on=PROGRAM_ACTIVITY_KEY_COLUMNS)
+    merged.index = keys.index
+
+    missing = merged[merged["program_activity_code"].notna() & merged["program_activity_id"].isna()]
+    if not missing.empty:
+        raise KeyError(tuple(missing[PROGRAM_ACTIVITY_KEY_COLUMNS].iloc[0]))
+    return merged["program_activity_id"].where(merged["program_activity_code"].notna())
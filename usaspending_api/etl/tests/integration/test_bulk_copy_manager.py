@@ -0,0 +1,50 @@
+import pytest
+
+from decimal import Decimal
+from model_mommy import mommy
+
+from usaspending_api.accounts.models import AppropriationAccountBalances
+from usaspending_api.etl.submission_loader_helpers.bulk_copy_manager import BulkCopyManager
+
+REQUIRED_AMOUNT_FIELDS = [
+    "adjustments_to_unobligated_balance_brought_forward_cpe",
+    "budget_authority_appropriated_amount_cpe",
+    "total_budgetary_resources_amount_cpe",
+    "deobligations_recoveries_refunds_by_tas_cpe",
+    "unobligated_balance_cpe",
+    "status_of_budgetary_resources_total_cpe",
+    "obligations_incurred_total_by_tas_cpe",
+]
+
+
+@pytest.mark.django_db
+def test_bulk_copy_manager(monkeypatch):
+    monkeypatch.setattr(BulkCopyManager, "batch_size", 2)
+    treasury_account = mommy.make("accounts.TreasuryAppropriationAccount")
+    submission = mommy.make("submissions.SubmissionAttributes")
+
+    save_manager = BulkCopyManager(AppropriationAccountBalances)
+    for outlay, borrowing_authority in (("1.50", None), ("-2", "3"), ("0", None)):
+        row = {field: 0 for field in REQUIRED_AMOUNT_FIELDS}
+        row.update(
+            {
+                "treasury_account_identifier": treasury_account,
+                "submission": submission,
+                "data_source": "DBR",
+                "gross_outlay_amount_by_tas_cpe": outlay,
+                "borrowing_authority_amount_total_cpe": borrowing_authority,
+            }
+        )
+        save_manager.append(row)
+    assert AppropriationAccountBalances.objects.count() == 2  # The first batch has been written
+    save_manager.save_stragglers()
+
+    balances = AppropriationAccountBalances.objects.order_by("appropriation_account_balances_id")
+    assert [b.gross_outlay_amount_by_tas_cpe for b in balances] == [Decimal("1.50"), Decimal("-2"), Decimal("0")]
+    assert [b.borrowing_authority_amount_total_cpe for b in balances] == [None, Decimal("3"), None]
+    for balance in balances:
+        assert balance.treasury_account_identifier_id == treasury_account.pk
+        assert balance.submission_id == submission.pk
+        assert balance.data_source == "DBR"
+        assert balance.final_of_fy is False  # Model default for a field missing from the row
+        assert balance.create_date is not None and balance.update_date is not None
@@ -127,6 +127,13 @@ def mock_execute_sql(sql, results, verbosity=None):
     return execute_sql_to_ordered_dictionary(sql)
 
 
+def mock_execute_sql_streaming(sql, batch_size, verbose=False):
+    """Streaming counterpart of ``mock_execute_sql``, yielding the results in batches like the server-side cursor"""
+    records = execute_sql_to_ordered_dictionary(sql)
+    for i in range(0, len(records), batch_size):
+        yield records[i : i + batch_size]
+
+
 def test_create_and_load_new_award_index(award_data_fixture, elasticsearch_award_index, monkeypatch):
     """Test the ``elasticsearch_loader`` django management command to create a new awards index and load it
     with data from the DB
@@ -193,6 +200,36 @@ def test_create_and_load_new_transaction_index(award_data_fixture, elasticsearch
     assert es_award_docs == original_db_tx_count
 
 
+def test_create_and_load_new_transaction_index_streaming(
+    award_data_fixture, elasticsearch_transaction_index, monkeypatch
+):
+    """Test that a new transactions index is fully loaded when partitions are streamed in batches smaller than the
+    partition
+    """
+    client = elasticsearch_transaction_index.client  # type: Elasticsearch
+    original_db_tx_count = TransactionNormalized.objects.count()
+
+    elasticsearch_transaction_index.etl_config["create_new_index"] = True
+    elasticsearch_transaction_index.etl_config["stream_batch_size"] = 1
+    es_etl_config = _process_es_etl_test_config(client, elasticsearch_transaction_index)
+    assert es_etl_config["stream_batch_size"] == 1
+
+    # Must use mock sql function to share test DB conn+transaction in ETL code
+    monkeypatch.setattr(
+        "usaspending_api.etl.elasticsearch_loader_helpers.extract_data.execute_sql_statement_streaming",
+        mock_execute_sql_streaming,
+    )
+    es_etl_config["execute_sql_func"] = mock_execute_sql
+    loader = Controller(es_etl_config)
+    loader.prepare_for_etl()
+    assert all(task.stream_batch_size == 1 for task in loader.tasks)
+    loader.dispatch_tasks()
+    set_final_index_config(client, elasticsearch_transaction_index.index_name)
+
+    es_tx_docs = client.count(index=elasticsearch_transaction_index.index_name)["count"]
+    assert es_tx_docs == original_db_tx_count
+
+
 def test_incremental_load_into_award_index(award_data_fixture, elasticsearch_award_index, monkeypatch):
     """Test the ``elasticsearch_loader`` django management command to incrementally load updated data into the awards ES
     index from the DB, overwriting the doc that was already there
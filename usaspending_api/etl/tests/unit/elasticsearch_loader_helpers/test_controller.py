@@ -1,4 +1,8 @@
-from usaspending_api.etl.elasticsearch_loader_helpers import Controller
+import pytest
+
+from datetime import datetime, timezone
+from usaspending_api.etl.elasticsearch_loader_helpers import Controller, controller
+from usaspending_api.etl.elasticsearch_loader_helpers.controller import build_partition_bounds
 from math import ceil
 
 
@@ -200,6 +204,42 @@ def test_get_id_range_for_partition_with_empty_partitions():
     assert _remove_seen_ids(ctrl, record_ids) == set({})
 
 
+def test_build_partition_bounds():
+    assert build_partition_bounds(1, 100, []) == [(1, 100)]
+    assert build_partition_bounds(1, 100, [10, 50]) == [(1, 10), (11, 50), (51, 100)]
+    # Repeated quantiles (many records on one ID) and quantiles at the edges don't produce empty ranges
+    assert build_partition_bounds(1, 100, [10, 10, 10, 100]) == [(1, 10), (11, 100)]
+    assert build_partition_bounds(5, 5, [5, 5]) == [(5, 5)]
+
+
+def test_get_id_range_for_partition_with_density_strategy(monkeypatch):
+    """Dense and sparse stretches of the id-range should end up in partitions holding similar record counts"""
+    record_ids = sorted(list(range(1, 31)) + [500, 1000, 5000, 9000, 10000])
+    partition_size = 5
+    etl_config = {"partition_size": partition_size, "partition_strategy": "density"}
+
+    def mock_id_quantiles(config, quantile_count):
+        return [record_ids[(len(record_ids) * i) // quantile_count - 1] for i in range(1, quantile_count)]
+
+    monkeypatch.setattr(
+        "usaspending_api.etl.elasticsearch_loader_helpers.controller.id_quantiles_of_records_to_process",
+        mock_id_quantiles,
+    )
+    ctrl = Controller(etl_config)
+    ctrl.min_id = record_ids[0]
+    ctrl.max_id = record_ids[-1]
+    ctrl.record_count = len(record_ids)
+    ctrl.config["partitions"] = ctrl.determine_partitions()
+    assert ctrl.config["partitions"] == ceil(len(record_ids) / partition_size)
+
+    for partition_idx in range(ctrl.config["partitions"]):
+        lower_bound, upper_bound = ctrl.get_id_range_for_partition(partition_idx)
+        assert len([i for i in record_ids if lower_bound <= i <= upper_bound]) == partition_size
+    assert ctrl.get_id_range_for_partition(0) == (1, 5)
+    assert ctrl.get_id_range_for_partition(ctrl.config["partitions"] - 1) == (31, 10000)
+    assert _remove_seen_ids(ctrl, set(record_ids)) == set({})
+
+
 def _remove_seen_ids(ctrl, id_set):
     """Iterates through each bounded id-range, and removes IDs seen"""
     partition_range = range(0, ctrl.config["partitions"])
@@ -210,3 +250,30 @@ def _remove_seen_ids(ctrl, id_set):
             if lower_bound <= seen_id <= upper_bound:
                 unseen_ids.remove(seen_id)
     return unseen_ids
+
+
+@pytest.mark.parametrize(
+    "is_incremental_load,expected_key",
+    [(True, "es_awards"), (False, "es_full_load")],
+)
+def test_complete_process_records_load_date(monkeypatch, is_incremental_load, expected_key):
+    recorded = []
+    monkeypatch.setattr(controller, "instantiate_elasticsearch_client", lambda: None)
+    monkeypatch.setattr(controller, "close_all_django_db_conns", lambda: None)
+    monkeypatch.setattr(controller, "toggle_refresh_on", lambda client, index_name: None)
+    monkeypatch.setattr(controller, "update_last_load_date", lambda key, load_date: recorded.append(key))
+
+    processing_start_datetime = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    ctrl = Controller(
+        {
+            "create_new_index": False,
+            "is_incremental_load": is_incremental_load,
+            "index_name": "test-awards",
+            "stored_date_key": "es_awards",
+            "processing_start_datetime": processing_start_datetime,
+        }
+    )
+    ctrl.complete_process()
+
+    # Full loads also record a load date, so responses cached from the previous index aren't served anymore
+    assert recorded == [expected_key]
@@ -1,4 +1,8 @@
-from usaspending_api.etl.elasticsearch_loader_helpers.utilities import is_snapshot_running
+import pytest
+
+from threading import Thread
+
+from usaspending_api.etl.elasticsearch_loader_helpers.utilities import is_snapshot_running, prefetch_in_background
 
 
 def test_is_snapshot_running(monkeypatch):
@@ -34,3 +38,60 @@ def test_is_snapshot_running(monkeypatch):
     index_names = ["2021-02-12-transactions", "2021-02-12-awards"]
     result = is_snapshot_running(mock_client, index_names)
     assert result
+
+
+def test_prefetch_in_background_preserves_order():
+    assert list(prefetch_in_background(iter(range(100)), 3)) == list(range(100))
+    assert list(prefetch_in_background(iter([]), 3)) == []
+
+
+def test_prefetch_in_background_reraises_producer_errors():
+    def failing_producer():
+        yield 1
+        raise ValueError("extract failed")
+
+    results = prefetch_in_background(failing_producer(), 2)
+    assert next(results) == 1
+    with pytest.raises(ValueError, match="extract failed"):
+        next(results)
+
+
+def test_prefetch_in_background_reraises_producer_base_exceptions():
+    def exiting_producer():
+        yield 1
+        raise SystemExit("extract exited")
+
+    consumed = []
+
+    def consume():
+        try:
+            consumed.extend(prefetch_in_background(exiting_producer(), 2))
+        except SystemExit as e:
+            consumed.append(e)
+
+    # Consume on another thread so that the test fails instead of hanging if the consumer is never told
+    consumer = Thread(target=consume, daemon=True)
+    consumer.start()
+    consumer.join(timeout=10)
+    assert not consumer.is_alive()
+    assert consumed[0] == 1
+    assert isinstance(consumed[1], SystemExit)
+
+
+def test_prefetch_in_background_stops_producer_when_consumer_stops():
+    closed = []
+
+    def endless_producer():
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            closed.append(True)
+
+    results = prefetch_in_background(endless_producer(), 2)
+    assert next(results) == 0
+    assert next(results) == 1
+    results.close()
+    assert closed == [True]
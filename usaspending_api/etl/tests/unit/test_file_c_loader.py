@@ -0,0 +1,162 @@
+import pandas as pd
+import pytest
+import re
+
+from collections import defaultdict
+from datetime import date
+
+from usaspending_api.common.containers import Bunch
+from usaspending_api.etl.submission_loader_helpers import (
+    disaster_emergency_fund_codes,
+    file_c,
+    object_class,
+    program_activities,
+    treasury_appropriation_account,
+)
+from usaspending_api.references.models import ObjectClass
+
+
+REVERSE = re.compile(r"(_(cpe|fyb)$)|^transaction_obligated_amount$")
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    monkeypatch.setattr(
+        object_class,
+        "OBJECT_CLASSES",
+        {("10.1", "D"): Bunch(id=5), ("10.1", None): Bunch(id=6), ("00.0", None): Bunch(id=7)},
+    )
+    monkeypatch.setattr(object_class, "OBJECT_CLASS_FRAME", None)
+    monkeypatch.setattr(
+        treasury_appropriation_account,
+        "TREASURY_ACCOUNT_LOOKUP",
+        {1: (Bunch(pk=11), "TAS-1"), 2: (None, "TAS-2"), 3: (None, None)},
+    )
+    monkeypatch.setattr(disaster_emergency_fund_codes, "DISASTER_EMERGENCY_FUND_CODES", {"L": Bunch(code="L")})
+
+
+def test_get_object_class_ids(lookups):
+    object_class_ids = object_class.get_object_class_ids(
+        pd.Series(["1010", "101", "0000", "101"], index=[3, 4, 5, 6]),
+        pd.Series(["D", "x", None, None], index=[3, 4, 5, 6]),
+    )
+    assert object_class_ids.to_dict() == {3: 5, 4: 6, 5: 7, 6: 6}
+
+    with pytest.raises(ObjectClass.DoesNotExist):
+        object_class.get_object_class_ids(pd.Series(["101"]), pd.Series(["R"]))
+
+
+def test_get_program_activity_ids(monkeypatch):
+    monkeypatch.setattr(
+        program_activities,
+        "PROGRAM_ACTIVITY_FRAME",
+        pd.DataFrame(
+            [("0001", "NAME", "2021", "012", None, "1234", 8), ("0002", "NAME", "2021", "012", "097", "1234", 9)],
+            columns=program_activities.PROGRAM_ACTIVITY_KEY_COLUMNS + ["program_activity_id"],
+        ),
+    )
+    award_financial_frame = pd.DataFrame(
+        {
+            "program_activity_code": ["0002", None, "0001"],
+            "program_activity_name": ["name", None, "Name"],
+            "agency_identifier": ["012", "012", "012"],
+            "allocation_transfer_agency": ["097", None, None],
+            "main_account_code": ["1234", "1234", "1234"],
+        }
+    )
+    submission_attributes = Bunch(reporting_fiscal_year=2021)
+
+    program_activity_ids = program_activities.get_program_activity_ids(award_financial_frame, submission_attributes)
+    assert program_activity_ids.tolist()[0::2] == [9, 8]
+    assert pd.isna(program_activity_ids[1])
+
+    with pytest.raises(KeyError):
+        program_activities.get_program_activity_ids(award_financial_frame, Bunch(reporting_fiscal_year=2020))
+
+
+def test_build_file_c_frame(lookups):
+    award_financial_frame = pd.DataFrame(
+        {
+            "account_num": [1, 2, 3, 1],
+            "object_class": [5, 5, 5, 6],
+            "program_activity": [None, None, None, 8.0],
+            "piid": ["piid", "piid", "piid", None],
+            "parent_award_id": ["parent", "parent", "parent", None],
+            "fain": [None, None, None, "fain"],
+            "uri": [None, None, None, "uri"],
+            "disaster_emergency_fund_code": ["l", None, None, ""],
+            "transaction_obligated_amou": [10.5, 1.0, 1.0, None],
+            "gross_outlay_amount_by_awa_cpe": [-2.25, 1.0, 1.0, 0.0],
+        }
+    )
+    submission_attributes = Bunch(
+        submission_id=9, reporting_period_start=date(2021, 1, 1), reporting_period_end=date(2021, 3, 31)
+    )
+    skipped_tas = defaultdict(int)
+
+    file_c_frame = file_c._build_file_c_frame(award_financial_frame, skipped_tas, submission_attributes, REVERSE)
+
+    assert skipped_tas == {"TAS-2": 1, "TAS Account Number (tas_lookup.account_num) '3' not found in Broker": 1}
+    rows = file_c_frame.to_dict(orient="records")
+    assert [
+        (
+            row["submission_id"],
+            row["treasury_account_id"],
+            row["object_class_id"],
+            row["program_activity_id"],
+            row["disaster_emergency_fund_code"],
+            row["distinct_award_key"],
+            row["piid"],
+            row["transaction_obligated_amount"],
+            row["gross_outlay_amount_by_award_cpe"],
+            row["reporting_period_start"],
+            row["data_source"],
+        )
+        for row in rows
+    ] == [
+        (9, 11, 5, None, "L", "PIID|PARENT||", "PIID", -10.5, 2.25, date(2021, 1, 1), "DBR"),
+        (9, 11, 6, 8, None, "||FAIN|URI", None, None, 0.0, date(2021, 1, 1), "DBR"),
+    ]
+
+
+def test_build_file_c_frame_rejects_unknown_disaster_emergency_fund_codes(lookups):
+    award_financial_frame = pd.DataFrame(
+        {
+            "account_num": [1],
+            "object_class": [5],
+            "program_activity": [None],
+            "piid": ["piid"],
+            "parent_award_id": [None],
+            "fain": [None],
+            "uri": [None],
+            "disaster_emergency_fund_code": ["Z"],
+        }
+    )
+    submission_attributes = Bunch(submission_id=9, reporting_period_start=None, reporting_period_end=None)
+
+    with pytest.raises(disaster_emergency_fund_codes.DisasterEmergencyFundCode.DoesNotExist):
+        file_c._build_file_c_frame(award_financial_frame, defaultdict(int), submission_attributes, REVERSE)
+
+
+def test_build_file_c_frame_rejects_unparsable_dates(lookups):
+    award_financial_frame = pd.DataFrame(
+        {
+            "account_num": [1, 1],
+            "object_class": [5, 5],
+            "program_activity": [None, None],
+            "piid": ["piid", "piid"],
+            "parent_award_id": [None, None],
+            "fain": [None, None],
+            "uri": [None, None],
+            "disaster_emergency_fund_code": [None, None],
+            "certified_date": ["2021-02-03", "2021-02-30"],
+        }
+    )
+    submission_attributes = Bunch(submission_id=9, reporting_period_start=None, reporting_period_end=None)
+
+    with pytest.raises(ValueError):
+        file_c._build_file_c_frame(award_financial_frame, defaultdict(int), submission_attributes, REVERSE)
+
+    award_financial_frame["certified_date"] = ["2021-02-03", None]
+    file_c_frame = file_c._build_file_c_frame(award_financial_frame, defaultdict(int), submission_attributes, REVERSE)
+    assert file_c_frame["certified_date"].tolist() == [date(2021, 2, 3), None]
@@ -1,7 +1,7 @@
 import logging
 from psycopg2.extras import DictCursor
 from psycopg2 import Error
-from django.db import connection
+from django.db import connection, transaction
 
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_nonboolean_columns,
@@ -15,6 +15,13 @@ from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
 )
 from usaspending_api.etl.transaction_loaders.data_load_helpers import capitalize_if_string, false_if_null
 from usaspending_api.etl.transaction_loaders.generic_loaders import (
+    bulk_insert_awards,
+    bulk_insert_transaction_normalized,
+    bulk_link_transactions_to_awards,
+    bulk_match_existing_transactions,
+    bulk_update_transaction_normalized,
+    bulk_upsert_transaction_fpds,
+    stage_load_objects,
     update_transaction_fpds,
     update_transaction_normalized,
     insert_transaction_normalized,
@@ -82,11 +89,13 @@ def delete_stale_fpds(detached_award_procurement_ids):
         return awards_touched
 
 
-def load_fpds_transactions(chunk):
+def load_fpds_transactions(chunk, batched=False):
     """
     Run transaction load for the provided ids. This will create any new rows in other tables to support the transaction
     data, but does NOT update "secondary" award values like total obligations or C -> D linkages.
 
+    When batched, the whole chunk is written with set-based statements instead of one transaction at a time.
+
     returns ids for each award touched
     """
     with Timer() as timer:
@@ -96,7 +105,7 @@ def load_fpds_transactions(chunk):
             if broker_transactions:
                 load_objects = _transform_objects(broker_transactions)
 
-                retval = _load_transactions(load_objects)
+                retval = _load_transactions_batched(load_objects) if batched else _load_transactions(load_objects)
     logger.info("batch completed in {}".format(timer.as_string(timer.elapsed)))
     return retval
 
@@ -194,6 +203,56 @@ def _load_transactions(load_objects):
     return list(ids_of_awards_created_or_updated)
 
 
+def _load_transactions_batched(load_objects):
+    """
+    Set-based version of _load_transactions: stages the chunk into temporary tables with COPY and writes each table
+    with one statement.  If anything in the chunk fails, it is rolled back and loaded one transaction at a time so the
+    failing Broker ids can be singled out.
+
+    returns ids for each award touched
+    """
+    # Later Broker rows for the same transaction win, just like they would when loaded one at a time
+    unique_load_objects = list(
+        {
+            load_object["transaction_fpds"]["detached_award_proc_unique"]: load_object for load_object in load_objects
+        }.values()
+    )
+
+    connection.ensure_connection()
+    try:
+        with transaction.atomic(), connection.connection.cursor() as cursor:
+            award_table, award_columns = stage_load_objects(cursor, unique_load_objects, "award", "awards")
+            transaction_normalized_table, transaction_normalized_columns = stage_load_objects(
+                cursor, unique_load_objects, "transaction_normalized", "transaction_normalized", ["award_id", "id"]
+            )
+            transaction_fpds_table, transaction_fpds_columns = stage_load_objects(
+                cursor, unique_load_objects, "transaction_fpds", "transaction_fpds", ["transaction_id"]
+            )
+
+            awards_created = bulk_insert_awards(cursor, award_table, award_columns)
+            award_ids = bulk_link_transactions_to_awards(cursor, transaction_normalized_table, award_table)
+
+            bulk_match_existing_transactions(cursor, transaction_fpds_table, transaction_normalized_table)
+            transactions_updated = bulk_update_transaction_normalized(
+                cursor, transaction_normalized_table, transaction_normalized_columns
+            )
+            transactions_created = bulk_insert_transaction_normalized(
+                cursor, transaction_normalized_table, transaction_normalized_columns
+            )
+            bulk_upsert_transaction_fpds(
+                cursor, transaction_fpds_table, transaction_normalized_table, transaction_fpds_columns
+            )
+    except Error as e:
+        logger.warning(f"Batched load failed, loading the batch one transaction at a time.\nDetails: {e.pgerror}")
+        return _load_transactions(load_objects)
+
+    logger.debug(
+        f"{awards_created:,} awards created, {transactions_created:,} transactions created and "
+        f"{transactions_updated:,} transactions updated"
+    )
+    return list(award_ids)
+
+
 def _matching_award(cursor, load_object):
     """ Try to find an award for this transaction to belong to by unique_award_key"""
     find_matching_award_sql = "select id from awards where generated_unique_award_id = '{}'".format(
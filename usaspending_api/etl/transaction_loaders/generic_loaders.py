@@ -1,3 +1,6 @@
+from psycopg2.sql import Identifier, SQL
+
+from usaspending_api.common.helpers.sql_helpers import copy_rows_from_iterable
 from usaspending_api.etl.transaction_loaders.data_load_helpers import format_insert_or_update_column_sql
 
 
@@ -39,3 +42,162 @@ def insert_transaction_fpds(cursor, load_object):
     cursor.execute(transaction_fpds_sql)
     created_transaction_fpds = cursor.fetchall()
     return created_transaction_fpds
+
+
+# Set-based counterparts of the functions above. The load objects of a whole chunk are staged into temporary tables
+# with COPY (one per load object type, joined back together by load_order) and each destination table is then written
+# by a single statement.
+UNUPDATED_COLUMNS = ["create_date", "created_at"]
+
+
+def stage_load_objects(cursor, load_objects, type, table, extra_columns=()):
+    """
+    COPY the `type` part of every load object into a temporary table with the column types of `table`, plus a
+    load_order column holding the position of the load object.  Returns the temporary table name and its columns.
+    """
+    temp_table = f"temp_{type}_load"
+    columns = list(load_objects[0][type].keys())
+    columns.extend(column for column in extra_columns if column not in columns)
+
+    cursor.execute(SQL("DROP TABLE IF EXISTS {}").format(Identifier(temp_table)))
+    cursor.execute(
+        SQL(
+            "CREATE TEMPORARY TABLE {} ON COMMIT DROP AS SELECT {}, NULL::INTEGER AS load_order FROM {} WITH NO DATA"
+        ).format(Identifier(temp_table), _column_list(columns), Identifier(table))
+    )
+    copy_rows_from_iterable(
+        cursor,
+        temp_table,
+        columns + ["load_order"],
+        ([load_object[type].get(column) for column in columns] + [i] for i, load_object in enumerate(load_objects)),
+    )
+    cursor.execute(SQL("ANALYZE {}").format(Identifier(temp_table)))
+    return temp_table, columns
+
+
+def bulk_insert_awards(cursor, award_table, award_columns):
+    """Create the awards that don't exist yet, from the first staged transaction of each unique award key"""
+    cursor.execute(
+        SQL(
+            "INSERT INTO awards ({columns}) "
+            "SELECT DISTINCT ON (s.generated_unique_award_id) {staged_columns} FROM {award_table} AS s "
+            "WHERE NOT EXISTS (SELECT 1 FROM awards AS a WHERE a.generated_unique_award_id = s.generated_unique_award_id) "
+            "ORDER BY s.generated_unique_award_id, s.load_order"
+        ).format(
+            columns=_column_list(award_columns),
+            staged_columns=_column_list(award_columns, "s"),
+            award_table=Identifier(award_table),
+        )
+    )
+    return cursor.rowcount
+
+
+def bulk_link_transactions_to_awards(cursor, transaction_normalized_table, award_table):
+    """Set award_id on the staged transaction_normalized rows and return the ids of all awards they belong to"""
+    cursor.execute(
+        SQL(
+            "UPDATE {transaction_normalized_table} AS t SET award_id = a.id "
+            "FROM {award_table} AS s "
+            "INNER JOIN ("
+            "    SELECT DISTINCT ON (generated_unique_award_id) generated_unique_award_id, id FROM awards "
+            "    WHERE generated_unique_award_id IN (SELECT generated_unique_award_id FROM {award_table}) "
+            "    ORDER BY generated_unique_award_id, id"
+            ") AS a ON a.generated_unique_award_id = s.generated_unique_award_id "
+            "WHERE s.load_order = t.load_order "
+            "RETURNING a.id"
+        ).format(
+            transaction_normalized_table=Identifier(transaction_normalized_table), award_table=Identifier(award_table)
+        )
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def bulk_match_existing_transactions(cursor, transaction_fpds_table, transaction_normalized_table):
+    """Set the primary key of the staged rows of transactions that already exist"""
+    cursor.execute(
+        SQL(
+            "UPDATE {transaction_fpds_table} AS s SET transaction_id = f.transaction_id "
+            "FROM transaction_fpds AS f WHERE f.detached_award_proc_unique = s.detached_award_proc_unique"
+        ).format(transaction_fpds_table=Identifier(transaction_fpds_table))
+    )
+    cursor.execute(
+        SQL(
+            "UPDATE {transaction_normalized_table} AS t SET id = s.transaction_id "
+            "FROM {transaction_fpds_table} AS s WHERE s.load_order = t.load_order AND s.transaction_id IS NOT NULL"
+        ).format(
+            transaction_normalized_table=Identifier(transaction_normalized_table),
+            transaction_fpds_table=Identifier(transaction_fpds_table),
+        )
+    )
+
+
+def bulk_update_transaction_normalized(cursor, transaction_normalized_table, transaction_normalized_columns):
+    """Update the existing transaction_normalized rows from their staged rows"""
+    cursor.execute(
+        SQL(
+            "UPDATE transaction_normalized AS tn SET {pairs} FROM {transaction_normalized_table} AS t WHERE tn.id = t.id"
+        ).format(
+            pairs=_update_pairs(transaction_normalized_columns, "t", ["id"]),
+            transaction_normalized_table=Identifier(transaction_normalized_table),
+        )
+    )
+    return cursor.rowcount
+
+
+def bulk_insert_transaction_normalized(cursor, transaction_normalized_table, transaction_normalized_columns):
+    """
+    Insert the staged transaction_normalized rows that didn't match an existing transaction.  Their ids are drawn from
+    the sequence up front and kept in the staged rows so the transaction_fpds rows can point to them.
+    """
+    cursor.execute(
+        SQL(
+            "WITH new_transactions AS ("
+            "    UPDATE {transaction_normalized_table} "
+            "    SET id = nextval(pg_get_serial_sequence('transaction_normalized', 'id')) "
+            "    WHERE id IS NULL RETURNING {columns}"
+            ") "
+            "INSERT INTO transaction_normalized ({columns}) SELECT {columns} FROM new_transactions"
+        ).format(
+            transaction_normalized_table=Identifier(transaction_normalized_table),
+            columns=_column_list(transaction_normalized_columns),
+        )
+    )
+    return cursor.rowcount
+
+
+def bulk_upsert_transaction_fpds(
+    cursor, transaction_fpds_table, transaction_normalized_table, transaction_fpds_columns
+):
+    """Insert or update transaction_fpds from the staged rows, pointing new rows to their transaction_normalized row"""
+    cursor.execute(
+        SQL(
+            "UPDATE {transaction_fpds_table} AS s SET transaction_id = t.id "
+            "FROM {transaction_normalized_table} AS t WHERE t.load_order = s.load_order AND s.transaction_id IS NULL"
+        ).format(
+            transaction_fpds_table=Identifier(transaction_fpds_table),
+            transaction_normalized_table=Identifier(transaction_normalized_table),
+        )
+    )
+    cursor.execute(
+        SQL(
+            "INSERT INTO transaction_fpds ({columns}) SELECT {columns} FROM {transaction_fpds_table} "
+            "ON CONFLICT (detached_award_proc_unique) DO UPDATE SET {pairs}"
+        ).format(
+            columns=_column_list(transaction_fpds_columns),
+            transaction_fpds_table=Identifier(transaction_fpds_table),
+            pairs=_update_pairs(transaction_fpds_columns, "excluded", ["transaction_id"]),
+        )
+    )
+    return cursor.rowcount
+
+
+def _column_list(columns, alias=None):
+    return SQL(", ").join(Identifier(alias, column) if alias else Identifier(column) for column in columns)
+
+
+def _update_pairs(columns, alias, key_columns):
+    return SQL(", ").join(
+        SQL("{} = {}").format(Identifier(column), Identifier(alias, column))
+        for column in columns
+        if column not in UNUPDATED_COLUMNS + key_columns
+    )
@@ -0,0 +1,135 @@
+import logging
+import multiprocessing as mp
+import queue
+import zlib
+
+from django.db import connection, connections
+
+from usaspending_api.etl.transaction_loaders import fpds_loader
+from usaspending_api.etl.transaction_loaders.fpds_loader import load_fpds_transactions
+
+
+logger = logging.getLogger("script")
+
+QUEUE_TIMEOUT_SECONDS = 5
+
+
+def get_award_keys(id_list):
+    """Returns (detached_award_procurement_id, unique award key) of the source transactions that exist"""
+    with connection.cursor() as cursor:
+        # Award keys are capitalized on load, so keys differing only by case belong to the same award
+        cursor.execute(
+            "SELECT detached_award_procurement_id, UPPER(unique_award_key) FROM source_procurement_transaction "
+            "WHERE detached_award_procurement_id IN %s",
+            [tuple(id_list)],
+        )
+        return cursor.fetchall()
+
+
+def get_award_partition(award_key, partitions):
+    """Stable (across processes and runs) partition of an award key"""
+    return zlib.crc32((award_key or "").encode("utf-8")) % partitions
+
+
+class ParallelFPDSLoader:
+    """
+    Loads FPDS transactions with load_fpds_transactions in several worker processes.  Transactions are partitioned
+    by award key and each partition is always loaded by the same worker, in chunks of chunk_size ids, so the
+    transactions of an award are never loaded concurrently (which could, among other things, create the same award
+    twice).  Use add() for each chunk of detached_award_procurement_ids, then finish() to wait for the workers and get
+    the ids of the awards they touched.  Broker ids that failed to load are added to fpds_loader.failed_ids.
+    """
+
+    def __init__(self, processes, chunk_size, batched=False):
+        self.chunk_size = chunk_size
+        self.pending_ids = [[] for _ in range(processes)]
+        self.result_queue = mp.get_context("fork").Queue()
+        self.id_queues = [mp.get_context("fork").Queue(maxsize=2) for _ in range(processes)]
+
+        # Forked processes must not share the database connections of this process
+        connections.close_all()
+        self.workers = [
+            mp.get_context("fork").Process(
+                name=f"FPDSLoader{worker_number}",
+                target=_load_partition,
+                args=(worker_number, id_queue, self.result_queue, batched),
+                daemon=True,  # Don't outlive this process if it fails
+            )
+            for worker_number, id_queue in enumerate(self.id_queues)
+        ]
+        for worker in self.workers:
+            worker.start()
+        logger.info(f"Started {processes} FPDS loader processes")
+
+    def add(self, id_list):
+        """Queue the transactions of id_list to be loaded, each by the worker of its award's partition"""
+        if not id_list:
+            return
+        for detached_award_procurement_id, award_key in get_award_keys(id_list):
+            self.pending_ids[get_award_partition(award_key, len(self.workers))].append(detached_award_procurement_id)
+
+        for worker_number, pending_ids in enumerate(self.pending_ids):
+            if len(pending_ids) >= self.chunk_size:
+                self._send(worker_number, pending_ids)
+                self.pending_ids[worker_number] = []
+
+    def finish(self):
+        """Wait for all queued transactions to be loaded; returns the ids of the awards touched"""
+        for worker_number, pending_ids in enumerate(self.pending_ids):
+            if pending_ids:
+                self._send(worker_number, pending_ids)
+            self._send(worker_number, None)
+        self.pending_ids = [[] for _ in self.workers]
+
+        award_ids = []
+        for _ in self.workers:
+            worker_award_ids, worker_failed_ids = self._receive()
+            award_ids.extend(worker_award_ids)
+            fpds_loader.failed_ids.extend(worker_failed_ids)
+        for worker in self.workers:
+            worker.join()
+        return award_ids
+
+    def _send(self, worker_number, id_list):
+        while True:
+            self._check_workers()
+            try:
+                self.id_queues[worker_number].put(id_list, timeout=QUEUE_TIMEOUT_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _receive(self):
+        while True:
+            try:
+                return self.result_queue.get(timeout=QUEUE_TIMEOUT_SECONDS)
+            except queue.Empty:
+                self._check_workers()
+
+    def _check_workers(self):
+        failed_workers = [worker for worker in self.workers if worker.exitcode not in (None, 0)]
+        if failed_workers:
+            for worker in self.workers:
+                if worker.is_alive():
+                    worker.terminate()
+            raise RuntimeError(
+                ", ".join(f"{worker.name} exited with code {worker.exitcode}" for worker in failed_workers)
+            )
+
+
+def _load_partition(worker_number, id_queue, result_queue, batched):
+    """Worker process: load the chunks of id_queue until None is received, then report the awards touched"""
+    award_ids = set()
+    first_failed_id = len(fpds_loader.failed_ids)
+    transactions_loaded = 0
+    while True:
+        id_list = id_queue.get()
+        if id_list is None:
+            break
+        award_ids.update(load_fpds_transactions(id_list, batched))
+        transactions_loaded += len(id_list)
+        logger.info(
+            f"FPDS loader {worker_number}: {transactions_loaded:,} transactions loaded, {len(award_ids):,} awards touched"
+        )
+    result_queue.put((list(award_ids), fpds_loader.failed_ids[first_failed_id:]))
+    connections.close_all()
@@ -119,6 +119,36 @@ def test_load_source_procurement_by_ids():
     assert transactions_by_id[301].fiscal_year == 2011
 
 
+@pytest.mark.django_db
+def test_batched_load_source_procurement_by_ids():
+    source_procurement_id_list = [101, 201, 301]
+    _assemble_source_procurement_records(source_procurement_id_list)
+
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, "--batched")
+
+    usaspending_transactions = TransactionFPDS.objects.all()
+    assert sorted(_.detached_award_procurement_id for _ in usaspending_transactions) == [101, 201, 301]
+    assert sorted(_.transaction.transaction_unique_id for _ in usaspending_transactions) == ["101", "201", "301"]
+
+    # All 3 are under the single award created from the first transaction processed
+    new_award = Award.objects.get()
+    assert new_award.transaction_unique_id == "101"
+    assert {_.transaction.award_id for _ in usaspending_transactions} == {new_award.id}
+    assert new_award.latest_transaction.transaction_unique_id == "301"
+    assert new_award.earliest_transaction.transaction_unique_id == "101"
+    assert sorted(_.transaction.fiscal_year for _ in usaspending_transactions) == [2010, 2010, 2011]
+
+    # Reloading updates the existing transactions in place
+    transaction_ids = sorted(_.transaction_id for _ in usaspending_transactions)
+    SourceProcurementTransaction.objects.filter(detached_award_procurement_id=201).update(piid="updated piid")
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, "--batched")
+
+    assert sorted(TransactionFPDS.objects.values_list("transaction_id", flat=True)) == transaction_ids
+    assert TransactionNormalized.objects.count() == 3
+    assert Award.objects.get() == new_award
+    assert TransactionFPDS.objects.get(detached_award_procurement_id=201).piid == "UPDATED PIID"
+
+
 @pytest.mark.django_db(transaction=True)
 def test_delete_fpds_success(monkeypatch):
     # Award/Transaction deleted based on 1-1 transaction
@@ -0,0 +1,46 @@
+import pytest
+
+from usaspending_api.etl.transaction_loaders import fpds_loader, parallel_fpds_loader
+from usaspending_api.etl.transaction_loaders.parallel_fpds_loader import ParallelFPDSLoader, get_award_partition
+
+AWARD_KEYS = {i: f"CONT_AWD_{i % 7}" for i in range(1, 101)}
+
+
+def mock_load_fpds_transactions(id_list, batched):
+    # Each worker only ever gets transactions of the awards of its partition
+    assert len({get_award_partition(AWARD_KEYS[i], 3) for i in id_list}) == 1
+    if 13 in id_list:
+        fpds_loader.failed_ids.append(13)
+    return [AWARD_KEYS[i] for i in id_list]
+
+
+@pytest.fixture
+def mock_loader(monkeypatch):
+    monkeypatch.setattr(fpds_loader, "failed_ids", [])
+    monkeypatch.setattr(parallel_fpds_loader, "get_award_keys", lambda id_list: [(i, AWARD_KEYS[i]) for i in id_list])
+    monkeypatch.setattr(parallel_fpds_loader, "load_fpds_transactions", mock_load_fpds_transactions)
+
+
+def test_get_award_partition():
+    assert get_award_partition("CONT_AWD_1", 4) == get_award_partition("CONT_AWD_1", 4)
+    assert {get_award_partition(key, 4) for key in AWARD_KEYS.values()} == {0, 1, 2, 3}
+    assert 0 <= get_award_partition(None, 4) < 4
+
+
+def test_parallel_fpds_loader(mock_loader):
+    loader = ParallelFPDSLoader(3, chunk_size=10)
+    for start in range(1, 101, 25):
+        loader.add(list(range(start, start + 25)))
+    award_ids = loader.finish()
+
+    # Each award is touched by a single worker, so it is only reported once
+    assert sorted(award_ids) == sorted(set(AWARD_KEYS.values()))
+    assert fpds_loader.failed_ids == [13]
+
+
+def test_parallel_fpds_loader_worker_failure(mock_loader, monkeypatch):
+    monkeypatch.setattr(parallel_fpds_loader, "load_fpds_transactions", lambda id_list, batched: 1 / 0)
+    loader = ParallelFPDSLoader(2, chunk_size=10)
+    with pytest.raises(RuntimeError, match="exited with code 1"):
+        loader.add(list(range(1, 101)))
+        loader.finish()
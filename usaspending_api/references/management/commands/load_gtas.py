@@ -1,8 +1,11 @@
 import logging
 
+from datetime import datetime, timezone
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import connections, transaction
 
+from usaspending_api.broker.helpers.last_load_date import update_last_load_date
 from usaspending_api.common.etl.postgres import mixins
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
 from usaspending_api.references.models import GTASSF133Balances
@@ -46,7 +49,12 @@ class Command(mixins.ETLMixin, BaseCommand):
 
     def handle(self, *args, **options):
         logger.info("Starting ETL script")
+        processing_start_datetime = datetime.now(timezone.utc)
         self.process_data()
+        # Refresh the rollup before recording the load, so responses cached under the new API data version can't be
+        # built from the previous rollup
+        call_command("refresh_disaster_spending_rollup")
+        update_last_load_date("gtas", processing_start_datetime)
         logger.info("GTAS ETL finished successfully!")
 
     @transaction.atomic()
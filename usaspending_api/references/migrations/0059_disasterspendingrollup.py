@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('references', '0058_bureautitlelookup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DisasterSpendingRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('def_code', models.TextField()),
+                ('fiscal_year', models.IntegerField()),
+                ('fiscal_period', models.IntegerField()),
+                ('is_quarter', models.BooleanField()),
+                ('total_budget_authority', models.DecimalField(decimal_places=2, max_digits=23, null=True)),
+                ('total_obligations', models.DecimalField(decimal_places=2, max_digits=23, null=True)),
+                ('total_outlays', models.DecimalField(decimal_places=2, max_digits=23, null=True)),
+                ('award_obligations', models.DecimalField(decimal_places=2, default=0, max_digits=23)),
+                ('award_outlays', models.DecimalField(decimal_places=2, default=0, max_digits=23)),
+                ('non_zero_file_b_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'disaster_spending_rollup',
+                'managed': True,
+                'unique_together': {('def_code', 'fiscal_year', 'fiscal_period', 'is_quarter')},
+            },
+        ),
+    ]
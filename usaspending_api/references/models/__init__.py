@@ -5,6 +5,7 @@ from usaspending_api.references.models.cgac import CGAC
 from usaspending_api.references.models.city_county_state_code import CityCountyStateCode
 from usaspending_api.references.models.definition import Definition
 from usaspending_api.references.models.disaster_emergency_fund_code import DisasterEmergencyFundCode
+from usaspending_api.references.models.disaster_spending_rollup import DisasterSpendingRollup
 from usaspending_api.references.models.filter_hash import FilterHash
 from usaspending_api.references.models.frec import FREC
 from usaspending_api.references.models.frec_map import FrecMap
@@ -31,6 +32,7 @@ __all__ = [
     "CityCountyStateCode",
     "Definition",
     "DisasterEmergencyFundCode",
+    "DisasterSpendingRollup",
     "FilterHash",
     "FREC",
     "FrecMap",
@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class DisasterSpendingRollup(models.Model):
+    """
+    Disaster spending totals of each DEFC and period, maintained by the refresh_disaster_spending_rollup command so
+    the disaster overview and count endpoints don't aggregate GTAS and File B/C rows on every request.
+
+    GTAS columns are NULL for periods without GTAS data.  Award obligations and the File B count only include
+    submissions from the start of DEFC reporting (FY2020 P07) and award outlays only include submissions that are
+    final balances for their fiscal year; the endpoints select the revealed periods to sum.
+    """
+
+    def_code = models.TextField()
+    fiscal_year = models.IntegerField()
+    fiscal_period = models.IntegerField()
+    is_quarter = models.BooleanField()
+    total_budget_authority = models.DecimalField(max_digits=23, decimal_places=2, null=True)
+    total_obligations = models.DecimalField(max_digits=23, decimal_places=2, null=True)
+    total_outlays = models.DecimalField(max_digits=23, decimal_places=2, null=True)
+    award_obligations = models.DecimalField(max_digits=23, decimal_places=2, default=0)
+    award_outlays = models.DecimalField(max_digits=23, decimal_places=2, default=0)
+    non_zero_file_b_count = models.IntegerField(default=0)
+
+    class Meta:
+        managed = True
+        db_table = "disaster_spending_rollup"
+        unique_together = ("def_code", "fiscal_year", "fiscal_period", "is_quarter")
@@ -27,7 +27,7 @@ def swap_keys(dictionary_):
 
 
 def format_for_frontend(response):
-    """ calls reverse key from TRANSACTIONS_LOOKUP """
+    """calls reverse key from TRANSACTIONS_LOOKUP"""
     response = [result["_source"] for result in response]
     return [swap_keys(result) for result in response]
 
@@ -206,9 +206,21 @@ def _get_number_of_unique_terms(search, field: str) -> int:
           11k to ensure that endpoints using Elasticsearch do not cross the 10k threshold. Elasticsearch endpoints
           should be implemented with a safeguard in case this count is above 10k.
     """
+    response = add_unique_terms_count_aggregation(search, field).handle_execute()
+    return get_unique_terms_count_from_response(response)
+
+
+def add_unique_terms_count_aggregation(search, field: str):
+    """
+    Adds the aggregation used by the get_number_of_unique_terms_* functions to the search, for cases where the count
+    is fetched alongside other searches (see BatchedSearches). Read the result with get_unique_terms_count_from_response
+    """
     cardinality_aggregation = A("cardinality", field=field, precision_threshold=11000)
     search.aggs.metric("field_count", cardinality_aggregation)
-    response = search.handle_execute()
+    return search
+
+
+def get_unique_terms_count_from_response(response) -> int:
     response_dict = response.aggs.to_dict()
     return response_dict.get("field_count", {"value": 0})["value"]
 
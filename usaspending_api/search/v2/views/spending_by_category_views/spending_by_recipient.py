@@ -1,14 +1,12 @@
 import json
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
-from django.db.models import QuerySet, F, Case, When, Value, IntegerField
+from django.db.models import QuerySet, F
 from django.utils.decorators import method_decorator
 
 from usaspending_api.common.api_versioning import deprecated
-from usaspending_api.common.recipient_lookups import combine_recipient_hash_and_level
-from usaspending_api.recipient.models import RecipientProfile
-from usaspending_api.recipient.v2.lookups import SPECIAL_CASES
+from usaspending_api.common.recipient_lookups import bulk_obtain_recipient_ids
 from usaspending_api.search.v2.views.spending_by_category_views.spending_by_category import (
     Category,
     AbstractSpendingByCategoryViewSet,
@@ -24,42 +22,25 @@ class RecipientViewSet(AbstractSpendingByCategoryViewSet):
     category = Category(name="recipient", agg_key="recipient_agg_key")
 
     @staticmethod
-    def _get_recipient_id(row: list) -> str:
+    def _get_recipient_ids(rows: List[dict]) -> List[Optional[str]]:
         """
-        In the recipient_profile table there is a 1 to 1 relationship between hashes and DUNS
-        (recipient_unique_id) and the hashes+duns match exactly between recipient_profile and
-        recipient_lookup where there are matches.  Grab the level from recipient_profile by
-        hash if we have one or by DUNS if we have one of those.
+        Grab the recipient id of each row from recipient_profile in one query, by hash if the rows have
+        one or by DUNS if they have one of those.
         """
-        if "recipient_hash" in row:
-            profile_filter = {"recipient_hash": row["recipient_hash"]}
-        elif "recipient_unique_id" in row:
-            profile_filter = {"recipient_unique_id": row["recipient_unique_id"]}
+        if not rows:
+            return []
+        if "recipient_hash" in rows[0]:
+            field_name = "recipient_hash"
+        elif "recipient_unique_id" in rows[0]:
+            field_name = "recipient_unique_id"
         else:
             raise RuntimeError(
                 "Attempted to lookup recipient profile using a queryset that contains neither "
                 "'recipient_hash' nor 'recipient_unique_id'"
             )
 
-        profile = (
-            RecipientProfile.objects.filter(**profile_filter)
-            .exclude(recipient_name__in=SPECIAL_CASES)
-            .annotate(
-                sort_order=Case(
-                    When(recipient_level="C", then=Value(0)),
-                    When(recipient_level="R", then=Value(1)),
-                    default=Value(2),
-                    output_field=IntegerField(),
-                )
-            )
-            .values("recipient_hash", "recipient_level")
-            .order_by("sort_order")
-            .first()
-        )
-
-        return (
-            combine_recipient_hash_and_level(profile["recipient_hash"], profile["recipient_level"]) if profile else None
-        )
+        recipient_ids = bulk_obtain_recipient_ids(field_name, (row[field_name] for row in rows))
+        return [recipient_ids.get(str(row[field_name])) if row[field_name] is not None else None for row in rows]
 
     def build_elasticsearch_result(self, response: dict) -> List[dict]:
 
@@ -88,8 +69,8 @@ class RecipientViewSet(AbstractSpendingByCategoryViewSet):
         upper_limit = self.pagination.upper_limit
         query_results = list(queryset[lower_limit:upper_limit])
 
-        for row in query_results:
-            row["recipient_id"] = self._get_recipient_id(row)
+        for row, recipient_id in zip(query_results, self._get_recipient_ids(query_results)):
+            row["recipient_id"] = recipient_id
 
             for key in django_values:
                 del row[key]
@@ -30,6 +30,10 @@ CONNECTION_MAX_SECONDS = 10
 # MAX_CONNECTIONS in this case refers to those serving downloads
 DOWNLOAD_DB_WORK_MEM_IN_MB = os.environ.get("DOWNLOAD_DB_WORK_MEM_IN_MB", 128)
 
+# Number of sources (e.g. prime awards and subawards) a download job exports with psql at the same time, and of
+# partitions it compresses at the same time. With 1, each source's rows are streamed directly into the zip file
+DOWNLOAD_PARALLEL_WORKERS = int(os.environ.get("DOWNLOAD_PARALLEL_WORKERS", 1))
+
 API_MAX_DATE = "2024-09-30"  # End of FY2024
 API_MIN_DATE = "2000-10-01"  # Beginning of FY2001
 API_SEARCH_MIN_DATE = "2007-10-01"  # Beginning of FY2008
@@ -68,6 +72,12 @@ BULK_DOWNLOAD_LOCAL_PATH = str(REPO_DIR / "bulk_downloads") + "/"
 BULK_DOWNLOAD_S3_BUCKET_NAME = ""
 BULK_DOWNLOAD_S3_REDIRECT_DIR = "generated_downloads"
 BULK_DOWNLOAD_SQS_QUEUE_NAME = ""
+# Optional queue for downloads estimated to have at most DOWNLOAD_SMALL_JOB_MAX_ROWS rows, so that they aren't stuck
+# behind large downloads. When empty, all downloads are sent to BULK_DOWNLOAD_SQS_QUEUE_NAME
+BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME = os.environ.get("BULK_DOWNLOAD_SMALL_JOB_SQS_QUEUE_NAME", "")
+DOWNLOAD_SMALL_JOB_MAX_ROWS = int(os.environ.get("DOWNLOAD_SMALL_JOB_MAX_ROWS", 100000))
+# Memory a download_sqs_worker host must have available before it starts a download that isn't known to be small
+DOWNLOAD_LARGE_JOB_MEMORY_MB = int(os.environ.get("DOWNLOAD_LARGE_JOB_MEMORY_MB", 4096))
 MONTHLY_DOWNLOAD_S3_BUCKET_NAME = ""
 MONTHLY_DOWNLOAD_S3_REDIRECT_DIR = "award_data_archive"
 BROKER_AGENCY_BUCKET_NAME = ""
@@ -139,6 +149,12 @@ ES_TRANSACTIONS_NAME_SUFFIX = "transactions"
 ES_TRANSACTIONS_QUERY_ALIAS_PREFIX = "transaction-query"
 ES_TRANSACTIONS_WRITE_ALIAS = "transaction-load-alias"
 ES_TIMEOUT = 90
+# Connection pool of the process-wide Elasticsearch client shared by the API search wrappers and ETL scripts
+ES_CONNECTIONS_PER_NODE = int(os.environ.get("ES_CONNECTIONS_PER_NODE", 10))
+# Sniffing discovers cluster nodes and spreads connections across them. Leave off when ES_HOSTNAME is a load balancer
+# or a managed endpoint that doesn't expose node addresses (e.g. AWS Elasticsearch Service)
+ES_SNIFF = os.environ.get("ES_SNIFF", "").lower() in ["true", "1", "yes"]
+ES_SNIFFER_TIMEOUT = int(os.environ.get("ES_SNIFFER_TIMEOUT", 60))
 ES_REPOSITORY = ""
 ES_ROUTING_FIELD = "recipient_agg_key"
 
@@ -333,6 +349,12 @@ REST_FRAMEWORK = {
     # or allow read-only access for unauthenticated users.
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
     "DEFAULT_PAGINATION_CLASS": "usaspending_api.common.pagination.UsaspendingPagination",
+    # JSON bodies are parsed once per request, and shared with code inspecting them before DRF does
+    "DEFAULT_PARSER_CLASSES": (
+        "usaspending_api.common.parsers.SharedPayloadJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_RENDERER_CLASSES": (
         "rest_framework.renderers.JSONRenderer",
         "usaspending_api.common.renderers.DocumentAPIRenderer",
@@ -445,6 +467,19 @@ CACHE_ENVIRONMENTS = {
 # Set the usaspending-cache to whatever our environment cache dictates
 CACHES["usaspending-cache"] = CACHE_ENVIRONMENTS[CACHE_ENVIRONMENT]
 
+# In-process LRU tier of rendered API responses, checked before the usaspending-cache. Bounded by the total bytes of
+# the cached response bodies and headers held by each process. Set the size to 0 to disable it. It is always disabled
+# when the usaspending-cache is disabled
+LOCAL_RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("LOCAL_RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+LOCAL_RESPONSE_CACHE_TIMEOUT = int(os.environ.get("LOCAL_RESPONSE_CACHE_TIMEOUT", 300))
+
+# Identical concurrent cache misses are coalesced: one worker computes the response while holding a lock in the
+# cache backend (expiring after RESPONSE_CACHE_LOCK_TIMEOUT seconds) and the others poll for its result for up to
+# RESPONSE_CACHE_LOCK_WAIT seconds before computing it themselves
+RESPONSE_CACHE_LOCK_TIMEOUT = int(os.environ.get("RESPONSE_CACHE_LOCK_TIMEOUT", 120))
+RESPONSE_CACHE_LOCK_WAIT = float(os.environ.get("RESPONSE_CACHE_LOCK_WAIT", 60))
+RESPONSE_CACHE_LOCK_POLL_INTERVAL = float(os.environ.get("RESPONSE_CACHE_LOCK_POLL_INTERVAL", 0.1))
+
 # DRF extensions
 REST_FRAMEWORK_EXTENSIONS = {
     # Not caching errors, these are logged to exceptions.log
@@ -452,8 +487,18 @@ REST_FRAMEWORK_EXTENSIONS = {
     # Default cache is usaspending-cache, which is set above based upon environment
     "DEFAULT_USE_CACHE": "usaspending-cache",
     "DEFAULT_CACHE_KEY_FUNC": "usaspending_api.common.cache.usaspending_key_func",
+    # Cache keys include the API data version (see usaspending_api.common.cache.get_api_data_version), so responses
+    # don't need to expire to pick up new data. The timeout only bounds how long unused entries are kept
+    "DEFAULT_CACHE_RESPONSE_TIMEOUT": int(os.environ.get("API_RESPONSE_CACHE_TIMEOUT", 7 * 24 * 60 * 60)),
 }
 
+# How often (in seconds) each process re-checks the API data version used in response cache keys
+API_DATA_VERSION_CHECK_INTERVAL = int(os.environ.get("API_DATA_VERSION_CHECK_INTERVAL", 60))
+
+# Maximum age (in seconds) of the reference data lookups (e.g. closed submission periods, DEF Codes) cached by each
+# process with reference_data_cache. They are also recomputed as soon as the API data version changes
+REFERENCE_DATA_CACHE_TIMEOUT = int(os.environ.get("REFERENCE_DATA_CACHE_TIMEOUT", 300))
+
 # Django spaghetti-and-meatballs (entity relationship diagram) settings
 SPAGHETTI_SAUCE = {
     "apps": ["accounts", "awards", "financial_activities", "references", "submissions", "recipient"],
@@ -3,6 +3,7 @@ import signal
 from datetime import datetime, timezone
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from usaspending_api.submissions.models import SubmissionAttributes
@@ -62,4 +63,7 @@ class Command(BaseCommand):
 
         statistics = "\n\t".join([f"{m} ({x['name']}): {x['count']:,}" for m, x in models.items()])
         logger.info(f"Deleted Broker submission ID {submission_id}:\n\t{statistics}")
+
+        # Remove the submission's File B and C totals from the rollup (and change the API data version) in this transaction
+        call_command("refresh_disaster_spending_rollup")
         logger.info("Finished deletions by rm_submissions")
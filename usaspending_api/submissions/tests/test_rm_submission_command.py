@@ -7,6 +7,7 @@ from django.db.models import Q
 from usaspending_api.awards.models import FinancialAccountsByAwards
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
+from usaspending_api.references.models import DisasterSpendingRollup
 
 SUBMISSION_MODELS = [
     AppropriationAccountBalances,
@@ -67,6 +68,32 @@ def test_rm_submission(client, submission_data):
     verify_zero_count(SUBMISSION_MODELS, 456)
 
 
+@pytest.mark.django_db
+def test_rm_submission_refreshes_disaster_spending_rollup():
+    defc = mommy.make("references.DisasterEmergencyFundCode", code="L")
+    for submission_id, obligation in ((123, 100), (456, 20)):
+        submission = mommy.make(
+            "submissions.SubmissionAttributes",
+            submission_id=submission_id,
+            reporting_fiscal_year=2020,
+            reporting_fiscal_period=8,
+            quarter_format_flag=False,
+            reporting_period_start="2020-05-01",
+        )
+        mommy.make(
+            "awards.FinancialAccountsByAwards",
+            submission=submission,
+            disaster_emergency_fund=defc,
+            transaction_obligated_amount=obligation,
+        )
+    call_command("refresh_disaster_spending_rollup")
+    assert DisasterSpendingRollup.objects.get(def_code="L").award_obligations == 120
+
+    call_command("rm_submission", 123)
+
+    assert DisasterSpendingRollup.objects.get(def_code="L").award_obligations == 20
+
+
 def verify_zero_count(models, submission_id, field="submission", eq_zero=True):
     q_kwargs = {}
     q_kwargs[field + "__submission_id"] = submission_id